@@ -10,6 +10,9 @@ from src.config import database_settings
 from src.models.base import Base
 from src.models.application import ApplicationModel
 from src.models.application_document import ApplicationDocumentModel
+from src.models.application_leave_time import ApplicationLeaveTimeModel
+from src.models.resident_directory import ResidentDirectoryModel
+from src.models.approved_leave_roster import ApprovedLeaveRosterModel
 
 config = context.config
 if config.config_file_name is not None:
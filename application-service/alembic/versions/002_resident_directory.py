@@ -0,0 +1,50 @@
+"""Local resident directory projection for entrance/room filtering and enrichment
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rows are filled by the resident directory refresh job (backfill of existing
+    # applicants on first run) and written through on CreateApplication.
+    op.create_table(
+        "resident_directory",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("building", sa.String(length=10), nullable=False),
+        sa.Column("entrance", sa.Integer(), nullable=False),
+        sa.Column("room", sa.String(length=10), nullable=False),
+        sa.Column("full_name", sa.String(length=300), nullable=False),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index(
+        "ix_resident_directory_entrance_room",
+        "resident_directory",
+        ["entrance", "room"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_resident_directory_refreshed_at",
+        "resident_directory",
+        ["refreshed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_resident_directory_refreshed_at", table_name="resident_directory")
+    op.drop_index("ix_resident_directory_entrance_room", table_name="resident_directory")
+    op.drop_table("resident_directory")
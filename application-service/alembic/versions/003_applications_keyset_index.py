@@ -0,0 +1,30 @@
+"""Index backing keyset pagination of ListApplications on (created_at, id)
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves both ORDER BY created_at DESC, id DESC and the (created_at, id) < (...) seek
+    # predicate, so a cursor page reads only `size + 1` index entries.
+    op.create_index(
+        "ix_applications_created_at_id",
+        "applications",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_applications_created_at_id", table_name="applications")
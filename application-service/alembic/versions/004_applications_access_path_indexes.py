@@ -0,0 +1,53 @@
+"""Composite and partial indexes for the list and approved-leaves queries
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Student list: WHERE user_id = ? ORDER BY created_at DESC, id DESC.
+    op.create_index(
+        "ix_applications_user_id_created_at",
+        "applications",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    # Status filter with a leave_time range; GetApprovedLeaves (status = 'approved', one day).
+    op.create_index(
+        "ix_applications_status_leave_time",
+        "applications",
+        ["status", "leave_time"],
+        unique=False,
+    )
+    # Educator queue: WHERE status = 'pending' ORDER BY created_at DESC. Pending rows are a
+    # small, hot fraction of the table, so the partial index stays small.
+    op.create_index(
+        "ix_applications_pending_created_at",
+        "applications",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    # Left prefixes of the composites above.
+    op.drop_index("ix_applications_user_id", table_name="applications")
+    op.drop_index("ix_applications_status", table_name="applications")
+
+
+def downgrade() -> None:
+    op.create_index("ix_applications_status", "applications", ["status"], unique=False)
+    op.create_index("ix_applications_user_id", "applications", ["user_id"], unique=False)
+    op.drop_index("ix_applications_pending_created_at", table_name="applications")
+    op.drop_index("ix_applications_status_leave_time", table_name="applications")
+    op.drop_index("ix_applications_user_id_created_at", table_name="applications")
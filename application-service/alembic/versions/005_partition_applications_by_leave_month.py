@@ -0,0 +1,227 @@
+"""Partition applications and application_documents by leave_time month
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17
+
+Both tables become RANGE-partitioned parents with one partition per UTC month of
+the application's leave_time, plus a DEFAULT partition for rows outside the created
+months. Partitions ahead of time and archiving of old ones are handled at runtime by
+src.services.partition_maintenance; this migration creates partitions for every month
+that already has data and for the current month plus three ahead, then copies the rows.
+
+Unique constraints of a partitioned table must contain the partition key, so the
+primary keys become (id, leave_time) and (id, application_leave_time), and documents
+reference their application by (application_id, application_leave_time).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_APPLICATION_INDEXES = (
+    "ix_applications_leave_time",
+    "ix_applications_created_at_id",
+    "ix_applications_user_id_created_at",
+    "ix_applications_status_leave_time",
+    "ix_applications_pending_created_at",
+)
+
+
+def _create_application_indexes() -> None:
+    op.create_index("ix_applications_leave_time", "applications", ["leave_time"], unique=False)
+    op.create_index("ix_applications_created_at_id", "applications", ["created_at", "id"], unique=False)
+    op.create_index(
+        "ix_applications_user_id_created_at",
+        "applications",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index("ix_applications_status_leave_time", "applications", ["status", "leave_time"], unique=False)
+    op.create_index(
+        "ix_applications_pending_created_at",
+        "applications",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def _application_columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("is_minor", sa.Boolean(), nullable=False),
+        sa.Column("leave_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("return_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=False),
+        sa.Column("contact_phone", sa.String(length=20), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False, server_default="pending"),
+        sa.Column("decided_by", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("decided_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("reject_reason", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    # Move the plain tables aside and free their index/constraint names.
+    op.rename_table("application_documents", "application_documents_unpartitioned")
+    op.rename_table("applications", "applications_unpartitioned")
+    op.drop_index("ix_application_documents_application_id", table_name="application_documents_unpartitioned")
+    for index in _APPLICATION_INDEXES:
+        op.drop_index(index, table_name="applications_unpartitioned")
+    op.execute(
+        "ALTER TABLE application_documents_unpartitioned "
+        "RENAME CONSTRAINT application_documents_pkey TO application_documents_unpartitioned_pkey"
+    )
+    op.execute("ALTER TABLE applications_unpartitioned RENAME CONSTRAINT applications_pkey TO applications_unpartitioned_pkey")
+
+    op.create_table(
+        "applications",
+        *_application_columns(),
+        sa.PrimaryKeyConstraint("id", "leave_time"),
+        postgresql_partition_by="RANGE (leave_time)",
+    )
+    _create_application_indexes()
+    op.create_table(
+        "application_documents",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("application_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("application_leave_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("document_type", sa.String(length=30), nullable=False),
+        sa.Column("file_url", sa.String(length=500), nullable=False),
+        sa.Column("uploaded_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["application_id", "application_leave_time"],
+            ["applications.id", "applications.leave_time"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", "application_leave_time"),
+        postgresql_partition_by="RANGE (application_leave_time)",
+    )
+    op.create_index(
+        "ix_application_documents_application_id",
+        "application_documents",
+        ["application_id"],
+        unique=False,
+    )
+
+    # Partition names follow src.repositories.partition_repository: <table>_pYYYY_MM.
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            m timestamp;
+        BEGIN
+            FOR m IN
+                SELECT date_trunc('month', leave_time AT TIME ZONE 'UTC') FROM applications_unpartitioned
+                UNION
+                SELECT generate_series(
+                    date_trunc('month', now() AT TIME ZONE 'UTC'),
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months',
+                    interval '1 month'
+                )
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF applications FOR VALUES FROM (%L) TO (%L)',
+                    'applications_p' || to_char(m, 'YYYY_MM'),
+                    m AT TIME ZONE 'UTC',
+                    (m + interval '1 month') AT TIME ZONE 'UTC'
+                );
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF application_documents FOR VALUES FROM (%L) TO (%L)',
+                    'application_documents_p' || to_char(m, 'YYYY_MM'),
+                    m AT TIME ZONE 'UTC',
+                    (m + interval '1 month') AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("CREATE TABLE applications_default PARTITION OF applications DEFAULT")
+    op.execute("CREATE TABLE application_documents_default PARTITION OF application_documents DEFAULT")
+
+    op.execute(
+        """
+        INSERT INTO applications (
+            id, user_id, is_minor, leave_time, return_time, reason, contact_phone, status,
+            decided_by, decided_at, reject_reason, created_at, updated_at
+        )
+        SELECT
+            id, user_id, is_minor, leave_time, return_time, reason, contact_phone, status,
+            decided_by, decided_at, reject_reason, created_at, updated_at
+        FROM applications_unpartitioned
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO application_documents (
+            id, application_id, application_leave_time, document_type, file_url, uploaded_by, created_at, updated_at
+        )
+        SELECT d.id, d.application_id, a.leave_time, d.document_type, d.file_url, d.uploaded_by, d.created_at, d.updated_at
+        FROM application_documents_unpartitioned d
+        JOIN applications_unpartitioned a ON a.id = d.application_id
+        """
+    )
+    op.drop_table("application_documents_unpartitioned")
+    op.drop_table("applications_unpartitioned")
+    op.execute("ANALYZE applications")
+    op.execute("ANALYZE application_documents")
+
+
+def downgrade() -> None:
+    # Archived partitions (schema "archive") are not brought back.
+    op.rename_table("application_documents", "application_documents_partitioned")
+    op.rename_table("applications", "applications_partitioned")
+    op.drop_index("ix_application_documents_application_id", table_name="application_documents_partitioned")
+    for index in _APPLICATION_INDEXES:
+        op.drop_index(index, table_name="applications_partitioned")
+    op.execute(
+        "ALTER TABLE application_documents_partitioned "
+        "RENAME CONSTRAINT application_documents_pkey TO application_documents_partitioned_pkey"
+    )
+    op.execute("ALTER TABLE applications_partitioned RENAME CONSTRAINT applications_pkey TO applications_partitioned_pkey")
+
+    op.create_table("applications", *_application_columns(), sa.PrimaryKeyConstraint("id"))
+    _create_application_indexes()
+    op.create_table(
+        "application_documents",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("application_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("document_type", sa.String(length=30), nullable=False),
+        sa.Column("file_url", sa.String(length=500), nullable=False),
+        sa.Column("uploaded_by", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.ForeignKeyConstraint(["application_id"], ["applications.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_application_documents_application_id",
+        "application_documents",
+        ["application_id"],
+        unique=False,
+    )
+    op.execute("INSERT INTO applications SELECT * FROM applications_partitioned")
+    op.execute(
+        """
+        INSERT INTO application_documents (
+            id, application_id, document_type, file_url, uploaded_by, created_at, updated_at
+        )
+        SELECT id, application_id, document_type, file_url, uploaded_by, created_at, updated_at
+        FROM application_documents_partitioned
+        """
+    )
+    op.drop_table("application_documents_partitioned")
+    op.drop_table("applications_partitioned")
@@ -0,0 +1,62 @@
+"""Denormalized approved leave roster for GetApprovedLeaves
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Written by DecideApplication(s) on approve; existing approvals are backfilled
+    # from resident_directory ("" / 0 where the applicant is not in it yet).
+    op.create_table(
+        "approved_leave_roster",
+        sa.Column("application_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("leave_date", sa.Date(), nullable=False),
+        sa.Column("building", sa.String(length=10), nullable=False),
+        sa.Column("entrance", sa.Integer(), nullable=False),
+        sa.Column("room", sa.String(length=10), nullable=False),
+        sa.Column("user_name", sa.String(length=300), nullable=False),
+        sa.Column("leave_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("return_time", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("application_id"),
+    )
+    op.create_index(
+        "ix_approved_leave_roster_date_building_entrance",
+        "approved_leave_roster",
+        ["leave_date", "building", "entrance"],
+        unique=False,
+    )
+    op.execute(
+        """
+        INSERT INTO approved_leave_roster (
+            application_id, user_id, leave_date, building, entrance, room, user_name,
+            leave_time, return_time, reason
+        )
+        SELECT
+            a.id, a.user_id, (a.leave_time AT TIME ZONE 'UTC')::date,
+            coalesce(r.building, ''), coalesce(r.entrance, 0), coalesce(r.room, ''), coalesce(r.full_name, ''),
+            a.leave_time, a.return_time, a.reason
+        FROM applications a
+        LEFT JOIN resident_directory r ON r.user_id = a.user_id
+        WHERE a.status = 'approved'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_approved_leave_roster_date_building_entrance", table_name="approved_leave_roster")
+    op.drop_table("approved_leave_roster")
@@ -0,0 +1,32 @@
+"""Generated leave_period range with a GiST index on approved_leave_roster
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # "Out at t" is leave_time <= t < return_time; as one range column it becomes a
+    # containment test (leave_period @> t) that a GiST index answers directly.
+    op.execute(
+        "ALTER TABLE approved_leave_roster ADD COLUMN leave_period tstzrange "
+        "GENERATED ALWAYS AS (tstzrange(leave_time, return_time, '[)')) STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_approved_leave_roster_leave_period ON approved_leave_roster USING gist (leave_period)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_approved_leave_roster_leave_period", table_name="approved_leave_roster")
+    op.drop_column("approved_leave_roster", "leave_period")
@@ -0,0 +1,87 @@
+"""Per-user non-overlapping active leave periods (exclusion constraint)
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17
+
+applications is partitioned by leave_time, and PostgreSQL (before 17) does not
+allow exclusion constraints on partitioned tables, so the periods of active
+(pending/approved) applications are kept in a plain side table that carries the
+constraint. Triggers on applications maintain it inside the same statement, so
+CreateApplication needs no extra query and an overlap fails its INSERT.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GiST support for the uuid equality part of the constraint.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        """
+        CREATE TABLE application_leave_periods (
+            application_id uuid PRIMARY KEY,
+            user_id uuid NOT NULL,
+            leave_time timestamptz NOT NULL,
+            return_time timestamptz NOT NULL,
+            leave_period tstzrange GENERATED ALWAYS AS (tstzrange(leave_time, return_time, '[)')) STORED,
+            CONSTRAINT ex_application_leave_periods_user_overlap
+                EXCLUDE USING gist (user_id WITH =, leave_period WITH &&)
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION application_leave_periods_sync() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                IF NEW.status IN ('pending', 'approved') THEN
+                    INSERT INTO application_leave_periods (application_id, user_id, leave_time, return_time)
+                    VALUES (NEW.id, NEW.user_id, NEW.leave_time, NEW.return_time);
+                END IF;
+            ELSIF NEW.status NOT IN ('pending', 'approved') THEN
+                -- pending -> rejected frees the period.
+                DELETE FROM application_leave_periods WHERE application_id = NEW.id;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    # No DELETE trigger: the service never deletes applications, and partition
+    # maintenance moves rows out of the default partition with DELETE. Archived
+    # months are removed from the side table by PartitionRepository.archive_month.
+    op.execute(
+        "CREATE TRIGGER applications_leave_periods_insert AFTER INSERT ON applications "
+        "FOR EACH ROW EXECUTE FUNCTION application_leave_periods_sync()"
+    )
+    op.execute(
+        "CREATE TRIGGER applications_leave_periods_update AFTER UPDATE OF status ON applications "
+        "FOR EACH ROW EXECUTE FUNCTION application_leave_periods_sync()"
+    )
+    # Existing overlaps are kept as they are: the earliest application of each
+    # overlapping group claims the period, later ones are simply not tracked.
+    op.execute(
+        """
+        INSERT INTO application_leave_periods (application_id, user_id, leave_time, return_time)
+        SELECT id, user_id, leave_time, return_time
+        FROM applications
+        WHERE status IN ('pending', 'approved')
+        ORDER BY created_at, id
+        ON CONFLICT DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER applications_leave_periods_update ON applications")
+    op.execute("DROP TRIGGER applications_leave_periods_insert ON applications")
+    op.execute("DROP FUNCTION application_leave_periods_sync()")
+    op.execute("DROP TABLE application_leave_periods")
@@ -0,0 +1,30 @@
+"""Index approved_leave_roster by user for resident data refreshes
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Resident directory updates rewrite the user's upcoming roster rows:
+    # WHERE user_id = ? AND leave_date >= today.
+    op.create_index(
+        "ix_approved_leave_roster_user_id_leave_date",
+        "approved_leave_roster",
+        ["user_id", "leave_date"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_approved_leave_roster_user_id_leave_date", table_name="approved_leave_roster")
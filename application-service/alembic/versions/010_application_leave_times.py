@@ -0,0 +1,56 @@
+"""application id -> leave_time lookup for partition pruning on id lookups
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17
+
+GetApplication, DecideApplication and the document RPCs only know the application
+id, and applications is partitioned by leave_time, so `WHERE id = ?` probes the
+primary key index of every month. The plain side table maps the id to its
+partition key; an INSERT trigger on applications keeps it filled.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TABLE application_leave_times (
+            application_id uuid PRIMARY KEY,
+            leave_time timestamptz NOT NULL
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION application_leave_times_sync() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO application_leave_times (application_id, leave_time) VALUES (NEW.id, NEW.leave_time);
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    # INSERT only: leave_time is part of the primary key and is never updated. Archived
+    # months are removed from the side table by PartitionRepository.archive_month.
+    op.execute(
+        "CREATE TRIGGER applications_leave_times_insert AFTER INSERT ON applications "
+        "FOR EACH ROW EXECUTE FUNCTION application_leave_times_sync()"
+    )
+    op.execute(
+        "INSERT INTO application_leave_times (application_id, leave_time) SELECT id, leave_time FROM applications"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER applications_leave_times_insert ON applications")
+    op.execute("DROP FUNCTION application_leave_times_sync()")
+    op.execute("DROP TABLE application_leave_times")
@@ -0,0 +1,63 @@
+"""
+Enrichment overhead of a ListApplications page against the fake auth-service.
+
+Compares one GetUserInfo per row, one GetUsersInfo per page, and the batch call
+behind CachingAuthClient (warm cache).
+
+    python -m benchmarks.bench_auth_enrichment --latency-ms 1 --rounds 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.grpc_clients.auth_grpc_client import AuthGrpcClient
+from src.grpc_clients.user_info_cache import CachingAuthClient
+from tests.fake_auth_server import FakeAuthServicer, make_users, start_fake_auth_server
+
+
+async def _measure(rounds: int, call) -> tuple[float, float]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+async def main(latency_ms: float, rounds: int) -> None:
+    users = make_users(1000)
+    servicer = FakeAuthServicer(users, latency_seconds=latency_ms / 1000)
+    server, target = await start_fake_auth_server(servicer)
+    client = AuthGrpcClient([target], timeout_seconds=5)
+    cached = CachingAuthClient(client, max_size=10_000, ttl_seconds=3600, negative_ttl_seconds=60)
+    try:
+        print(f"{'page':>5} {'mode':<12} {'p50 ms':>9} {'p99 ms':>9}")
+        for page_size in (20, 50, 100):
+            ids = [u.user_id for u in users[:page_size]]
+
+            async def per_row() -> None:
+                for user_id in ids:
+                    await client.get_user_info(user_id)
+
+            async def batch() -> None:
+                await client.get_users_info(ids)
+
+            async def cached_batch() -> None:
+                await cached.get_users_info(ids)
+
+            for name, call in (("per-row", per_row), ("batch", batch), ("cached", cached_batch)):
+                p50, p99 = await _measure(rounds, call)
+                print(f"{page_size:>5} {name:<12} {p50:>9.2f} {p99:>9.2f}")
+    finally:
+        await client.close()
+        await server.stop(grace=None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="simulated auth-service latency per call")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.latency_ms, args.rounds))
@@ -0,0 +1,175 @@
+"""
+Python-side cost of the SQL statements behind the read RPCs, without a database.
+
+Every repository call runs against a session that only does what Session.execute
+does before reaching the driver: build the statement and derive its cache key for
+the compiled-statement cache lookup. "before" is the previous select() code, "after"
+the current lambda_stmt code, and "cold" adds a full compile for the asyncpg dialect
+(what a compiled-cache miss costs, e.g. with the cache disabled).
+
+    python -m benchmarks.bench_query_compile --rounds 2000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy import and_, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
+
+from src.constants.count_mode import COUNT_MODE_EXACT, COUNT_MODE_WINDOW
+from src.models.application import ApplicationModel
+from src.models.application_document import ApplicationDocumentModel
+from src.models.resident_directory import ResidentDirectoryModel
+from src.repositories.application_document_repository import ApplicationDocumentRepository
+from src.repositories.application_repository import ApplicationRepository
+
+_DIALECT = asyncpg_dialect()
+
+
+class _SelectApplicationRepository(ApplicationRepository):
+    """The read paths as they were before lambda_stmt (estimated count mode omitted)."""
+
+    async def get_by_id(self, application_id):
+        result = await self._session.execute(select(ApplicationModel).where(ApplicationModel.id == application_id))
+        return result.scalar_one_or_none()
+
+    async def get_by_id_with_documents(self, application_id):
+        result = await self._session.execute(
+            select(ApplicationModel)
+            .where(ApplicationModel.id == application_id)
+            .options(selectinload(ApplicationModel.documents), joinedload(ApplicationModel.resident))
+        )
+        return result.scalar_one_or_none()
+
+    async def get_list(self, *, user_id=None, entrance=None, status=None, page=1, size=20, after=None, count_mode=COUNT_MODE_EXACT, **_):
+        conditions = []
+        if user_id is not None:
+            conditions.append(ApplicationModel.user_id == user_id)
+        if entrance is not None:
+            conditions.append(ResidentDirectoryModel.entrance == entrance)
+        if status is not None:
+            conditions.append(ApplicationModel.status == literal(status, literal_execute=True))
+        joins_resident = entrance is not None
+        total = None
+        if count_mode == COUNT_MODE_EXACT:
+            count_q = select(func.count()).select_from(ApplicationModel)
+            if joins_resident:
+                count_q = count_q.join(ApplicationModel.resident)
+            if conditions:
+                count_q = count_q.where(and_(*conditions))
+            total = (await self._session.execute(count_q)).scalar()
+        q = select(ApplicationModel).outerjoin(ApplicationModel.resident).options(contains_eager(ApplicationModel.resident))
+        if count_mode == COUNT_MODE_WINDOW:
+            counted = select(ApplicationModel.id, func.count().over().label("total")).select_from(ApplicationModel)
+            if joins_resident:
+                counted = counted.join(ApplicationModel.resident)
+            if conditions:
+                counted = counted.where(and_(*conditions))
+            counted_sq = counted.subquery()
+            q = q.add_columns(counted_sq.c.total).join(counted_sq, counted_sq.c.id == ApplicationModel.id)
+        elif conditions:
+            q = q.where(and_(*conditions))
+        if after is not None:
+            q = q.where(tuple_(ApplicationModel.created_at, ApplicationModel.id) < tuple_(*after))
+        else:
+            q = q.offset((page - 1) * size)
+        q = q.order_by(ApplicationModel.created_at.desc(), ApplicationModel.id.desc()).limit(size + 1)
+        await self._session.execute(q)
+        return [], total, False
+
+
+class _SelectDocumentRepository(ApplicationDocumentRepository):
+    async def get_by_id(self, document_id):
+        result = await self._session.execute(
+            select(ApplicationDocumentModel).where(ApplicationDocumentModel.id == document_id)
+        )
+        return result.scalar_one_or_none()
+
+
+class _EmptyResult:
+    def scalar_one_or_none(self):
+        return None
+
+    def scalar(self):
+        return 0
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+class _KeyOnlySession:
+    """Stands in for AsyncSession: cache-key lookup (and optionally a compile), no I/O."""
+
+    def __init__(self, compile_statements: bool) -> None:
+        self._compile = compile_statements
+
+    async def execute(self, statement):
+        statement._generate_cache_key()
+        if self._compile:
+            statement.compile(dialect=_DIALECT)
+        return _EmptyResult()
+
+
+def _rpcs(app_repo, doc_repo):
+    application_id, document_id, user_id = uuid4(), uuid4(), uuid4()
+    after = (datetime.now(timezone.utc), uuid4())
+
+    async def get_application() -> None:
+        await app_repo.get_by_id_with_documents(application_id)
+
+    async def list_student() -> None:
+        await app_repo.get_list(user_id=user_id, count_mode=COUNT_MODE_EXACT)
+
+    async def list_educator() -> None:
+        await app_repo.get_list(status="pending", entrance=3, after=after, count_mode=COUNT_MODE_WINDOW)
+
+    async def get_download_url() -> None:
+        await app_repo.get_by_id(application_id)
+        await doc_repo.get_by_id(document_id)
+
+    return {
+        "GetApplication": get_application,
+        "ListApplications/student": list_student,
+        "ListApplications/educator": list_educator,
+        "GetDocumentDownloadUrl": get_download_url,
+    }
+
+
+async def _median_us(call, rounds: int) -> float:
+    await call()  # first call populates the lambda caches
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+async def main(rounds: int) -> None:
+    modes = {
+        "before": (_SelectApplicationRepository, _SelectDocumentRepository, False),
+        "after": (ApplicationRepository, ApplicationDocumentRepository, False),
+        "cold": (ApplicationRepository, ApplicationDocumentRepository, True),
+    }
+    results: dict[str, dict[str, float]] = {}
+    for mode, (app_cls, doc_cls, compile_statements) in modes.items():
+        session = _KeyOnlySession(compile_statements)
+        for name, call in _rpcs(app_cls(session), doc_cls(session)).items():  # type: ignore[arg-type]
+            results.setdefault(name, {})[mode] = await _median_us(call, rounds)
+    print(f"{'rpc':<27} {'before us':>10} {'after us':>10} {'cold us':>10}")
+    for name, by_mode in results.items():
+        print(f"{name:<27} {by_mode['before']:>10.1f} {by_mode['after']:>10.1f} {by_mode['cold']:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
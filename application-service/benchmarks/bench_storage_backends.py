@@ -0,0 +1,128 @@
+"""
+200 concurrent document uploads through MinioStorage (minio-py in worker threads) and
+AsyncS3Storage (httpx on the event loop).
+
+Reports wall time, upload latency percentiles, and how long a trivial
+asyncio.to_thread call and the event loop itself are held up meanwhile: the threaded
+backend queues its uploads on the default executor that everything else shares. By
+default the target is tests.fake_s3_server started in a subprocess; pass --endpoint
+(and credentials via MINIO_*) to measure against a real MinIO.
+
+    python -m benchmarks.bench_storage_backends --uploads 200 --size 262144 --latency-ms 5
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from uuid import uuid4
+
+from src.config import minio_settings
+from src.storage.minio_storage import MinioStorage
+from src.storage.s3_storage import AsyncS3Storage
+
+
+def _p(samples: list[float], q: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * q))] * 1000
+
+
+async def _run(storage, uploads: int, size: int) -> dict[str, float]:
+    data = os.urandom(size)
+    await storage.ensure_bucket()
+    latencies: list[float] = []
+    probes: list[float] = []
+    lags: list[float] = []
+    threads = threading.active_count()
+    done = asyncio.Event()
+
+    async def _upload() -> None:
+        start = time.perf_counter()
+        await storage.upload_file(uuid4(), uuid4(), data, "application/pdf", "pdf")
+        latencies.append(time.perf_counter() - start)
+
+    async def _probe() -> None:
+        nonlocal threads
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.to_thread(lambda: None)
+            probes.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lags.append(time.perf_counter() - start - 0.005)
+            threads = max(threads, threading.active_count())
+
+    probe = asyncio.create_task(_probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(_upload() for _ in range(uploads)))
+    wall = time.perf_counter() - start
+    done.set()
+    await probe
+    return {
+        "wall_s": wall,
+        "rate": uploads / wall,
+        "p50": _p(latencies, 0.5),
+        "p95": _p(latencies, 0.95),
+        "probe_p95": _p(probes, 0.95),
+        "lag_p95": _p(lags, 0.95),
+        "threads": threads,
+    }
+
+
+def _start_stand_in(latency_ms: float) -> tuple[subprocess.Popen, str]:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    process = subprocess.Popen(
+        [sys.executable, "-m", "tests.fake_s3_server", "--port", str(port), "--latency-ms", str(latency_ms)]
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.1)
+    return process, f"127.0.0.1:{port}"
+
+
+async def main(uploads: int, size: int, concurrency: int) -> None:
+    backends = {
+        "threaded": lambda: MinioStorage(),
+        "async": lambda: AsyncS3Storage(max_concurrency=concurrency),
+    }
+    print(f"{'backend':<9} {'wall s':>7} {'up/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'to_thread p95':>14} {'loop lag p95':>13} {'threads':>8}")
+    for name, make in backends.items():
+        storage = make()
+        try:
+            r = await _run(storage, uploads, size)
+        finally:
+            await storage.close()
+        print(
+            f"{name:<9} {r['wall_s']:>7.2f} {r['rate']:>7.0f} {r['p50']:>8.1f} {r['p95']:>8.1f} "
+            f"{r['probe_p95']:>14.1f} {r['lag_p95']:>13.1f} {r['threads']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uploads", type=int, default=200)
+    parser.add_argument("--size", type=int, default=256 * 1024)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="stand-in latency per request")
+    parser.add_argument("--concurrency", type=int, default=minio_settings.max_concurrent_requests)
+    parser.add_argument("--endpoint", default="", help="host:port of a real MinIO instead of the stand-in")
+    args = parser.parse_args()
+    stand_in = None
+    if args.endpoint:
+        minio_settings.endpoint = args.endpoint
+    else:
+        stand_in, minio_settings.endpoint = _start_stand_in(args.latency_ms)
+    minio_settings.public_endpoint = None
+    try:
+        asyncio.run(main(args.uploads, args.size, args.concurrency))
+    finally:
+        if stand_in is not None:
+            stand_in.terminate()
+            stand_in.wait()
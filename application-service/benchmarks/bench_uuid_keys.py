@@ -0,0 +1,91 @@
+"""
+Insert throughput, primary-key index size and WAL volume with uuid4 vs uuid7 keys.
+
+Fills two scratch tables shaped like `applications` (uuid primary key plus an
+indexed uuid column standing in for a foreign key) with the same number of rows,
+in batches of client-generated ids as the service does, and reports rows/s, the
+size of both indexes and the WAL written. Needs PostgreSQL; the tables are dropped
+afterwards.
+
+    python -m benchmarks.bench_uuid_keys --database-url postgresql+asyncpg://... --rows 5000000
+"""
+import argparse
+import asyncio
+import os
+import time
+from collections.abc import Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.models.ids import uuid7
+
+_GENERATORS: dict[str, Callable[[], UUID]] = {"uuid4": uuid4, "uuid7": uuid7}
+
+
+async def _fill(engine: AsyncEngine, name: str, generate: Callable[[], UUID], rows: int, batch: int) -> dict[str, float]:
+    table = f"bench_uuid_keys_{name}"
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await conn.execute(
+            text(
+                f"CREATE TABLE {table} (id uuid PRIMARY KEY, parent_id uuid NOT NULL, "
+                "created_at timestamptz NOT NULL DEFAULT now(), payload text NOT NULL)"
+            )
+        )
+        await conn.execute(text(f"CREATE INDEX {table}_parent_id ON {table} (parent_id)"))
+        wal_start = (await conn.execute(text("SELECT pg_current_wal_insert_lsn()"))).scalar()
+    insert = text(
+        f"INSERT INTO {table} (id, parent_id, payload) "
+        "SELECT id, parent_id, 'Магазин' FROM unnest(CAST(:ids AS uuid[]), CAST(:parents AS uuid[])) AS t(id, parent_id)"
+    )
+    start = time.perf_counter()
+    done = 0
+    while done < rows:
+        n = min(batch, rows - done)
+        ids = [generate() for _ in range(n)]
+        async with engine.begin() as conn:
+            # Children reference recent parents, as documents do with their application.
+            await conn.execute(insert, {"ids": ids, "parents": ids})
+        done += n
+    elapsed = time.perf_counter() - start
+    async with engine.begin() as conn:
+        stats = (
+            await conn.execute(
+                text(
+                    "SELECT pg_relation_size(:pkey), pg_relation_size(:fk), "
+                    "pg_wal_lsn_diff(pg_current_wal_insert_lsn(), CAST(:wal AS pg_lsn))"
+                ),
+                {"pkey": f"{table}_pkey", "fk": f"{table}_parent_id", "wal": str(wal_start)},
+            )
+        ).one()
+        await conn.execute(text(f"DROP TABLE {table}"))
+    return {
+        "rows_per_s": rows / elapsed,
+        "pkey_mb": stats[0] / 2**20,
+        "fk_mb": stats[1] / 2**20,
+        "wal_mb": float(stats[2]) / 2**20,
+    }
+
+
+async def main(database_url: str, rows: int, batch: int) -> None:
+    engine = create_async_engine(database_url)
+    print(f"{'keys':<6} {'rows/s':>10} {'pkey MB':>9} {'fk MB':>9} {'WAL MB':>9}")
+    try:
+        for name, generate in _GENERATORS.items():
+            r = await _fill(engine, name, generate, rows, batch)
+            print(f"{name:<6} {r['rows_per_s']:>10.0f} {r['pkey_mb']:>9.1f} {r['fk_mb']:>9.1f} {r['wal_mb']:>9.1f}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default=os.environ.get("TEST_POSTGRES_URL", ""))
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    args = parser.parse_args()
+    if not args.database_url.startswith("postgresql"):
+        parser.error("--database-url (or TEST_POSTGRES_URL) must point to PostgreSQL")
+    asyncio.run(main(args.database_url, args.rows, args.batch))
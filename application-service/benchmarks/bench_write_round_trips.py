@@ -0,0 +1,151 @@
+"""
+Database round trips and latency of CreateApplication and UploadDocument.
+
+"before" is the previous add + flush + refresh repository code (INSERT, then a
+SELECT to read created_at/updated_at); "after" is the current INSERT ... RETURNING.
+Statements are counted with a before_cursor_execute listener on an in-memory SQLite
+database, so latency numbers only show the relative cost of the extra round trip.
+
+    python -m benchmarks.bench_write_round_trips --rounds 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.grpc_clients.auth_client import AuthClientStub
+from src.models.application import ApplicationModel
+from src.models.application_document import ApplicationDocumentModel
+from src.models.base import Base
+from src.repositories.application_document_repository import ApplicationDocumentRepository
+from src.repositories.application_repository import ApplicationRepository
+from src.repositories.resident_directory_repository import ResidentDirectoryRepository
+from src.services.application_service import ApplicationService
+
+
+class _FlushRefreshApplicationRepository(ApplicationRepository):
+    async def create(self, user_id, is_minor, leave_time, return_time, reason, contact_phone):
+        model = ApplicationModel(
+            user_id=user_id,
+            is_minor=is_minor,
+            leave_time=leave_time,
+            return_time=return_time,
+            reason=reason,
+            contact_phone=contact_phone,
+            status="pending",
+        )
+        self._session.add(model)
+        await self._session.flush()
+        await self._session.refresh(model)
+        return model
+
+
+class _FlushRefreshDocumentRepository(ApplicationDocumentRepository):
+    async def create(self, application_id, document_type, file_url, uploaded_by, document_id=None):
+        model = ApplicationDocumentModel(
+            id=document_id or uuid4(),
+            application_id=application_id,
+            document_type=document_type,
+            file_url=file_url,
+            uploaded_by=uploaded_by,
+        )
+        self._session.add(model)
+        await self._session.flush()
+        await self._session.refresh(model)
+        return model
+
+
+class _MemoryStorage:
+    """Keeps MinIO out of the measurement; only database round trips are of interest."""
+
+    async def upload_file(self, application_id: UUID, document_id: UUID, data: bytes, content_type: str, extension: str) -> str:
+        return f"{application_id}/{document_id}.{extension}"
+
+
+def _service(session: AsyncSession, legacy: bool) -> ApplicationService:
+    app_repo_cls = _FlushRefreshApplicationRepository if legacy else ApplicationRepository
+    doc_repo_cls = _FlushRefreshDocumentRepository if legacy else ApplicationDocumentRepository
+    return ApplicationService(
+        application_repository=app_repo_cls(session),
+        document_repository=doc_repo_cls(session),
+        storage=_MemoryStorage(),  # type: ignore[arg-type]
+        auth_client=AuthClientStub(),
+        resident_repository=ResidentDirectoryRepository(session),
+    )
+
+
+async def _run(session: AsyncSession, legacy: bool, rounds: int) -> dict[str, tuple[float, float, float]]:
+    engine = session.get_bind()
+    statements = 0
+
+    def _count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    service = _service(session, legacy)
+    user_id = uuid4()
+    leave_time = datetime.now(timezone.utc) + timedelta(days=1)
+    samples: dict[str, list[float]] = {"CreateApplication": [], "UploadDocument": []}
+    counts: dict[str, int] = {"CreateApplication": 0, "UploadDocument": 0}
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        for _ in range(rounds):
+            statements = 0
+            start = time.perf_counter()
+            app, _ = await service.create_application(
+                user_id=user_id,
+                leave_time=leave_time,
+                return_time=leave_time + timedelta(hours=2),
+                reason="Магазин",
+                contact_phone="+79001234567",
+            )
+            samples["CreateApplication"].append((time.perf_counter() - start) * 1000)
+            counts["CreateApplication"] += statements
+
+            statements = 0
+            start = time.perf_counter()
+            await service.upload_document(
+                application_id=app.id,
+                document_type="signed_application",
+                file_data=b"%PDF-1.4",
+                content_type="application/pdf",
+                filename="scan.pdf",
+                uploaded_by=user_id,
+            )
+            samples["UploadDocument"].append((time.perf_counter() - start) * 1000)
+            counts["UploadDocument"] += statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    return {
+        name: (counts[name] / rounds, statistics.median(values), sorted(values)[int(len(values) * 0.99) - 1])
+        for name, values in samples.items()
+    }
+
+
+async def main(rounds: int) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    print(f"{'rpc':<18} {'mode':<7} {'stmts':>6} {'p50 ms':>8} {'p99 ms':>8}")
+    try:
+        for legacy, mode in ((True, "before"), (False, "after")):
+            async with factory() as session:
+                results = await _run(session, legacy, rounds)
+                await session.rollback()
+            for name, (stmts, p50, p99) in results.items():
+                print(f"{name:<18} {mode:<7} {stmts:>6.1f} {p50:>8.3f} {p99:>8.3f}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
@@ -1,8 +1,8 @@
 from datetime import date, datetime, timezone
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, File, Form, Header, Query, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.util import deprecated
 
 from src.api.v1.applications.schemas import (
@@ -14,6 +14,7 @@ from src.api.v1.applications.schemas import (
     DocumentDownloadResponse,
     DocumentResponse,
 )
+from src.constants.count_mode import COUNT_MODE_EXACT
 from src.dependencies import (
     get_application_service,
     get_auth_client_dep,
@@ -21,19 +22,11 @@ from src.dependencies import (
 )
 from src.grpc_clients.auth_client import AuthClientProtocol
 from src.services.application_service import ApplicationService
+from src.services.resident_directory import resolve_residents, user_name_from_info
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
 
-def _user_name_from_info(info: object | None) -> str | None:
-    if info is None:
-        return None
-    last = getattr(info, "last_name", "") or ""
-    first = getattr(info, "first_name", "") or ""
-    patronymic = getattr(info, "patronymic", "") or ""
-    return f"{last} {first} {patronymic}".strip() or None
-
-
 def _to_response(model: object) -> ApplicationResponse:
     return ApplicationResponse.model_validate(model)
 
@@ -59,6 +52,8 @@ async def list_applications(
     room: str | None = Query(None, min_length=1, max_length=10),
     date_from: date | None = None,
     date_to: date | None = None,
+    cursor: str | None = Query(None, description="next_cursor from the previous page; page is ignored when set"),
+    count_mode: str = Query(COUNT_MODE_EXACT, pattern="^(exact|window|estimated|has_more)$"),
     current_user: tuple[UUID, list[str]] = Depends(get_current_user),
     service: ApplicationService = Depends(get_application_service),
     auth_client: AuthClientProtocol = Depends(get_auth_client_dep),
@@ -68,7 +63,7 @@ async def list_applications(
         r in roles for r in ("educator", "educator_head", "admin")
     )
     filter_user_id = None if is_educator else user_id
-    items, total = await service.list_applications(
+    items, total, next_cursor = await service.list_applications(
         user_id=filter_user_id,
         entrance=entrance if is_educator else None,
         room=room if is_educator else None,
@@ -77,15 +72,18 @@ async def list_applications(
         date_to=date_to,
         page=page,
         size=size,
+        cursor=cursor,
+        count_mode=count_mode,
     )
     pages = (total + size - 1) // size if total else 0
+    users_info = await resolve_residents(auth_client, items)
     enriched = []
     for m in items:
         r = _to_response(m)
-        user_info = await auth_client.get_user_info(str(m.user_id))
+        user_info = users_info.get(str(m.user_id))
         payload = r.model_dump()
         payload.update(
-            user_name=_user_name_from_info(user_info),
+            user_name=user_name_from_info(user_info),
             room=user_info.room if user_info else None,
             entrance=user_info.entrance if user_info else None,
         )
@@ -96,6 +94,7 @@ async def list_applications(
         page=page,
         size=size,
         pages=pages,
+        next_cursor=next_cursor,
     )
 
 
@@ -142,11 +141,11 @@ async def get_application(
     can_decide = any(
         r in roles for r in ("educator", "educator_head", "admin")
     )
-    user_info = await auth_client.get_user_info(str(app.user_id))
+    user_info = getattr(app, "resident", None) or await auth_client.get_user_info(str(app.user_id))
     payload = detail.model_dump()
     payload.update(
         can_decide=can_decide,
-        user_name=_user_name_from_info(user_info),
+        user_name=user_name_from_info(user_info),
         room=user_info.room if user_info else None,
         entrance=user_info.entrance if user_info else None,
     )
@@ -239,20 +238,33 @@ async def download_document(
 async def download_document_file(
     application_id: UUID,
     document_id: UUID,
+    range_header: str = Header("", alias="Range"),
+    if_none_match: str = Header("", alias="If-None-Match"),
     current_user: tuple[UUID, list[str]] = Depends(get_current_user),
     service: ApplicationService = Depends(get_application_service),
 ) -> Response:
     user_id, roles = current_user
-    data, content_type, filename = await service.get_document_file(
+    info, chunks = await service.open_document_file(
         application_id=application_id,
         document_id=document_id,
         current_user_id=user_id,
         current_user_roles=roles,
+        range_header=range_header,
+        if_none_match=if_none_match,
     )
-    return Response(
-        content=data,
-        media_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-        },
+    headers = {"ETag": info.etag, "Accept-Ranges": "bytes"}
+    if info.not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if chunks is None:
+        headers["Content-Range"] = f"bytes */{info.size}"
+        return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+    headers["Content-Disposition"] = f'attachment; filename="{info.filename}"'
+    headers["Content-Length"] = str(info.length)
+    if info.partial:
+        headers["Content-Range"] = f"bytes {info.range_start}-{info.range_end}/{info.size}"
+    return StreamingResponse(
+        chunks,
+        status_code=status.HTTP_206_PARTIAL_CONTENT if info.partial else status.HTTP_200_OK,
+        media_type=info.content_type,
+        headers=headers,
     )
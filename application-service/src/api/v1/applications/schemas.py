@@ -59,10 +59,11 @@ class ApplicationDetailResponse(ApplicationResponse):
 
 class ApplicationListResponse(BaseModel):
     items: list[ApplicationResponse]
-    total: int
+    total: int | None = Field(..., description="None for count_mode=has_more; approximate for count_mode=estimated")
     page: int
     size: int
     pages: int
+    next_cursor: str | None = None
 
 
 class PaginatedParams(BaseModel):
@@ -15,5 +15,17 @@ class AppSettings(BaseSettings):
     loki_url: str = ""
     grpc_port: int = 50055
 
+    resident_refresh_interval_seconds: float = 900.0
+    """How often resident_directory is refreshed from auth-service; 0 disables the background job."""
+    resident_max_age_seconds: float = 86_400.0
+    resident_refresh_batch_size: int = 500
+
+    partition_maintenance_interval_seconds: float = 86_400.0
+    """How often monthly partitions are created ahead / archived (PostgreSQL only); 0 disables the job."""
+    partition_months_ahead: int = 3
+    partition_archive_after_months: int = 24
+    """Detach months older than this into the archive schema; 0 keeps everything, minimum 12 (BR-EXIT-007)."""
+    partition_archive_tablespace: str = ""
+
 
 settings = AppSettings()
@@ -11,6 +11,34 @@ class AuthGrpcSettings(BaseSettings):
     )
 
     grpc_url: str = "localhost:50051"
+    grpc_shard_urls: str = ""
+    """Optional comma-separated auth replicas; user lookups are sharded across grpc_url and these."""
+    use_stub: bool = True
+    """Use the in-process stub instead of auth-service (local development without auth)."""
+    grpc_timeout_seconds: float = 2.0
+    grpc_keepalive_time_ms: int = 30_000
+    grpc_keepalive_timeout_ms: int = 10_000
+    grpc_retry_max_attempts: int = 3
+    grpc_fallback_concurrency: int = 16
+    """Parallel GetUserInfo calls per batch when auth-service does not implement GetUsersInfo."""
+
+    coalesce_enabled: bool = True
+    """Deduplicate concurrent identical auth lookups (single-flight) before they reach auth-service."""
+
+    user_info_cache_enabled: bool = True
+    user_info_cache_max_size: int = 10_000
+    user_info_cache_ttl_seconds: float = 3600.0
+    """Profile data (name, building, entrance, room) changes rarely; an hour of staleness is acceptable."""
+    user_info_cache_negative_ttl_seconds: float = 60.0
+
+    token_cache_max_size: int = 10_000
+    token_cache_ttl_seconds: float = 60.0
+    """Upper bound for reusing a ValidateToken result; the token's own exp is applied on top. 0 disables."""
+
+    @property
+    def grpc_targets(self) -> list[str]:
+        shards = [u.strip() for u in self.grpc_shard_urls.split(",") if u.strip()]
+        return [self.grpc_url, *(u for u in shards if u != self.grpc_url)]
 
 
 auth_grpc_settings = AuthGrpcSettings()
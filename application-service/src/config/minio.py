@@ -18,6 +18,24 @@ class MinioSettings(BaseSettings):
     secret_key: str = "minioadmin"
     bucket_applications: str = "applications"
     secure: bool = False
+    pool_maxsize: int = 32
+    """Kept-alive connections to MinIO, shared by every request; size for concurrent uploads and downloads."""
+    connect_timeout_seconds: float = 5.0
+    """threaded backend: TCP connect timeout; reads keep minio's 300 s for large objects."""
+    startup_check_timeout_seconds: float = 10.0
+    """Upper bound for the bucket check at startup; when exceeded the service starts and uploads retry it."""
+    backend: str = "threaded"
+    """threaded: minio-py in worker threads; async: httpx on the event loop (src.storage.s3_storage)."""
+    region: str = "us-east-1"
+
+    # async backend only
+    max_concurrent_requests: int = 64
+    """Storage requests in flight at once; further uploads/downloads wait for a slot."""
+    request_timeout_seconds: float = 30.0
+    """Connect, per-read and per-write timeout of one request (a streamed download may take longer overall)."""
+    max_retries: int = 3
+    """Retries of a request on network errors and 5xx, with full-jitter exponential backoff."""
+    retry_backoff_seconds: float = 0.2
 
 
 minio_settings = MinioSettings()
@@ -1,3 +1,10 @@
+from src.constants.count_mode import (
+    COUNT_MODE_EXACT,
+    COUNT_MODE_WINDOW,
+    COUNT_MODE_ESTIMATED,
+    COUNT_MODE_HAS_MORE,
+    COUNT_MODES,
+)
 from src.constants.document_type import (
     DOCUMENT_TYPE_SIGNED_APPLICATION,
     DOCUMENT_TYPE_PARENT_LETTER,
@@ -16,6 +23,11 @@ from src.constants.error_codes import (
 )
 
 __all__ = [
+    "COUNT_MODE_EXACT",
+    "COUNT_MODE_WINDOW",
+    "COUNT_MODE_ESTIMATED",
+    "COUNT_MODE_HAS_MORE",
+    "COUNT_MODES",
     "DOCUMENT_TYPE_SIGNED_APPLICATION",
     "DOCUMENT_TYPE_PARENT_LETTER",
     "DOCUMENT_TYPE_VOICE_MESSAGE",
@@ -0,0 +1,17 @@
+from typing import Final
+
+COUNT_MODE_EXACT: Final[str] = "exact"
+"""Separate COUNT(*) with the same filters (two queries per page)."""
+COUNT_MODE_WINDOW: Final[str] = "window"
+"""COUNT(*) OVER () in the page query itself (one round trip)."""
+COUNT_MODE_ESTIMATED: Final[str] = "estimated"
+"""Planner statistics (pg_class.reltuples) for unfiltered listings; window count otherwise."""
+COUNT_MODE_HAS_MORE: Final[str] = "has_more"
+"""No total at all; only whether a next page exists (size + 1 rows are fetched)."""
+
+COUNT_MODES: Final[frozenset[str]] = frozenset({
+    COUNT_MODE_EXACT,
+    COUNT_MODE_WINDOW,
+    COUNT_MODE_ESTIMATED,
+    COUNT_MODE_HAS_MORE,
+})
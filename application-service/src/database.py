@@ -1,16 +1,211 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import structlog
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import Engine, make_url, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config import database_settings
 from src.models.base import Base
 
-engine = create_async_engine(
-    database_settings.database_url,
-    echo=False,
-    pool_pre_ping=True,
+logger = structlog.get_logger(__name__)
+
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "Read-only sessions opened, by the engine their SELECTs were routed to",
+    ["target"],
+)
+DB_REPLICA_LAG = Gauge("db_replica_lag_seconds", "Replication lag of the read replica at the last probe")
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured persistent connections in the pool", ["engine"])
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Connections currently checked out of the pool", ["engine"])
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "Connections open above the pool size", ["engine"])
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time to get a connection from the pool, including queueing, connecting and pre-ping",
+    ["engine"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Checkouts that gave up after database_pool_timeout_seconds",
+    ["engine"],
 )
 
+# Zero when the replica has replayed everything it received, so an idle primary does not look like lag.
+_PG_REPLICA_LAG = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records checkout wait time and timeouts, labelled by pool_logging_name."""
+
+    def connect(self):
+        name = self._orig_logging_name or "default"
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.labels(engine=name).inc()
+            raise
+        finally:
+            DB_POOL_WAIT.labels(engine=name).observe(time.perf_counter() - start)
+
+
+def create_instrumented_engine(url: str, name: str, **pool_options) -> AsyncEngine:
+    """create_async_engine whose pool exports db_pool_* metrics with engine=`name`."""
+    created = create_async_engine(
+        url,
+        echo=False,
+        pool_pre_ping=True,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=name,
+        **pool_options,
+    )
+    # Read through created.pool on every scrape: dispose() replaces the pool object.
+    DB_POOL_SIZE.labels(engine=name).set_function(lambda: created.pool.size())
+    DB_POOL_CHECKED_OUT.labels(engine=name).set_function(lambda: created.pool.checkedout())
+    DB_POOL_OVERFLOW.labels(engine=name).set_function(lambda: max(0, created.pool.overflow()))
+    return created
+
+
+async def prewarm_pool(target: AsyncEngine, connections: int) -> None:
+    """Open `connections` connections at once and return them to the pool."""
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            await stack.enter_async_context(target.connect())
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain SELECTs to `replica` when one is given. Anything else
+    (INSERT/UPDATE/DELETE, SELECT ... FOR UPDATE, flushes, raw connections) goes to
+    the primary and pins the session there, so reads after a write see that write.
+    """
+
+    def __init__(self, *args, replica: Engine | None = None, **kw) -> None:
+        super().__init__(*args, **kw)
+        self._replica = replica
+        self._pinned = replica is None
+
+    @property
+    def on_replica(self) -> bool:
+        return not self._pinned
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not self._pinned:
+            if not self._flushing and _is_plain_select(clause):
+                return self._replica
+            self._pinned = True
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+def _is_plain_select(clause) -> bool:
+    # is_select also answers for lambda_stmt reads, from the statement the lambda builds.
+    # Textual SELECTs stay on the primary: their SQL may lock rows.
+    if not getattr(clause, "is_select", False) or clause.is_text:
+        return False
+    return getattr(clause, "_for_update_arg", None) is None
+
+
+class ReplicaMonitor:
+    """
+    Cached health/lag probe for the replica. The replica is used only while it answers
+    within `timeout_seconds` and lags less than `max_lag_seconds`; the result is reused
+    for `check_interval_seconds` so the probe costs one query per interval, not per RPC.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        *,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        timeout_seconds: float,
+    ) -> None:
+        self._engine = engine
+        self._max_lag = max_lag_seconds
+        self._interval = check_interval_seconds
+        self._timeout = timeout_seconds
+        self._usable = False
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def is_usable(self) -> bool:
+        if time.monotonic() - self._checked_at < self._interval:
+            return self._usable
+        async with self._lock:
+            if time.monotonic() - self._checked_at >= self._interval:
+                self._usable = await self._probe()
+                self._checked_at = time.monotonic()
+        return self._usable
+
+    async def _probe(self) -> bool:
+        try:
+            lag = await asyncio.wait_for(self._lag_seconds(), self._timeout)
+        except Exception as e:  # noqa: BLE001
+            if self._usable:
+                logger.warning("db_replica_unavailable", error=str(e))
+            return False
+        DB_REPLICA_LAG.set(lag)
+        if lag > self._max_lag:
+            if self._usable:
+                logger.warning("db_replica_lagging", lag_seconds=lag, max_lag_seconds=self._max_lag)
+            return False
+        return True
+
+    async def _lag_seconds(self) -> float:
+        async with self._engine.connect() as conn:
+            if conn.dialect.name != "postgresql":
+                await conn.execute(text("SELECT 1"))
+                return 0.0
+            lag = await conn.scalar(text(_PG_REPLICA_LAG))
+        return float(lag or 0.0)
+
+
+def _engine_options(url: str) -> dict:
+    options: dict = {
+        "pool_size": database_settings.database_pool_size,
+        "max_overflow": database_settings.database_max_overflow,
+        "pool_timeout": database_settings.database_pool_timeout_seconds,
+        "pool_recycle": database_settings.database_pool_recycle_seconds,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        # List filters x count modes x the inlined status give more distinct SQL strings
+        # than the driver default of 100; evictions would re-prepare on every call.
+        options["connect_args"] = {
+            "prepared_statement_cache_size": database_settings.database_prepared_statement_cache_size,
+        }
+    return options
+
+
+engine = create_instrumented_engine(database_settings.database_url, "primary", **_engine_options(database_settings.database_url))
+
+replica_engine: AsyncEngine | None = None
+replica_monitor: ReplicaMonitor | None = None
+if database_settings.database_replica_url:
+    replica_engine = create_instrumented_engine(
+        database_settings.database_replica_url,
+        "replica",
+        **_engine_options(database_settings.database_replica_url),
+    )
+    replica_monitor = ReplicaMonitor(
+        replica_engine,
+        max_lag_seconds=database_settings.replica_max_lag_seconds,
+        check_interval_seconds=database_settings.replica_check_interval_seconds,
+        timeout_seconds=database_settings.replica_check_timeout_seconds,
+    )
+
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -19,6 +214,33 @@ async_session_factory = async_sessionmaker(
     autoflush=False,
 )
 
+read_session_factory = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+
+async def prewarm_pools() -> None:
+    """Fill the primary (and replica) pools up to database_pool_size; called from the app lifespan."""
+    for target in (engine, replica_engine):
+        if target is not None:
+            await prewarm_pool(target, database_settings.database_pool_size)
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """Session for read-only handlers: SELECTs go to the replica while it is healthy, else to the primary."""
+    replica = None
+    if replica_engine is not None and replica_monitor is not None and await replica_monitor.is_usable():
+        replica = replica_engine.sync_engine
+    DB_READ_SESSIONS.labels(target="primary" if replica is None else "replica").inc()
+    async with read_session_factory(replica=replica) as session:
+        yield session
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
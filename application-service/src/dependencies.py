@@ -6,10 +6,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_session
 from src.grpc_clients.auth_client import AuthClientProtocol, get_auth_client
+from src.grpc_clients.token_cache import TokenValidationCache, get_token_validation_cache
 from src.repositories.application_document_repository import ApplicationDocumentRepository
 from src.repositories.application_repository import ApplicationRepository
+from src.repositories.approved_leave_roster_repository import ApprovedLeaveRosterRepository
+from src.repositories.resident_directory_repository import ResidentDirectoryRepository
 from src.services.application_service import ApplicationService
-from src.storage.minio_storage import MinioStorage
+from src.storage.document_storage import StorageProtocol, get_storage as get_shared_storage
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -29,8 +32,20 @@ def get_document_repository(
     return ApplicationDocumentRepository(session)
 
 
-def get_storage() -> MinioStorage:
-    return MinioStorage()
+def get_resident_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> ResidentDirectoryRepository:
+    return ResidentDirectoryRepository(session)
+
+
+def get_roster_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> ApprovedLeaveRosterRepository:
+    return ApprovedLeaveRosterRepository(session)
+
+
+def get_storage() -> StorageProtocol:
+    return get_shared_storage()
 
 
 def get_auth_client_dep() -> AuthClientProtocol:
@@ -40,20 +55,29 @@ def get_auth_client_dep() -> AuthClientProtocol:
 def get_application_service(
     app_repo: ApplicationRepository = Depends(get_application_repository),
     doc_repo: ApplicationDocumentRepository = Depends(get_document_repository),
-    storage: MinioStorage = Depends(get_storage),
+    storage: StorageProtocol = Depends(get_storage),
     auth_client: AuthClientProtocol = Depends(get_auth_client_dep),
+    resident_repo: ResidentDirectoryRepository = Depends(get_resident_repository),
+    roster_repo: ApprovedLeaveRosterRepository = Depends(get_roster_repository),
 ) -> ApplicationService:
     return ApplicationService(
         application_repository=app_repo,
         document_repository=doc_repo,
         storage=storage,
         auth_client=auth_client,
+        resident_repository=resident_repo,
+        roster_repository=roster_repo,
     )
 
 
+def get_token_cache_dep() -> TokenValidationCache:
+    return get_token_validation_cache()
+
+
 async def get_current_user(
     authorization: str | None = Header(None),
     auth_client: AuthClientProtocol = Depends(get_auth_client_dep),
+    token_cache: TokenValidationCache = Depends(get_token_cache_dep),
 ) -> tuple[UUID, list[str]]:
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
@@ -66,7 +90,11 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing token",
         )
-    validation = await auth_client.validate_token(token)
+    validation = token_cache.get(token)
+    if validation is None:
+        validation = await auth_client.validate_token(token)
+        if validation and validation.valid:
+            token_cache.put(token, validation)
     if not validation or not validation.valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
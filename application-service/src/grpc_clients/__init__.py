@@ -1,3 +1,16 @@
-from src.grpc_clients.auth_client import AuthClientProtocol, AuthClientStub, get_auth_client
+from src.grpc_clients.auth_client import AuthClientProtocol, AuthClientStub, get_auth_client, get_uncached_auth_client
+from src.grpc_clients.single_flight import CoalescingAuthClient, SingleFlight
+from src.grpc_clients.token_cache import TokenValidationCache, get_token_validation_cache
+from src.grpc_clients.user_info_cache import CachingAuthClient
 
-__all__ = ["AuthClientProtocol", "AuthClientStub", "get_auth_client"]
+__all__ = [
+    "AuthClientProtocol",
+    "AuthClientStub",
+    "CachingAuthClient",
+    "CoalescingAuthClient",
+    "SingleFlight",
+    "TokenValidationCache",
+    "get_auth_client",
+    "get_token_validation_cache",
+    "get_uncached_auth_client",
+]
@@ -38,6 +38,10 @@ class AuthClientProtocol(Protocol):
     async def get_user_info(self, user_id: str) -> UserInfo | None:
         ...
 
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        """Batch variant of get_user_info. Unknown users are absent from the result."""
+        ...
+
     async def get_user_ids(
         self,
         *,
@@ -83,6 +87,14 @@ class AuthClientStub:
             is_minor=False,
         )
 
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        result: dict[str, UserInfo] = {}
+        for user_id in dict.fromkeys(user_ids):
+            info = await self.get_user_info(user_id)
+            if info is not None:
+                result[user_id] = info
+        return result
+
     async def get_user_ids(
         self,
         *,
@@ -98,5 +110,56 @@ class AuthClientStub:
         return [user_id]
 
 
+_auth_client: AuthClientProtocol | None = None
+_uncached_auth_client: AuthClientProtocol | None = None
+
+
 def get_auth_client() -> AuthClientProtocol:
-    return AuthClientStub()
+    """Process-wide auth client, so caches are shared by the gRPC servicer and REST dependencies."""
+    global _auth_client, _uncached_auth_client
+    if _auth_client is None:
+        from src.config import auth_grpc_settings
+        from src.grpc_clients.single_flight import CoalescingAuthClient
+        from src.grpc_clients.user_info_cache import CachingAuthClient
+
+        client: AuthClientProtocol
+        if auth_grpc_settings.use_stub:
+            client = AuthClientStub()
+        else:
+            from src.grpc_clients.auth_grpc_client import AuthGrpcClient
+
+            client = AuthGrpcClient(
+                auth_grpc_settings.grpc_targets,
+                timeout_seconds=auth_grpc_settings.grpc_timeout_seconds,
+                keepalive_time_ms=auth_grpc_settings.grpc_keepalive_time_ms,
+                keepalive_timeout_ms=auth_grpc_settings.grpc_keepalive_timeout_ms,
+                retry_max_attempts=auth_grpc_settings.grpc_retry_max_attempts,
+                fallback_concurrency=auth_grpc_settings.grpc_fallback_concurrency,
+            )
+        if auth_grpc_settings.coalesce_enabled:
+            client = CoalescingAuthClient(client)
+        _uncached_auth_client = client
+        if auth_grpc_settings.user_info_cache_enabled:
+            client = CachingAuthClient(
+                client,
+                max_size=auth_grpc_settings.user_info_cache_max_size,
+                ttl_seconds=auth_grpc_settings.user_info_cache_ttl_seconds,
+                negative_ttl_seconds=auth_grpc_settings.user_info_cache_negative_ttl_seconds,
+            )
+        _auth_client = client
+    return _auth_client
+
+
+def get_uncached_auth_client() -> AuthClientProtocol:
+    """The same channels as get_auth_client() without the user-info cache in front."""
+    get_auth_client()
+    return _uncached_auth_client  # type: ignore[return-value]  # set together with _auth_client
+
+
+async def close_auth_client() -> None:
+    """Close the long-lived auth channels on shutdown."""
+    global _auth_client, _uncached_auth_client
+    client, _auth_client, _uncached_auth_client = _auth_client, None, None
+    close = getattr(client, "close", None)
+    if close is not None:
+        await close()
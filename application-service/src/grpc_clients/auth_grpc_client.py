@@ -0,0 +1,267 @@
+import asyncio
+import itertools
+import json
+import sys
+import zlib
+from pathlib import Path
+
+import grpc
+import structlog
+
+from src.grpc_clients.auth_client import TokenValidation, UserInfo
+from src.middleware.tracing import correlation_id_var, trace_id_var
+
+logger = structlog.get_logger(__name__)
+
+
+def _import_generated() -> tuple[object, object]:
+    """
+    grpcio-tools generates `auth_pb2.py` and `auth_pb2_grpc.py` into
+    `src/grpc_clients/` (see Dockerfile). Like the application server modules,
+    they use absolute imports, so this directory is added to sys.path.
+    """
+    grpc_dir = Path(__file__).resolve().parent
+    if str(grpc_dir) not in sys.path:
+        sys.path.insert(0, str(grpc_dir))
+
+    import auth_pb2  # type: ignore[import-not-found]
+    import auth_pb2_grpc  # type: ignore[import-not-found]
+
+    return auth_pb2, auth_pb2_grpc
+
+
+def _channel_options(
+    *,
+    keepalive_time_ms: int,
+    keepalive_timeout_ms: int,
+    retry_max_attempts: int,
+) -> list[tuple[str, object]]:
+    options: list[tuple[str, object]] = [
+        ("grpc.keepalive_time_ms", keepalive_time_ms),
+        ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+    ]
+    if retry_max_attempts < 2:
+        return [*options, ("grpc.enable_retries", 0)]
+    service_config = {
+        "methodConfig": [
+            {
+                "name": [{"service": "campus.auth.AuthService"}],
+                "retryPolicy": {
+                    "maxAttempts": retry_max_attempts,
+                    "initialBackoff": "0.05s",
+                    "maxBackoff": "0.5s",
+                    "backoffMultiplier": 2,
+                    "retryableStatusCodes": ["UNAVAILABLE"],
+                },
+            }
+        ]
+    }
+    return [
+        *options,
+        ("grpc.enable_retries", 1),
+        ("grpc.service_config", json.dumps(service_config)),
+    ]
+
+
+def _metadata() -> tuple[tuple[str, str], ...]:
+    return (
+        ("x-trace-id", trace_id_var.get()),
+        ("x-correlation-id", correlation_id_var.get()),
+    )
+
+
+def _user_info_from_proto(pb) -> UserInfo:
+    return UserInfo(
+        user_id=pb.user_id,
+        last_name=pb.last_name,
+        first_name=pb.first_name,
+        patronymic=pb.patronymic,
+        building=pb.building,
+        entrance=pb.entrance,
+        floor=pb.floor,
+        room=pb.room,
+        roles=list(pb.roles),
+        phone=pb.phone,
+        email=pb.email,
+        is_minor=pb.is_minor,
+    )
+
+
+class AuthGrpcClient:
+    """
+    AuthClientProtocol implementation over grpc.aio.
+
+    Holds one long-lived channel per target for the whole process. With several
+    targets (auth replicas) user lookups are sharded by user_id, so each replica
+    sees a stable subset of users; token validation is spread round-robin.
+
+    GetUsersInfo is an extension of the tz-0 contract: when auth-service answers
+    UNIMPLEMENTED, batch lookups fall back to at most `fallback_concurrency` parallel
+    GetUserInfo calls, and the batch RPC is not tried again for the process lifetime.
+    """
+
+    def __init__(
+        self,
+        targets: list[str],
+        *,
+        timeout_seconds: float,
+        keepalive_time_ms: int = 30_000,
+        keepalive_timeout_ms: int = 10_000,
+        retry_max_attempts: int = 3,
+        fallback_concurrency: int = 16,
+    ) -> None:
+        if not targets:
+            raise ValueError("At least one auth-service target is required")
+        self._targets = targets
+        self._timeout = timeout_seconds
+        self._options = _channel_options(
+            keepalive_time_ms=keepalive_time_ms,
+            keepalive_timeout_ms=keepalive_timeout_ms,
+            retry_max_attempts=retry_max_attempts,
+        )
+        self._channels: list[grpc.aio.Channel] = []
+        self._stubs: list[object] = []
+        self._round_robin = itertools.count()
+        self._batch_supported = True
+        self._fallback_slots = asyncio.Semaphore(fallback_concurrency)
+        self._pb2, self._pb2_grpc = _import_generated()
+
+    def _ensure_channels(self) -> None:
+        # grpc.aio channels bind to the running loop, so they are opened on first use.
+        if self._stubs:
+            return
+        for target in self._targets:
+            channel = grpc.aio.insecure_channel(target, options=self._options)
+            self._channels.append(channel)
+            self._stubs.append(self._pb2_grpc.AuthServiceStub(channel))
+
+    def _shard_index(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) % len(self._targets)
+
+    def _stub_for(self, key: str):
+        self._ensure_channels()
+        return self._stubs[self._shard_index(key)]
+
+    def _next_stub(self):
+        self._ensure_channels()
+        return self._stubs[next(self._round_robin) % len(self._stubs)]
+
+    async def close(self) -> None:
+        channels, self._channels, self._stubs = self._channels, [], []
+        for channel in channels:
+            await channel.close()
+
+    async def validate_token(self, token: str) -> TokenValidation | None:
+        try:
+            resp = await self._next_stub().ValidateToken(
+                self._pb2.ValidateTokenRequest(token=token),
+                timeout=self._timeout,
+                metadata=_metadata(),
+            )
+        except grpc.aio.AioRpcError as e:
+            if e.code() in (grpc.StatusCode.UNAUTHENTICATED, grpc.StatusCode.INVALID_ARGUMENT):
+                return None
+            logger.error(
+                "grpc_validate_token_failed",
+                grpc_code=e.code().name,
+                grpc_details=e.details(),
+            )
+            raise
+        if not resp.valid:
+            return None
+        return TokenValidation(
+            valid=True,
+            user_id=resp.user_id,
+            roles=list(resp.roles),
+            building=resp.building,
+            entrance=resp.entrance,
+            floor=resp.floor,
+            room=resp.room,
+            is_minor=False,  # not part of ValidateTokenResponse; GetUserInfo is authoritative
+        )
+
+    async def get_user_info(self, user_id: str) -> UserInfo | None:
+        try:
+            resp = await self._stub_for(user_id).GetUserInfo(
+                self._pb2.GetUserInfoRequest(user_id=user_id),
+                timeout=self._timeout,
+                metadata=_metadata(),
+            )
+        except grpc.aio.AioRpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            logger.error(
+                "grpc_get_user_info_failed",
+                grpc_code=e.code().name,
+                grpc_details=e.details(),
+            )
+            raise
+        return _user_info_from_proto(resp)
+
+    async def _get_user_info_bounded(self, user_id: str) -> UserInfo | None:
+        async with self._fallback_slots:
+            return await self.get_user_info(user_id)
+
+    async def _get_users_info_one_by_one(self, user_ids: list[str]) -> list[UserInfo]:
+        found = await asyncio.gather(*(self._get_user_info_bounded(uid) for uid in user_ids))
+        return [info for info in found if info is not None]
+
+    async def _get_users_info_shard(self, stub, user_ids: list[str]) -> list[UserInfo]:
+        if not self._batch_supported:
+            return await self._get_users_info_one_by_one(user_ids)
+        try:
+            resp = await stub.GetUsersInfo(
+                self._pb2.GetUsersInfoRequest(user_ids=user_ids),
+                timeout=self._timeout,
+                metadata=_metadata(),
+            )
+        except grpc.aio.AioRpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                if self._batch_supported:
+                    self._batch_supported = False
+                    logger.warning("grpc_get_users_info_unimplemented_falling_back")
+                return await self._get_users_info_one_by_one(user_ids)
+            logger.error(
+                "grpc_get_users_info_failed",
+                grpc_code=e.code().name,
+                grpc_details=e.details(),
+                batch_size=len(user_ids),
+            )
+            raise
+        return [_user_info_from_proto(u) for u in resp.users]
+
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        unique_ids = list(dict.fromkeys(user_ids))
+        if not unique_ids:
+            return {}
+        self._ensure_channels()
+        by_shard: dict[int, list[str]] = {}
+        for user_id in unique_ids:
+            by_shard.setdefault(self._shard_index(user_id), []).append(user_id)
+        batches = await asyncio.gather(
+            *(self._get_users_info_shard(self._stubs[i], ids) for i, ids in by_shard.items())
+        )
+        return {info.user_id: info for batch in batches for info in batch}
+
+    async def get_user_ids(
+        self,
+        *,
+        entrance: int | None = None,
+        room: str | None = None,
+    ) -> list[str]:
+        try:
+            resp = await self._next_stub().GetUsers(
+                self._pb2.GetUsersRequest(entrance=entrance or 0, room=room or ""),
+                timeout=self._timeout,
+                metadata=_metadata(),
+            )
+        except grpc.aio.AioRpcError as e:
+            logger.error(
+                "grpc_get_users_failed",
+                grpc_code=e.code().name,
+                grpc_details=e.details(),
+            )
+            raise
+        return [u.user_id for u in resp.users]
@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from prometheus_client import Counter
+
+from src.grpc_clients.auth_client import AuthClientProtocol, TokenValidation, UserInfo
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+AUTH_COALESCED_CALLS = Counter(
+    "auth_coalesced_calls_total",
+    "Auth lookups that joined an identical in-flight call instead of issuing a new one",
+    ["method"],
+)
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    In-flight deduplication: concurrent callers for the same key await one shared future.
+
+    The shared call runs as its own task, so a caller that is cancelled (e.g. its
+    gRPC deadline fired) does not cancel the lookup for the others. Keys are
+    forgotten as soon as the call completes; nothing is cached.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._inflight: dict[K, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def _track(self, key: K, future: asyncio.Future[V]) -> None:
+        self._inflight[key] = future
+
+        def _done(f: asyncio.Future[V]) -> None:
+            if self._inflight.get(key) is f:
+                del self._inflight[key]
+            if not f.cancelled():
+                f.exception()  # mark retrieved; callers re-raise it themselves
+
+        future.add_done_callback(_done)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._track(key, future)
+        else:
+            AUTH_COALESCED_CALLS.labels(self._name).inc()
+        return await asyncio.shield(future)
+
+    async def do_many(
+        self,
+        keys: list[K],
+        fn: Callable[[list[K]], Awaitable[dict[K, V]]],
+        default: V,
+    ) -> dict[K, V]:
+        """
+        Batch variant: keys already in flight are joined, the rest are fetched with one
+        fn(missing) call whose per-key results are visible to concurrent do()/do_many().
+        Keys absent from fn's result resolve to default.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        missing = [k for k in unique_keys if k not in self._inflight]
+        joined = len(unique_keys) - len(missing)
+        if joined:
+            AUTH_COALESCED_CALLS.labels(self._name).inc(joined)
+        if missing:
+            loop = asyncio.get_running_loop()
+            batch = asyncio.ensure_future(fn(missing))
+            per_key = {k: loop.create_future() for k in missing}
+
+            def _resolve(task: asyncio.Future[dict[K, V]]) -> None:
+                for k, f in per_key.items():
+                    if task.cancelled():
+                        f.cancel()
+                    elif task.exception() is not None:
+                        f.set_exception(task.exception())  # type: ignore[arg-type]
+                    else:
+                        f.set_result(task.result().get(k, default))
+
+            batch.add_done_callback(_resolve)
+            for k, f in per_key.items():
+                self._track(k, f)
+        futures = {k: self._inflight[k] for k in unique_keys}
+        return {k: await asyncio.shield(future) for k, future in futures.items()}
+
+
+class CoalescingAuthClient:
+    """
+    AuthClientProtocol decorator that deduplicates concurrent identical auth calls.
+
+    GetUserInfo and GetUsersInfo share one key space (user_id), so a batch lookup
+    from ListApplications and a single lookup from GetApprovedLeaves for the same
+    user result in one request to auth-service. Sits under CachingAuthClient:
+    concurrent cache misses for one user collapse into a single RPC.
+    """
+
+    def __init__(self, inner: AuthClientProtocol) -> None:
+        self._inner = inner
+        self._tokens: SingleFlight[str, TokenValidation | None] = SingleFlight("validate_token")
+        self._users: SingleFlight[str, UserInfo | None] = SingleFlight("get_user_info")
+
+    async def close(self) -> None:
+        close = getattr(self._inner, "close", None)
+        if close is not None:
+            await close()
+
+    async def validate_token(self, token: str) -> TokenValidation | None:
+        return await self._tokens.do(token, lambda: self._inner.validate_token(token))
+
+    async def get_user_info(self, user_id: str) -> UserInfo | None:
+        return await self._users.do(user_id, lambda: self._inner.get_user_info(user_id))
+
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        found = await self._users.do_many(user_ids, self._inner.get_users_info, None)  # type: ignore[arg-type]
+        return {k: v for k, v in found.items() if v is not None}
+
+    async def get_user_ids(
+        self,
+        *,
+        entrance: int | None = None,
+        room: str | None = None,
+    ) -> list[str]:
+        return await self._inner.get_user_ids(entrance=entrance, room=room)
@@ -0,0 +1,102 @@
+import base64
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from src.grpc_clients.auth_client import TokenValidation
+
+
+def _token_key(token: str) -> str:
+    """Raw tokens are never kept in memory as keys; only their SHA-256 digest."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _token_expiry(token: str) -> float | None:
+    """Read the `exp` claim from a JWT payload without verifying it (auth-service did that)."""
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload_b64 = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(payload_b64))
+    except (ValueError, TypeError):
+        return None
+    exp = payload.get("exp") if isinstance(payload, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class TokenValidationCache:
+    """
+    Bounded cache of successful ValidateToken results keyed by token hash.
+
+    An entry lives until the earlier of the token's own `exp` and ttl_seconds,
+    so a cached token never outlives its validity. Entries can be revoked per
+    token or for every token of a user.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, TokenValidation]] = OrderedDict()
+
+    def get(self, token: str) -> TokenValidation | None:
+        key = _token_key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, validation = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return validation
+
+    def put(self, token: str, validation: TokenValidation) -> None:
+        if not validation.valid or self._ttl <= 0:
+            return
+        expires_at = self._clock() + self._ttl
+        token_exp = _token_expiry(token)
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+        if expires_at <= self._clock():
+            return
+        key = _token_key(token)
+        self._entries[key] = (expires_at, validation)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def revoke(self, token: str) -> None:
+        self._entries.pop(_token_key(token), None)
+
+    def revoke_user(self, user_id: str) -> None:
+        stale = [key for key, (_, v) in self._entries.items() if v.user_id == user_id]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_token_cache: TokenValidationCache | None = None
+
+
+def get_token_validation_cache() -> TokenValidationCache:
+    global _token_cache
+    if _token_cache is None:
+        from src.config import auth_grpc_settings
+
+        _token_cache = TokenValidationCache(
+            max_size=auth_grpc_settings.token_cache_max_size,
+            ttl_seconds=auth_grpc_settings.token_cache_ttl_seconds,
+        )
+    return _token_cache
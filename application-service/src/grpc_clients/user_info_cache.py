@@ -0,0 +1,128 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from prometheus_client import Counter, Gauge
+
+from src.grpc_clients.auth_client import AuthClientProtocol, TokenValidation, UserInfo
+
+USER_INFO_CACHE_HITS = Counter(
+    "auth_user_info_cache_hits_total",
+    "User info lookups served from the local cache",
+)
+USER_INFO_CACHE_MISSES = Counter(
+    "auth_user_info_cache_misses_total",
+    "User info lookups forwarded to auth-service",
+)
+USER_INFO_CACHE_EVICTIONS = Counter(
+    "auth_user_info_cache_evictions_total",
+    "User info cache entries evicted by the LRU size bound",
+)
+USER_INFO_CACHE_SIZE = Gauge(
+    "auth_user_info_cache_entries",
+    "Current number of entries in the user info cache",
+)
+
+
+class CachingAuthClient:
+    """
+    AuthClientProtocol decorator that keeps GetUserInfo results in a bounded LRU map.
+
+    Entries expire after ttl_seconds; unknown users are cached as None for
+    negative_ttl_seconds so repeated lookups of missing ids do not hit auth-service.
+    Token validation and user id search are passed through unchanged.
+    """
+
+    def __init__(
+        self,
+        inner: AuthClientProtocol,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, UserInfo | None]] = OrderedDict()
+
+    def _lookup(self, user_id: str) -> tuple[bool, UserInfo | None]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return False, None
+        expires_at, info = entry
+        if expires_at <= self._clock():
+            del self._entries[user_id]
+            return False, None
+        self._entries.move_to_end(user_id)
+        return True, info
+
+    def _store(self, user_id: str, info: UserInfo | None) -> None:
+        ttl = self._ttl if info is not None else self._negative_ttl
+        if ttl <= 0:
+            return
+        self._entries[user_id] = (self._clock() + ttl, info)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            USER_INFO_CACHE_EVICTIONS.inc()
+        USER_INFO_CACHE_SIZE.set(len(self._entries))
+
+    def invalidate(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+        USER_INFO_CACHE_SIZE.set(len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        USER_INFO_CACHE_SIZE.set(0)
+
+    async def close(self) -> None:
+        close = getattr(self._inner, "close", None)
+        if close is not None:
+            await close()
+
+    async def validate_token(self, token: str) -> TokenValidation | None:
+        return await self._inner.validate_token(token)
+
+    async def get_user_info(self, user_id: str) -> UserInfo | None:
+        hit, info = self._lookup(user_id)
+        if hit:
+            USER_INFO_CACHE_HITS.inc()
+            return info
+        USER_INFO_CACHE_MISSES.inc()
+        info = await self._inner.get_user_info(user_id)
+        self._store(user_id, info)
+        return info
+
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        result: dict[str, UserInfo] = {}
+        missing: list[str] = []
+        unique_ids = list(dict.fromkeys(user_ids))
+        for user_id in unique_ids:
+            hit, info = self._lookup(user_id)
+            if not hit:
+                missing.append(user_id)
+            elif info is not None:
+                result[user_id] = info
+        USER_INFO_CACHE_HITS.inc(len(unique_ids) - len(missing))
+        if not missing:
+            return result
+        USER_INFO_CACHE_MISSES.inc(len(missing))
+        fetched = await self._inner.get_users_info(missing)
+        for user_id in missing:
+            info = fetched.get(user_id)
+            self._store(user_id, info)
+            if info is not None:
+                result[user_id] = info
+        return result
+
+    async def get_user_ids(
+        self,
+        *,
+        entrance: int | None = None,
+        room: str | None = None,
+    ) -> list[str]:
+        return await self._inner.get_user_ids(entrance=entrance, room=room)
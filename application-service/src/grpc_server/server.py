@@ -1,3 +1,4 @@
+import contextlib
 import sys
 from datetime import date, datetime, timezone
 from pathlib import Path
@@ -6,7 +7,9 @@ import grpc
 import structlog
 
 from src.config import settings
-from src.database import async_session_factory
+from src.constants.count_mode import COUNT_MODE_EXACT
+from src.constants.error_codes import APP_APPLICATION_NOT_FOUND
+from src.database import async_session_factory, read_session
 from src.domain.exceptions import (
     ApplicationAlreadyDecidedError,
     ApplicationNotFoundError,
@@ -25,8 +28,11 @@ from src.grpc_server.grpc_mapping import (
 )
 from src.repositories.application_document_repository import ApplicationDocumentRepository
 from src.repositories.application_repository import ApplicationRepository
+from src.repositories.approved_leave_roster_repository import ApprovedLeaveRosterRepository
+from src.repositories.resident_directory_repository import ResidentDirectoryRepository
 from src.services.application_service import ApplicationService
-from src.storage.minio_storage import MinioStorage
+from src.services.resident_directory import resolve_residents, user_name_from_info
+from src.storage.document_storage import get_storage
 
 logger = structlog.get_logger(__name__)
 
@@ -47,15 +53,6 @@ def _import_generated() -> tuple[object, object]:
     return application_pb2, application_pb2_grpc
 
 
-def _user_name_from_info(info: object | None) -> str | None:
-    if info is None:
-        return None
-    last = getattr(info, "last_name", "") or ""
-    first = getattr(info, "first_name", "") or ""
-    patronymic = getattr(info, "patronymic", "") or ""
-    return f"{last} {first} {patronymic}".strip() or None
-
-
 async def _domain_exception_to_grpc(context, exc: Exception) -> None:
     """Map domain exceptions to gRPC abort. context.abort is a coroutine in aio."""
     if isinstance(exc, ApplicationNotFoundError):
@@ -74,21 +71,34 @@ async def _domain_exception_to_grpc(context, exc: Exception) -> None:
         await context.abort(grpc.StatusCode.INTERNAL, "Internal error")
 
 
+def _leave_records(application_pb2, records: list) -> list:
+    return [
+        application_pb2.LeaveRecord(
+            user_id=user_id,
+            user_name=user_name,
+            room=room,
+            leave_time=leave_time.isoformat(),
+            return_time=return_time.isoformat(),
+            reason=reason,
+        )
+        for (user_id, user_name, room, leave_time, return_time, reason) in records
+    ]
+
+
 class _ApplicationGrpcServicer:
     def __init__(self) -> None:
-        self._storage = MinioStorage()
+        self._storage = get_storage()
         self._auth = get_auth_client()
 
-    async def _get_service(self):
-        async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            yield ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+    def _make_service(self, session) -> ApplicationService:
+        return ApplicationService(
+            application_repository=ApplicationRepository(session),
+            document_repository=ApplicationDocumentRepository(session),
+            storage=self._storage,
+            auth_client=self._auth,
+            resident_repository=ResidentDirectoryRepository(session),
+            roster_repository=ApprovedLeaveRosterRepository(session),
+        )
 
     async def GetApprovedLeaves(self, request, context):
         try:
@@ -100,15 +110,8 @@ class _ApplicationGrpcServicer:
         building = request.building or None
         entrance = int(request.entrance) if request.entrance is not None else 0
 
-        async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            service = ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+        async with read_session() as session:
+            service = self._make_service(session)
             records = await service.get_approved_leaves_for_date(
                 leave_date=leave_date,
                 building=building,
@@ -116,18 +119,31 @@ class _ApplicationGrpcServicer:
             )
 
         application_pb2, _ = _import_generated()
-        leave_records = [
-            application_pb2.LeaveRecord(
-                user_id=user_id,
-                user_name=user_name,
-                room=room,
-                leave_time=leave_time.isoformat(),
-                return_time=return_time.isoformat(),
-                reason=reason,
+        return application_pb2.GetApprovedLeavesResponse(records=_leave_records(application_pb2, records))
+
+    async def GetStudentsOutAt(self, request, context):
+        try:
+            at = (
+                datetime.fromisoformat(request.time.replace("Z", "+00:00"))
+                if request.time
+                else datetime.now(timezone.utc)
             )
-            for (user_id, user_name, room, leave_time, return_time, reason) in records
-        ]
-        return application_pb2.GetApprovedLeavesResponse(records=leave_records)
+        except ValueError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Invalid datetime: {e}")
+            return None
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+
+        async with read_session() as session:
+            service = self._make_service(session)
+            records = await service.get_students_out_at(
+                at=at,
+                building=request.building or None,
+                entrance=request.entrance,
+            )
+
+        application_pb2, _ = _import_generated()
+        return application_pb2.GetStudentsOutAtResponse(records=_leave_records(application_pb2, records))
 
     async def ListApplications(self, request, context):
         application_pb2, _ = _import_generated()
@@ -155,18 +171,13 @@ class _ApplicationGrpcServicer:
         entrance = request.entrance if request.entrance else None
         room = request.room if request.room else None
         status_filter = request.status if request.status else None
+        cursor = request.cursor or None
+        count_mode = request.count_mode or COUNT_MODE_EXACT
 
-        async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            service = ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+        async with read_session() as session:
+            service = self._make_service(session)
             try:
-                items, total = await service.list_applications(
+                items, total, next_cursor = await service.list_applications(
                     user_id=filter_user_id,
                     entrance=entrance if is_educator else None,
                     room=room if is_educator else None,
@@ -175,18 +186,21 @@ class _ApplicationGrpcServicer:
                     date_to=date_to,
                     page=page,
                     size=size,
+                    cursor=cursor,
+                    count_mode=count_mode,
                 )
             except Exception as e:
                 await _domain_exception_to_grpc(context, e)
                 return None  # unreachable when abort raises
 
             pages = (total + size - 1) // size if total else 0
+            users_info = await resolve_residents(self._auth, items)
             enriched = []
             for m in items:
-                user_info = await self._auth.get_user_info(str(m.user_id))
+                user_info = users_info.get(str(m.user_id))
                 proto_app = model_to_application_proto(
                     application_pb2, m,
-                    user_name=_user_name_from_info(user_info),
+                    user_name=user_name_from_info(user_info),
                     room=user_info.room if user_info else None,
                     entrance=user_info.entrance if user_info else None,
                 )
@@ -194,10 +208,11 @@ class _ApplicationGrpcServicer:
 
             return application_pb2.ListApplicationsResponse(
                 items=enriched,
-                total=total,
+                total=total if total is not None else -1,
                 page=page,
                 size=size,
                 pages=pages,
+                next_cursor=next_cursor or "",
             )
 
     async def CreateApplication(self, request, context):
@@ -215,14 +230,7 @@ class _ApplicationGrpcServicer:
             return None
 
         async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            service = ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+            service = self._make_service(session)
             try:
                 model, _ = await service.create_application(
                     user_id=user_id,
@@ -253,15 +261,8 @@ class _ApplicationGrpcServicer:
             await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid application_id")
             return None
 
-        async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            service = ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+        async with read_session() as session:
+            service = self._make_service(session)
             try:
                 app = await service.get_application(
                     application_id=application_id,
@@ -273,14 +274,14 @@ class _ApplicationGrpcServicer:
                 return None
 
             can_decide = any(r in roles for r in ("educator", "educator_head", "admin"))
-            user_info = await self._auth.get_user_info(str(app.user_id))
+            user_info = getattr(app, "resident", None) or await self._auth.get_user_info(str(app.user_id))
             documents = getattr(app, "documents", []) or []
             detail = application_detail_to_proto(
                 application_pb2,
                 app,
                 documents=documents,
                 can_decide=can_decide,
-                user_name=_user_name_from_info(user_info),
+                user_name=user_name_from_info(user_info),
                 room=user_info.room if user_info else None,
                 entrance=user_info.entrance if user_info else None,
             )
@@ -288,7 +289,7 @@ class _ApplicationGrpcServicer:
             if getattr(detail, "base", None) is None:
                 base = model_to_application_proto(
                     application_pb2, app,
-                    user_name=_user_name_from_info(user_info),
+                    user_name=user_name_from_info(user_info),
                     room=user_info.room if user_info else None,
                     entrance=user_info.entrance if user_info else None,
                 )
@@ -319,14 +320,7 @@ class _ApplicationGrpcServicer:
             return None
 
         async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            service = ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+            service = self._make_service(session)
             try:
                 updated = await service.decide_application(
                     application_id=application_id,
@@ -344,6 +338,60 @@ class _ApplicationGrpcServicer:
                 application=model_to_application_proto(application_pb2, updated),
             )
 
+    async def DecideApplications(self, request, context):
+        application_pb2, _ = _import_generated()
+        user_id, roles = get_user_context_from_metadata(context)
+        if not user_id:
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Missing x-user-id")
+            return None
+
+        is_educator = any(r in roles for r in ("educator", "educator_head", "admin"))
+        if not is_educator:
+            await context.abort(grpc.StatusCode.PERMISSION_DENIED, "Forbidden")
+            return None
+
+        status_val = request.status or ""
+        if status_val not in ("approved", "rejected"):
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "status must be approved or rejected")
+            return None
+
+        application_ids = []
+        invalid_ids = []
+        for raw_id in request.application_ids:
+            try:
+                application_ids.append(__import__("uuid").UUID(raw_id))
+            except (ValueError, TypeError):
+                invalid_ids.append(raw_id)
+
+        async with async_session_factory() as session:
+            service = self._make_service(session)
+            try:
+                outcomes = await service.decide_applications(
+                    application_ids=application_ids,
+                    status=status_val,
+                    decided_by=user_id,
+                    decided_at=datetime.now(timezone.utc),
+                    reject_reason=request.reject_reason or None,
+                )
+                await session.commit()
+            except Exception as e:
+                await _domain_exception_to_grpc(context, e)
+                return None
+
+            results = [
+                application_pb2.DecisionResult(
+                    application_id=str(application_id),
+                    application=model_to_application_proto(application_pb2, updated) if updated is not None else None,
+                    error_code=error_code or "",
+                )
+                for application_id, updated, error_code in outcomes
+            ]
+            results.extend(
+                application_pb2.DecisionResult(application_id=raw_id, error_code=APP_APPLICATION_NOT_FOUND)
+                for raw_id in invalid_ids
+            )
+            return application_pb2.DecideApplicationsResponse(results=results)
+
     async def UploadDocument(self, request, context):
         application_pb2, _ = _import_generated()
         user_id, _ = get_user_context_from_metadata(context)
@@ -363,14 +411,7 @@ class _ApplicationGrpcServicer:
         document_type = request.document_type or ""
 
         async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            service = ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+            service = self._make_service(session)
             try:
                 doc = await service.upload_document(
                     application_id=application_id,
@@ -388,6 +429,117 @@ class _ApplicationGrpcServicer:
 
             return application_pb2.UploadDocumentResponse(document=doc_proto)
 
+    async def UploadDocumentStream(self, request_iterator, context):
+        application_pb2, _ = _import_generated()
+        user_id, _ = get_user_context_from_metadata(context)
+        if not user_id:
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Missing x-user-id")
+            return None
+
+        first = await anext(request_iterator, None)
+        if first is None or first.WhichOneof("payload") != "header":
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "First message must be the upload header")
+            return None
+        header = first.header
+        try:
+            application_id = __import__("uuid").UUID(header.application_id)
+        except (ValueError, TypeError):
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid application_id")
+            return None
+
+        async def _chunks():
+            async for message in request_iterator:
+                if message.WhichOneof("payload") != "data":
+                    raise ValidationError("Only file data may follow the upload header")
+                yield message.data
+
+        async with async_session_factory() as session:
+            service = self._make_service(session)
+            try:
+                doc = await service.upload_document_stream(
+                    application_id=application_id,
+                    document_type=header.document_type or "",
+                    chunks=_chunks(),
+                    content_type=header.content_type or "application/octet-stream",
+                    filename=header.filename or "file",
+                    uploaded_by=user_id,
+                )
+                doc_proto = model_to_document_proto(application_pb2, doc)
+                await session.commit()
+            except Exception as e:
+                await _domain_exception_to_grpc(context, e)
+                return None
+
+            return application_pb2.UploadDocumentResponse(document=doc_proto)
+
+    async def CreateUploadSession(self, request, context):
+        application_pb2, _ = _import_generated()
+        user_id, _ = get_user_context_from_metadata(context)
+        if not user_id:
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Missing x-user-id")
+            return None
+
+        try:
+            application_id = __import__("uuid").UUID(request.application_id)
+        except (ValueError, TypeError):
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid application_id")
+            return None
+
+        async with read_session() as session:
+            service = self._make_service(session)
+            try:
+                upload = await service.create_upload_session(
+                    application_id=application_id,
+                    document_type=request.document_type or "",
+                    content_type=request.content_type or "application/octet-stream",
+                    filename=request.filename or "file",
+                    uploaded_by=user_id,
+                    size=request.size,
+                )
+            except Exception as e:
+                await _domain_exception_to_grpc(context, e)
+                return None
+
+        return application_pb2.CreateUploadSessionResponse(
+            document_id=upload.document_id,
+            url=upload.url,
+            fields=upload.fields,
+            max_size=upload.max_size,
+            expires_at=upload.expires_at.isoformat(),
+        )
+
+    async def ConfirmUpload(self, request, context):
+        application_pb2, _ = _import_generated()
+        user_id, _ = get_user_context_from_metadata(context)
+        if not user_id:
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Missing x-user-id")
+            return None
+
+        try:
+            application_id = __import__("uuid").UUID(request.application_id)
+            document_id = __import__("uuid").UUID(request.document_id)
+        except (ValueError, TypeError):
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid application_id or document_id")
+            return None
+
+        async with async_session_factory() as session:
+            service = self._make_service(session)
+            try:
+                doc = await service.confirm_upload(
+                    application_id=application_id,
+                    document_id=document_id,
+                    document_type=request.document_type or "",
+                    filename=request.filename or "file",
+                    uploaded_by=user_id,
+                )
+                doc_proto = model_to_document_proto(application_pb2, doc)
+                await session.commit()
+            except Exception as e:
+                await _domain_exception_to_grpc(context, e)
+                return None
+
+            return application_pb2.UploadDocumentResponse(document=doc_proto)
+
     async def GetDocumentDownloadUrl(self, request, context):
         application_pb2, _ = _import_generated()
         user_id, roles = get_user_context_from_metadata(context)
@@ -402,15 +554,8 @@ class _ApplicationGrpcServicer:
             await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid application_id or document_id")
             return None
 
-        async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            service = ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+        async with read_session() as session:
+            service = self._make_service(session)
             try:
                 url = await service.get_document_download_url(
                     application_id=application_id,
@@ -424,6 +569,59 @@ class _ApplicationGrpcServicer:
 
             return application_pb2.GetDocumentDownloadUrlResponse(url=url)
 
+    async def DownloadDocument(self, request, context):
+        application_pb2, _ = _import_generated()
+        user_id, roles = get_user_context_from_metadata(context)
+        if not user_id:
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Missing x-user-id")
+            return
+
+        try:
+            application_id = __import__("uuid").UUID(request.application_id)
+            document_id = __import__("uuid").UUID(request.document_id)
+        except (ValueError, TypeError):
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Invalid application_id or document_id")
+            return
+
+        # Only the lookup needs the database; the session is released before streaming.
+        async with read_session() as session:
+            service = self._make_service(session)
+            try:
+                info, chunks = await service.open_document_file(
+                    application_id=application_id,
+                    document_id=document_id,
+                    current_user_id=user_id,
+                    current_user_roles=roles,
+                    range_header=request.range,
+                    if_none_match=request.if_none_match,
+                )
+            except Exception as e:
+                await _domain_exception_to_grpc(context, e)
+                return
+
+        # A client that goes away cancels the stream at a yield; the storage response
+        # behind `chunks` is closed right there instead of whenever it is collected.
+        try:
+            yield application_pb2.DownloadDocumentChunk(
+                info=application_pb2.DocumentFileInfo(
+                    filename=info.filename,
+                    content_type=info.content_type,
+                    size=info.size,
+                    etag=info.etag,
+                    partial=info.partial,
+                    range_start=info.range_start,
+                    range_end=info.range_end,
+                    not_modified=info.not_modified,
+                    range_not_satisfiable=info.range_not_satisfiable,
+                )
+            )
+            if chunks is not None:
+                async for chunk in chunks:
+                    yield application_pb2.DownloadDocumentChunk(data=chunk)
+        finally:
+            if chunks is not None:
+                await chunks.aclose()
+
     async def DeleteDocument(self, request, context):
         application_pb2, _ = _import_generated()
         user_id, roles = get_user_context_from_metadata(context)
@@ -439,14 +637,7 @@ class _ApplicationGrpcServicer:
             return None
 
         async with async_session_factory() as session:
-            app_repo = ApplicationRepository(session)
-            doc_repo = ApplicationDocumentRepository(session)
-            service = ApplicationService(
-                application_repository=app_repo,
-                document_repository=doc_repo,
-                storage=self._storage,
-                auth_client=self._auth,
-            )
+            service = self._make_service(session)
             try:
                 await service.delete_document(
                     application_id=application_id,
@@ -480,6 +671,9 @@ async def create_and_start_grpc_server() -> grpc.aio.Server | None:
         async def GetApprovedLeaves(self, request, context):
             return await servicer.GetApprovedLeaves(request, context)
 
+        async def GetStudentsOutAt(self, request, context):
+            return await servicer.GetStudentsOutAt(request, context)
+
         async def ListApplications(self, request, context):
             return await servicer.ListApplications(request, context)
 
@@ -492,12 +686,29 @@ async def create_and_start_grpc_server() -> grpc.aio.Server | None:
         async def DecideApplication(self, request, context):
             return await servicer.DecideApplication(request, context)
 
+        async def DecideApplications(self, request, context):
+            return await servicer.DecideApplications(request, context)
+
         async def UploadDocument(self, request, context):
             return await servicer.UploadDocument(request, context)
 
+        async def UploadDocumentStream(self, request_iterator, context):
+            return await servicer.UploadDocumentStream(request_iterator, context)
+
+        async def CreateUploadSession(self, request, context):
+            return await servicer.CreateUploadSession(request, context)
+
+        async def ConfirmUpload(self, request, context):
+            return await servicer.ConfirmUpload(request, context)
+
         async def GetDocumentDownloadUrl(self, request, context):
             return await servicer.GetDocumentDownloadUrl(request, context)
 
+        async def DownloadDocument(self, request, context):
+            async with contextlib.aclosing(servicer.DownloadDocument(request, context)) as stream:
+                async for chunk in stream:
+                    yield chunk
+
         async def DeleteDocument(self, request, context):
             return await servicer.DeleteDocument(request, context)
 
@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 import logging
 import sys
 
@@ -7,8 +9,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 from contextlib import asynccontextmanager
 
-from src.config import settings
+from src.config import database_settings, settings
+from src.database import prewarm_pools
+from src.grpc_clients.auth_client import close_auth_client
 from src.grpc_server.server import create_and_start_grpc_server
+from src.services.partition_maintenance import run_partition_maintenance
+from src.services.resident_directory import run_resident_directory_refresh
+from src.storage.document_storage import close_storage, init_storage
 
 # Logging: console always; Loki when LOKI_URL is set
 log_handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
@@ -52,12 +59,44 @@ structlog.configure(
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if database_settings.database_pool_prewarm:
+        try:
+            await prewarm_pools()
+        except Exception as e:  # noqa: BLE001
+            structlog.get_logger(__name__).warning("db_pool_prewarm_failed", error=str(e))
+    await init_storage()
     grpc_server = await create_and_start_grpc_server()
+    refresh_task: asyncio.Task | None = None
+    if settings.resident_refresh_interval_seconds > 0:
+        refresh_task = asyncio.create_task(
+            run_resident_directory_refresh(
+                interval_seconds=settings.resident_refresh_interval_seconds,
+                max_age_seconds=settings.resident_max_age_seconds,
+                batch_size=settings.resident_refresh_batch_size,
+            )
+        )
+    partition_task: asyncio.Task | None = None
+    if settings.partition_maintenance_interval_seconds > 0:
+        partition_task = asyncio.create_task(
+            run_partition_maintenance(
+                interval_seconds=settings.partition_maintenance_interval_seconds,
+                months_ahead=settings.partition_months_ahead,
+                archive_after_months=settings.partition_archive_after_months,
+                archive_tablespace=settings.partition_archive_tablespace,
+            )
+        )
     try:
         yield
     finally:
+        for task in (refresh_task, partition_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
         if grpc_server is not None:
             await grpc_server.stop(grace=5)
+        await close_auth_client()
+        await close_storage()
 
 
 app = FastAPI(
@@ -1,11 +1,19 @@
 from src.models.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
+from src.models.ids import uuid7
 from src.models.application import ApplicationModel
 from src.models.application_document import ApplicationDocumentModel
+from src.models.application_leave_time import ApplicationLeaveTimeModel
+from src.models.resident_directory import ResidentDirectoryModel
+from src.models.approved_leave_roster import ApprovedLeaveRosterModel
 
 __all__ = [
     "Base",
     "UUIDPrimaryKeyMixin",
     "TimestampMixin",
+    "uuid7",
     "ApplicationModel",
     "ApplicationDocumentModel",
+    "ApplicationLeaveTimeModel",
+    "ResidentDirectoryModel",
+    "ApprovedLeaveRosterModel",
 ]
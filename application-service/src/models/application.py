@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, String, Text, Boolean, func
+from sqlalchemy import DateTime, Index, String, Text, Boolean, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,13 +13,15 @@ from src.models.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
 class ApplicationModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "applications"
 
-    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False, index=True)
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
     is_minor: Mapped[bool] = mapped_column(Boolean, nullable=False)
-    leave_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    # Part of the primary key because PostgreSQL partitions the table by leave_time month
+    # and a partitioned table's unique constraints must contain the partition key.
+    leave_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True, index=True)
     return_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     reason: Mapped[str] = mapped_column(Text, nullable=False)
     contact_phone: Mapped[str] = mapped_column(String(20), nullable=False)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending", index=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
     decided_by: Mapped[UUID | None] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
     decided_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     reject_reason: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -29,3 +31,35 @@ class ApplicationModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         back_populates="application",
         cascade="all, delete-orphan",
     )
+    # Not a foreign key: directory rows are refreshed from auth-service independently.
+    # Loaded explicitly (contains_eager / joinedload) by the repository; lazy access raises.
+    # Tombstones (empty full_name) are left out, so they neither match the entrance/room
+    # filter nor stop enrichment from asking auth-service again.
+    resident: Mapped["ResidentDirectoryModel | None"] = relationship(
+        "ResidentDirectoryModel",
+        primaryjoin=(
+            "and_(foreign(ApplicationModel.user_id) == ResidentDirectoryModel.user_id, "
+            "ResidentDirectoryModel.full_name != '')"
+        ),
+        viewonly=True,
+        lazy="raise",
+    )
+
+
+# Indexes matched to the list/leave queries (see docs/DATABASE.md, section 5).
+# user_id and status alone are served by the leading columns of the composites.
+Index("ix_applications_created_at_id", ApplicationModel.created_at, ApplicationModel.id)
+Index(
+    "ix_applications_user_id_created_at",
+    ApplicationModel.user_id,
+    ApplicationModel.created_at.desc(),
+    ApplicationModel.id.desc(),
+)
+Index("ix_applications_status_leave_time", ApplicationModel.status, ApplicationModel.leave_time)
+Index(
+    "ix_applications_pending_created_at",
+    ApplicationModel.created_at.desc(),
+    ApplicationModel.id.desc(),
+    postgresql_where=ApplicationModel.status == "pending",
+    sqlite_where=ApplicationModel.status == "pending",
+)
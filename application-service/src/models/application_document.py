@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import DateTime, ForeignKeyConstraint, String, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,13 +12,19 @@ from src.models.base import Base, UUIDPrimaryKeyMixin, TimestampMixin
 
 class ApplicationDocumentModel(Base, UUIDPrimaryKeyMixin, TimestampMixin):
     __tablename__ = "application_documents"
-
-    application_id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True),
-        ForeignKey("applications.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["application_id", "application_leave_time"],
+            ["applications.id", "applications.leave_time"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
     )
+
+    application_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False, index=True)
+    # Copy of the parent's partition key: documents are partitioned by the same month
+    # as their application, so both halves of a month are detached and archived together.
+    application_leave_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
     document_type: Mapped[str] = mapped_column(String(30), nullable=False)
     file_url: Mapped[str] = mapped_column(String(500), nullable=False)
     uploaded_by: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
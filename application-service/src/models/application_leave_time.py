@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DDL, DateTime, event
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class ApplicationLeaveTimeModel(Base):
+    """
+    application id -> leave_time, outside the partitioned applications table.
+
+    Requests only carry the application id, and on its own the id matches a primary key
+    index in every month's partition. Id lookups read the partition key from here first
+    so PostgreSQL scans a single partition. Rows are written by an INSERT trigger on
+    applications (see LEAVE_TIME_DDL) and removed when their month is archived.
+    """
+
+    __tablename__ = "application_leave_times"
+
+    application_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    leave_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+# leave_time is part of the applications primary key and is never updated, so an
+# INSERT trigger keeps the lookup complete (rows moved between partitions by
+# partition maintenance are copied before ATTACH and do not fire it).
+LEAVE_TIME_DDL = {
+    "postgresql": (
+        """
+        CREATE OR REPLACE FUNCTION application_leave_times_sync() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO application_leave_times (application_id, leave_time) VALUES (NEW.id, NEW.leave_time);
+            RETURN NULL;
+        END
+        $$
+        """,
+        "CREATE TRIGGER applications_leave_times_insert AFTER INSERT ON applications "
+        "FOR EACH ROW EXECUTE FUNCTION application_leave_times_sync()",
+    ),
+    "sqlite": (
+        "CREATE TRIGGER applications_leave_times_insert AFTER INSERT ON applications BEGIN "
+        "INSERT INTO application_leave_times (application_id, leave_time) VALUES (NEW.id, NEW.leave_time); END",
+    ),
+}
+for _dialect, _statements in LEAVE_TIME_DDL.items():
+    for _statement in _statements:
+        # On the metadata, not the table: the trigger needs both tables to exist.
+        event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect=_dialect))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import DDL, Date, DateTime, Index, Integer, String, Text, event
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class ApprovedLeaveRosterModel(Base):
+    """
+    Denormalized roster of approved leaves for GetApprovedLeaves, written in the same
+    transaction as the approve decision. Resident fields are copied from
+    resident_directory at approval and rewritten for upcoming leaves whenever the
+    directory row is updated; "" / 0 mean the resident was unknown and match any
+    building/entrance.
+
+    On PostgreSQL the table also has `leave_period`, a generated
+    tstzrange(leave_time, return_time, '[)') with a GiST index for "who is out at t"
+    (see LEAVE_PERIOD_DDL); it is not mapped because other dialects cannot create it.
+    """
+
+    __tablename__ = "approved_leave_roster"
+    __table_args__ = (
+        Index("ix_approved_leave_roster_date_building_entrance", "leave_date", "building", "entrance"),
+        Index("ix_approved_leave_roster_user_id_leave_date", "user_id", "leave_date"),
+    )
+
+    application_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
+    leave_date: Mapped[date] = mapped_column(Date, nullable=False)
+    building: Mapped[str] = mapped_column(String(10), nullable=False)
+    entrance: Mapped[int] = mapped_column(Integer, nullable=False)
+    room: Mapped[str] = mapped_column(String(10), nullable=False)
+    user_name: Mapped[str] = mapped_column(String(300), nullable=False)
+    leave_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    return_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    reason: Mapped[str] = mapped_column(Text, nullable=False)
+
+
+LEAVE_PERIOD_DDL = (
+    "ALTER TABLE approved_leave_roster ADD COLUMN leave_period tstzrange "
+    "GENERATED ALWAYS AS (tstzrange(leave_time, return_time, '[)')) STORED",
+    "CREATE INDEX ix_approved_leave_roster_leave_period ON approved_leave_roster USING gist (leave_period)",
+)
+for _statement in LEAVE_PERIOD_DDL:
+    event.listen(
+        ApprovedLeaveRosterModel.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
@@ -1,20 +1,24 @@
 from datetime import datetime
-from uuid import uuid4
-
 from sqlalchemy import DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
+from src.models.ids import uuid7
+
 
 class Base(DeclarativeBase):
     pass
 
 
 class UUIDPrimaryKeyMixin:
+    # insert_sentinel: the client-generated id alone matches the rows of a multi-row
+    # INSERT ... RETURNING, also for tables whose primary key adds a timestamp
+    # (partition key) that some drivers return with a different tzinfo.
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
+        insert_sentinel=True,
     )
 
 
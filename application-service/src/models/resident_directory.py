@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, Index, Integer, String, func
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class ResidentDirectoryModel(Base):
+    """Local projection of auth-service user data used to filter, sort and enrich applications."""
+
+    __tablename__ = "resident_directory"
+    __table_args__ = (
+        Index("ix_resident_directory_entrance_room", "entrance", "room"),
+        Index("ix_resident_directory_refreshed_at", "refreshed_at"),
+    )
+
+    user_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True)
+    building: Mapped[str] = mapped_column(String(10), nullable=False)
+    entrance: Mapped[int] = mapped_column(Integer, nullable=False)
+    room: Mapped[str] = mapped_column(String(10), nullable=False)
+    full_name: Mapped[str] = mapped_column(String(300), nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -1,25 +1,39 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, lambda_stmt, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.models.application import ApplicationModel
 from src.models.application_document import ApplicationDocumentModel
 
 
 class ApplicationDocumentRepository:
+    """
+    `application_leave_time` arguments are the parent application's leave_time. The
+    table is partitioned by it, so passing it lets PostgreSQL touch one partition
+    instead of probing every month's index for the id.
+    """
+
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def get_by_id(self, document_id: UUID) -> ApplicationDocumentModel | None:
-        result = await self._session.execute(
-            select(ApplicationDocumentModel).where(ApplicationDocumentModel.id == document_id)
-        )
+    async def get_by_id(
+        self, document_id: UUID, application_leave_time: datetime | None = None
+    ) -> ApplicationDocumentModel | None:
+        stmt = lambda_stmt(lambda: select(ApplicationDocumentModel).where(ApplicationDocumentModel.id == document_id))
+        if application_leave_time is not None:
+            stmt += lambda s: s.where(ApplicationDocumentModel.application_leave_time == application_leave_time)
+        result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def get_by_application_id(self, application_id: UUID) -> list[ApplicationDocumentModel]:
         result = await self._session.execute(
-            select(ApplicationDocumentModel).where(
-                ApplicationDocumentModel.application_id == application_id
+            lambda_stmt(
+                lambda: select(ApplicationDocumentModel).where(
+                    ApplicationDocumentModel.application_id == application_id
+                )
             )
         )
         return list(result.scalars().all())
@@ -31,36 +45,77 @@ class ApplicationDocumentRepository:
         file_url: str,
         uploaded_by: UUID,
         document_id: UUID | None = None,
+        application_leave_time: datetime | None = None,
     ) -> ApplicationDocumentModel:
-        kwargs: dict = {
+        values: dict = {
             "application_id": application_id,
+            "application_leave_time": application_leave_time
+            if application_leave_time is not None
+            else select(ApplicationModel.leave_time).where(ApplicationModel.id == application_id).scalar_subquery(),
             "document_type": document_type,
             "file_url": file_url,
             "uploaded_by": uploaded_by,
         }
         if document_id is not None:
-            kwargs["id"] = document_id
-        model = ApplicationDocumentModel(**kwargs)
-        self._session.add(model)
-        await self._session.flush()
-        await self._session.refresh(model)
-        return model
+            values["id"] = document_id
+        # One INSERT ... RETURNING hydrates the model, server defaults included.
+        result = await self._session.execute(
+            insert(ApplicationDocumentModel).values(**values).returning(ApplicationDocumentModel)
+        )
+        return result.scalar_one()
 
-    async def count_voice_messages_for_application(self, application_id: UUID) -> int:
+    async def create_if_absent(
+        self,
+        document_id: UUID,
+        application_id: UUID,
+        application_leave_time: datetime,
+        document_type: str,
+        file_url: str,
+        uploaded_by: UUID,
+    ) -> ApplicationDocumentModel | None:
+        """
+        Insert a document with a client-known id; None when a row with that id already
+        exists (e.g. a concurrent confirm), without aborting the caller's transaction.
+        """
+        dialect = self._session.bind.dialect.name
+        stmt = (
+            (sqlite if dialect == "sqlite" else postgresql)
+            .insert(ApplicationDocumentModel)
+            .values(
+                id=document_id,
+                application_id=application_id,
+                application_leave_time=application_leave_time,
+                document_type=document_type,
+                file_url=file_url,
+                uploaded_by=uploaded_by,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[ApplicationDocumentModel.id, ApplicationDocumentModel.application_leave_time]
+            )
+            .returning(ApplicationDocumentModel)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def count_voice_messages_for_application(
+        self, application_id: UUID, application_leave_time: datetime | None = None
+    ) -> int:
         from sqlalchemy import func
 
-        result = await self._session.execute(
-            select(func.count()).select_from(ApplicationDocumentModel).where(
-                ApplicationDocumentModel.application_id == application_id,
-                ApplicationDocumentModel.document_type == "voice_message",
-            )
+        q = select(func.count()).select_from(ApplicationDocumentModel).where(
+            ApplicationDocumentModel.application_id == application_id,
+            ApplicationDocumentModel.document_type == "voice_message",
         )
+        if application_leave_time is not None:
+            q = q.where(ApplicationDocumentModel.application_leave_time == application_leave_time)
+        result = await self._session.execute(q)
         return result.scalar() or 0
 
-    async def delete(self, document_id: UUID) -> bool:
+    async def delete(self, document_id: UUID, application_leave_time: datetime | None = None) -> bool:
         from sqlalchemy import delete
 
-        result = await self._session.execute(
-            delete(ApplicationDocumentModel).where(ApplicationDocumentModel.id == document_id)
-        )
+        q = delete(ApplicationDocumentModel).where(ApplicationDocumentModel.id == document_id)
+        if application_leave_time is not None:
+            q = q.where(ApplicationDocumentModel.application_leave_time == application_leave_time)
+        result = await self._session.execute(q)
         return result.rowcount > 0
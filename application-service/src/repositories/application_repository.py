@@ -1,11 +1,58 @@
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, exists, func, insert, lambda_stmt, literal, select, text, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, joinedload, selectinload
 
+from src.constants.count_mode import COUNT_MODE_ESTIMATED, COUNT_MODE_EXACT, COUNT_MODE_WINDOW
+from src.constants.document_type import DOCUMENT_TYPE_VOICE_MESSAGE
 from src.models.application import ApplicationModel
+from src.models.application_document import ApplicationDocumentModel
+from src.models.application_leave_time import ApplicationLeaveTimeModel
+from src.models.resident_directory import ResidentDirectoryModel
+
+
+# Read paths use lambda_stmt: SQLAlchemy caches the statement under the lambda's code
+# location, so a call only extracts the bound values from the closure instead of
+# rebuilding the select and re-deriving its cache key. Closure variables that are SQL
+# elements (the filter criteria, the window subquery) become part of the cache key.
+
+
+# Exclusion constraint on application_leave_periods (alembic revision 008): one user
+# cannot hold two pending/approved applications with overlapping [leave_time, return_time).
+LEAVE_OVERLAP_CONSTRAINT = "ex_application_leave_periods_user_overlap"
+EXCLUSION_VIOLATION_SQLSTATE = "23P01"
+
+
+def is_leave_overlap(exc: IntegrityError) -> bool:
+    """
+    Decided by the error's fields, not its (localizable) message: the driver error behind
+    SQLAlchemy's DBAPI adapter carries the SQLSTATE and the violated constraint.
+    """
+    cause = exc.orig.__cause__ if exc.orig is not None else None
+    constraint = getattr(cause, "constraint_name", None)
+    if constraint is not None:
+        return constraint == LEAVE_OVERLAP_CONSTRAINT
+    sqlstate = getattr(exc.orig, "sqlstate", None) or getattr(cause, "sqlstate", None)
+    return sqlstate == EXCLUSION_VIOLATION_SQLSTATE
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def _leave_time_of(application_id: UUID):
+    """
+    The application's partition key from the unpartitioned lookup table. Compared with
+    leave_time it becomes an InitPlan, which PostgreSQL uses to prune partitions at run time.
+    """
+    return (
+        select(ApplicationLeaveTimeModel.leave_time)
+        .where(ApplicationLeaveTimeModel.application_id == application_id)
+        .scalar_subquery()
+    )
 
 
 class ApplicationRepository:
@@ -14,7 +61,12 @@ class ApplicationRepository:
 
     async def get_by_id(self, application_id: UUID) -> ApplicationModel | None:
         result = await self._session.execute(
-            select(ApplicationModel).where(ApplicationModel.id == application_id)
+            lambda_stmt(
+                lambda: select(ApplicationModel).where(
+                    ApplicationModel.id == application_id,
+                    ApplicationModel.leave_time == _leave_time_of(application_id),
+                )
+            )
         )
         return result.scalar_one_or_none()
 
@@ -22,9 +74,17 @@ class ApplicationRepository:
         self, application_id: UUID
     ) -> ApplicationModel | None:
         result = await self._session.execute(
-            select(ApplicationModel)
-            .where(ApplicationModel.id == application_id)
-            .options(selectinload(ApplicationModel.documents))
+            lambda_stmt(
+                lambda: select(ApplicationModel)
+                .where(
+                    ApplicationModel.id == application_id,
+                    ApplicationModel.leave_time == _leave_time_of(application_id),
+                )
+                .options(
+                    selectinload(ApplicationModel.documents),
+                    joinedload(ApplicationModel.resident),
+                )
+            )
         )
         return result.scalar_one_or_none()
 
@@ -33,53 +93,137 @@ class ApplicationRepository:
         *,
         user_id: UUID | None = None,
         user_ids: list[UUID] | None = None,
+        entrance: int | None = None,
+        room: str | None = None,
         status: str | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
         page: int = 1,
         size: int = 20,
-    ) -> tuple[list[ApplicationModel], int]:
+        after: tuple[datetime, UUID] | None = None,
+        count_mode: str = COUNT_MODE_EXACT,
+    ) -> tuple[list[ApplicationModel], int | None, bool]:
+        """
+        Returns (rows, total, has_more). Rows are ordered by (created_at, id) descending.
+
+        With `after` (keyset mode) the page starts right after that (created_at, id)
+        position via a seek predicate and `page` is ignored; otherwise OFFSET is used.
+        Entrance/room filters are resolved against resident_directory in the same
+        query; directory rows are also loaded into `resident` for enrichment.
+
+        count_mode (see src.constants.count_mode) decides how `total` is obtained:
+        exact runs a separate COUNT(*), window counts in the page query, estimated
+        reads planner statistics when nothing is filtered, has_more returns None.
+        """
         if user_ids is not None and len(user_ids) == 0:
-            return [], 0
-        q = select(ApplicationModel)
-        count_q = select(func.count()).select_from(ApplicationModel)
+            return [], 0, False
         conditions = []
         if user_id is not None:
             conditions.append(ApplicationModel.user_id == user_id)
         if user_ids is not None:
             conditions.append(ApplicationModel.user_id.in_(user_ids))
+        if entrance is not None:
+            conditions.append(ResidentDirectoryModel.entrance == entrance)
+        if room is not None:
+            conditions.append(ResidentDirectoryModel.room == room)
         if status is not None:
-            conditions.append(ApplicationModel.status == status)
+            # Rendered inline (3 possible values) so the planner can match the partial
+            # index on status = 'pending'; a bound parameter hides it from a generic plan.
+            conditions.append(ApplicationModel.status == literal(status, literal_execute=True))
+        # Half-open UTC ranges on the bare column keep the predicate sargable.
         if date_from is not None:
-            conditions.append(func.date(ApplicationModel.leave_time) >= date_from)
+            conditions.append(ApplicationModel.leave_time >= _day_start(date_from))
         if date_to is not None:
-            conditions.append(func.date(ApplicationModel.leave_time) <= date_to)
-        if conditions:
-            q = q.where(and_(*conditions))
-            count_q = count_q.where(and_(*conditions))
-        total_result = await self._session.execute(count_q)
-        total = total_result.scalar() or 0
-        q = q.order_by(ApplicationModel.created_at.desc()).offset((page - 1) * size).limit(size)
+            conditions.append(ApplicationModel.leave_time < _day_start(date_to + timedelta(days=1)))
+        joins_resident = entrance is not None or room is not None
+
+        total: int | None = None
+        if count_mode == COUNT_MODE_ESTIMATED:
+            if conditions:
+                count_mode = COUNT_MODE_WINDOW
+            else:
+                total = await self._estimate_total()
+                if total is None:
+                    count_mode = COUNT_MODE_EXACT
+        if count_mode == COUNT_MODE_EXACT:
+            total = await self._count(conditions, joins_resident)
+
+        q = lambda_stmt(
+            lambda: select(ApplicationModel)
+            .outerjoin(ApplicationModel.resident)
+            .options(contains_eager(ApplicationModel.resident))
+        )
+        criteria = and_(*conditions) if conditions else None
+        if count_mode == COUNT_MODE_WINDOW:
+            # Counted before the seek predicate/OFFSET, so total covers every match.
+            counted = (
+                select(ApplicationModel.id, func.count().over().label("total"))
+                .select_from(ApplicationModel)
+            )
+            if joins_resident:
+                counted = counted.join(ApplicationModel.resident)
+            if criteria is not None:
+                counted = counted.where(criteria)
+            counted_sq = counted.subquery()
+            q += lambda s: s.add_columns(counted_sq.c.total).join(counted_sq, counted_sq.c.id == ApplicationModel.id)
+        elif criteria is not None:
+            q += lambda s: s.where(criteria)
+        if after is not None:
+            after_created_at, after_id = after
+            q += lambda s: s.where(tuple_(ApplicationModel.created_at, ApplicationModel.id) < tuple_(after_created_at, after_id))
+        else:
+            offset = (page - 1) * size
+            q += lambda s: s.offset(offset)
+        limit = size + 1
+        q += lambda s: s.order_by(ApplicationModel.created_at.desc(), ApplicationModel.id.desc()).limit(limit)
         result = await self._session.execute(q)
-        rows = list(result.scalars().all())
-        return rows, total
+        if count_mode == COUNT_MODE_WINDOW:
+            pairs = result.all()
+            rows = [row[0] for row in pairs]
+            if pairs:
+                total = pairs[0][1]
+            elif after is None and page == 1:
+                total = 0
+            else:
+                # Past the last row the window has nothing to report.
+                total = await self._count(conditions, joins_resident)
+        else:
+            rows = list(result.scalars().all())
+        return rows[:size], total, len(rows) > size
 
-    async def get_approved_for_leave_date(
-        self,
-        leave_date: date,
-        building: str | None = None,
-    ) -> list[ApplicationModel]:
-        start = datetime.combine(leave_date, datetime.min.time())
-        end = datetime.combine(leave_date, datetime.max.time())
-        q = select(ApplicationModel).where(
-            and_(
-                ApplicationModel.status == "approved",
-                ApplicationModel.leave_time >= start,
-                ApplicationModel.leave_time <= end,
+    async def _count(self, conditions: list, joins_resident: bool) -> int:
+        count_q = lambda_stmt(lambda: select(func.count()).select_from(ApplicationModel))
+        if joins_resident:
+            count_q += lambda s: s.join(ApplicationModel.resident)
+        if conditions:
+            criteria = and_(*conditions)
+            count_q += lambda s: s.where(criteria)
+        result = await self._session.execute(count_q)
+        return result.scalar() or 0
+
+    async def _estimate_total(self) -> int | None:
+        """
+        Row estimate from pg_class; None where unavailable. Summed over the leaf partitions:
+        autovacuum analyzes those, never the partitioned parent, whose reltuples stays at
+        whatever the last manual ANALYZE saw. An unpartitioned table counts as its own leaf.
+        """
+        if self._session.bind.dialect.name != "postgresql":
+            return None
+        # A select() rather than a raw text() statement, so a read session keeps it on the replica.
+        result = await self._session.execute(
+            select(text("sum(c.reltuples)::bigint"))
+            .select_from(text("pg_class c"))
+            .where(
+                text(
+                    "c.relkind = 'r' AND c.reltuples >= 0 AND (c.oid = 'applications'::regclass OR c.oid IN "
+                    "(SELECT inhrelid FROM pg_inherits WHERE inhparent = 'applications'::regclass))"
+                )
             )
         )
-        result = await self._session.execute(q)
-        return list(result.scalars().all())
+        estimate = result.scalar()
+        if estimate is None:
+            return None  # no partition analyzed yet
+        return int(estimate)
 
     async def create(
         self,
@@ -90,21 +234,25 @@ class ApplicationRepository:
         reason: str,
         contact_phone: str,
     ) -> ApplicationModel:
-        model = ApplicationModel(
-            user_id=user_id,
-            is_minor=is_minor,
-            leave_time=leave_time,
-            return_time=return_time,
-            reason=reason,
-            contact_phone=contact_phone,
-            status="pending",
+        # One INSERT ... RETURNING hydrates the model, server defaults included. On
+        # PostgreSQL a trigger also claims the leave period; an overlap with another
+        # active application of the user fails this statement (see is_leave_overlap).
+        result = await self._session.execute(
+            insert(ApplicationModel)
+            .values(
+                user_id=user_id,
+                is_minor=is_minor,
+                leave_time=leave_time,
+                return_time=return_time,
+                reason=reason,
+                contact_phone=contact_phone,
+                status="pending",
+            )
+            .returning(ApplicationModel)
         )
-        self._session.add(model)
-        await self._session.flush()
-        await self._session.refresh(model)
-        return model
+        return result.scalar_one()
 
-    async def update_status(
+    async def decide(
         self,
         application_id: UUID,
         status: str,
@@ -112,13 +260,71 @@ class ApplicationRepository:
         decided_at: datetime,
         reject_reason: str | None = None,
     ) -> ApplicationModel | None:
-        model = await self.get_by_id(application_id)
-        if model is None:
-            return None
-        model.status = status
-        model.decided_by = decided_by
-        model.decided_at = decided_at
-        model.reject_reason = reject_reason
-        await self._session.flush()
-        await self._session.refresh(model)
-        return model
+        """
+        Atomic pending -> approved/rejected transition in one UPDATE ... RETURNING.
+
+        The row is only updated while it is still pending and, for minors, once a
+        voice message is attached; otherwise None is returned and nothing changes.
+        Concurrent decisions cannot both succeed: the second UPDATE no longer
+        matches status = 'pending'.
+        """
+        decided = await self.decide_many([application_id], status, decided_by, decided_at, reject_reason)
+        return decided[0] if decided else None
+
+    async def decide_many(
+        self,
+        application_ids: list[UUID],
+        status: str,
+        decided_by: UUID,
+        decided_at: datetime,
+        reject_reason: str | None = None,
+    ) -> list[ApplicationModel]:
+        """Set-based variant of decide(): one UPDATE for all ids, returns the rows it changed."""
+        if not application_ids:
+            return []
+        # Minors without a voice message are excluded by an anti-join, not per-row lookups.
+        missing_voice = ~exists().where(
+            ApplicationDocumentModel.application_id == ApplicationModel.id,
+            # Correlating on the partition key lets the probe skip other months' documents.
+            ApplicationDocumentModel.application_leave_time == ApplicationModel.leave_time,
+            ApplicationDocumentModel.document_type == DOCUMENT_TYPE_VOICE_MESSAGE,
+        )
+        stmt = (
+            update(ApplicationModel)
+            .where(
+                # UPDATE ... FROM application_leave_times: each id's partition key comes
+                # from the lookup, so the nested loop probes only that id's partition.
+                ApplicationLeaveTimeModel.application_id.in_(application_ids),
+                ApplicationModel.id == ApplicationLeaveTimeModel.application_id,
+                ApplicationModel.leave_time == ApplicationLeaveTimeModel.leave_time,
+                ApplicationModel.status == "pending",
+                ~and_(ApplicationModel.is_minor, missing_voice),
+            )
+            .values(
+                status=status,
+                decided_by=decided_by,
+                decided_at=decided_at,
+                reject_reason=reject_reason,
+            )
+            .returning(ApplicationModel)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_decision_states(self, application_ids: list[UUID]) -> dict[UUID, tuple[str, bool]]:
+        """id -> (status, is_minor) for classifying ids a decide_many() call did not change."""
+        if not application_ids:
+            return {}
+        result = await self._session.execute(
+            select(ApplicationModel.id, ApplicationModel.status, ApplicationModel.is_minor)
+            .join(
+                ApplicationLeaveTimeModel,
+                and_(
+                    ApplicationModel.id == ApplicationLeaveTimeModel.application_id,
+                    ApplicationModel.leave_time == ApplicationLeaveTimeModel.leave_time,
+                ),
+            )
+            .where(ApplicationLeaveTimeModel.application_id.in_(application_ids))
+        )
+        return {row.id: (row.status, row.is_minor) for row in result.all()}
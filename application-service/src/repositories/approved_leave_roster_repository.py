@@ -0,0 +1,82 @@
+from datetime import date, datetime
+
+from sqlalchemy import DateTime, and_, cast, lambda_stmt, literal_column, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.approved_leave_roster import ApprovedLeaveRosterModel
+
+
+class ApprovedLeaveRosterRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def _insert(self):
+        dialect = self._session.bind.dialect.name
+        return (sqlite if dialect == "sqlite" else postgresql).insert(ApprovedLeaveRosterModel)
+
+    async def add_many(self, rows: list[dict]) -> None:
+        """Insert roster rows; an application already on the roster is left as is."""
+        if not rows:
+            return
+        stmt = self._insert().values(rows).on_conflict_do_nothing(
+            index_elements=[ApprovedLeaveRosterModel.application_id]
+        )
+        await self._session.execute(stmt)
+
+    def _resident_conditions(self, building: str | None, entrance: int | None) -> list:
+        conditions = []
+        if building:
+            conditions.append(ApprovedLeaveRosterModel.building.in_([building, ""]))
+        if entrance:
+            conditions.append(ApprovedLeaveRosterModel.entrance.in_([entrance, 0]))
+        return conditions
+
+    async def get_for_leave_date(
+        self,
+        leave_date: date,
+        building: str | None = None,
+        entrance: int | None = None,
+    ) -> list[ApprovedLeaveRosterModel]:
+        """
+        One range read on (leave_date, building, entrance), ordered by leave_time. Rows
+        with an unknown resident ("" / 0) are returned for every building/entrance.
+        """
+        conditions = [ApprovedLeaveRosterModel.leave_date == leave_date]
+        conditions += self._resident_conditions(building, entrance)
+        criteria = and_(*conditions)
+        result = await self._session.execute(
+            lambda_stmt(
+                lambda: select(ApprovedLeaveRosterModel)
+                .where(criteria)
+                .order_by(ApprovedLeaveRosterModel.leave_time, ApprovedLeaveRosterModel.application_id)
+            )
+        )
+        return list(result.scalars().all())
+
+    async def get_out_at(
+        self,
+        at: datetime,
+        building: str | None = None,
+        entrance: int | None = None,
+    ) -> list[ApprovedLeaveRosterModel]:
+        """
+        Approved leaves with leave_time <= at < return_time. On PostgreSQL this is a
+        containment test on the generated leave_period range, answered by its GiST
+        index; a pair of comparisons on two columns cannot use a single btree.
+        """
+        if self._session.bind.dialect.name == "postgresql":
+            period = literal_column("approved_leave_roster.leave_period")
+            conditions = [period.op("@>")(cast(at, DateTime(timezone=True)))]
+        else:
+            conditions = [ApprovedLeaveRosterModel.leave_time <= at, ApprovedLeaveRosterModel.return_time > at]
+        conditions += self._resident_conditions(building, entrance)
+        criteria = and_(*conditions)
+        result = await self._session.execute(
+            lambda_stmt(
+                lambda: select(ApprovedLeaveRosterModel)
+                .where(criteria)
+                .order_by(ApprovedLeaveRosterModel.leave_time, ApprovedLeaveRosterModel.application_id)
+            )
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,131 @@
+import re
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# (table, partition key); documents are partitioned by their application's leave_time.
+PARTITIONED_TABLES = (
+    ("applications", "leave_time"),
+    ("application_documents", "application_leave_time"),
+)
+ARCHIVE_SCHEMA = "archive"
+_MAINTENANCE_LOCK_KEY = 0x61707073  # pg_advisory lock id shared by all service instances
+_MONTH_PARTITION = re.compile(r"applications_p(\d{4})_(\d{2})")
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def _month_bounds(month: date) -> tuple[datetime, datetime]:
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    end = datetime(month.year + month.month // 12, month.month % 12 + 1, 1, tzinfo=timezone.utc)
+    return start, end
+
+
+class PartitionRepository:
+    """
+    DDL for the monthly leave_time partitions of applications and application_documents
+    (PostgreSQL only; see alembic revision 005). Both tables always get the same set of
+    months, and each month's pair is created and archived in one transaction.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def try_lock(self) -> bool:
+        """Transaction-scoped advisory lock so only one instance runs maintenance at a time."""
+        result = await self._session.execute(
+            text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _MAINTENANCE_LOCK_KEY}
+        )
+        return bool(result.scalar())
+
+    async def list_months(self) -> list[date]:
+        result = await self._session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'applications'::regclass"
+            )
+        )
+        months = []
+        for (name,) in result.all():
+            match = _MONTH_PARTITION.fullmatch(name)
+            if match:
+                months.append(date(int(match[1]), int(match[2]), 1))
+        return sorted(months)
+
+    async def create_month(self, month: date) -> int:
+        """
+        Add the partitions for `month`. Rows of that month already sitting in the DEFAULT
+        partitions are moved in first (ATTACH refuses while the default overlaps the new
+        range). Returns the number of applications moved.
+        """
+        start, end = _month_bounds(month)
+        bounds = {"start": start, "end": end}
+        for table, _ in PARTITIONED_TABLES:
+            await self._session.execute(
+                text(f'CREATE TABLE "{partition_name(table, month)}" (LIKE "{table}" INCLUDING DEFAULTS)')
+            )
+        for table, key in PARTITIONED_TABLES:
+            await self._session.execute(
+                text(
+                    f'INSERT INTO "{partition_name(table, month)}" SELECT * FROM "{table}_default" '
+                    f"WHERE {key} >= :start AND {key} < :end"
+                ),
+                bounds,
+            )
+        # Cascades to the documents copied above.
+        moved = await self._session.execute(
+            text("DELETE FROM applications_default WHERE leave_time >= :start AND leave_time < :end"), bounds
+        )
+        for table, _ in PARTITIONED_TABLES:
+            # Applications first: attaching documents validates their foreign key.
+            await self._session.execute(
+                text(
+                    f'ALTER TABLE "{table}" ATTACH PARTITION "{partition_name(table, month)}" '
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+            )
+        return moved.rowcount
+
+    async def archive_month(self, month: date, tablespace: str = "") -> None:
+        """
+        Detach the partitions for `month` and move them to the archive schema (and
+        `tablespace`, e.g. cheaper storage, when given). The detached pair keeps its own
+        foreign key so archived documents still reference archived applications; the
+        month's approved_leave_roster, application_leave_periods and application_leave_times
+        rows are dropped.
+        """
+        applications = partition_name("applications", month)
+        documents = partition_name("application_documents", month)
+        await self._session.execute(text(f'ALTER TABLE application_documents DETACH PARTITION "{documents}"'))
+        # The detached table keeps a copy of the parent's foreign key, which would block
+        # detaching the applications it points to.
+        result = await self._session.execute(
+            text("SELECT conname FROM pg_constraint WHERE conrelid = CAST(:table AS regclass) AND contype = 'f'"),
+            {"table": documents},
+        )
+        for (constraint,) in result.all():
+            await self._session.execute(text(f'ALTER TABLE "{documents}" DROP CONSTRAINT "{constraint}"'))
+        await self._session.execute(text(f'ALTER TABLE applications DETACH PARTITION "{applications}"'))
+        await self._session.execute(
+            text(
+                f'ALTER TABLE "{documents}" ADD CONSTRAINT "{documents}_application_fkey" '
+                "FOREIGN KEY (application_id, application_leave_time) "
+                f'REFERENCES "{applications}" (id, leave_time) ON DELETE CASCADE'
+            )
+        )
+        start, end = _month_bounds(month)
+        for table in ("approved_leave_roster", "application_leave_periods", "application_leave_times"):
+            await self._session.execute(
+                text(f"DELETE FROM {table} WHERE leave_time >= :start AND leave_time < :end"),
+                {"start": start, "end": end},
+            )
+        await self._session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        for table in (applications, documents):
+            await self._session.execute(text(f'ALTER TABLE "{table}" SET SCHEMA {ARCHIVE_SCHEMA}'))
+            if tablespace:
+                await self._session.execute(
+                    text(f'ALTER TABLE {ARCHIVE_SCHEMA}."{table}" SET TABLESPACE "{tablespace}"')
+                )
@@ -0,0 +1,122 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.grpc_clients.auth_client import UserInfo
+from src.models.application import ApplicationModel
+from src.models.approved_leave_roster import ApprovedLeaveRosterModel
+from src.models.resident_directory import ResidentDirectoryModel
+
+
+def full_name_from_info(info: UserInfo) -> str:
+    return f"{info.last_name} {info.first_name} {info.patronymic or ''}".strip()
+
+
+class ResidentDirectoryRepository:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    def _insert(self):
+        dialect = self._session.bind.dialect.name
+        return (sqlite if dialect == "sqlite" else postgresql).insert(ResidentDirectoryModel)
+
+    async def upsert_many(self, infos: list[UserInfo]) -> None:
+        """
+        Write the users' directory rows and carry the new address and name over to their
+        roster rows from today on; past leaves keep what was true at the time.
+        """
+        if not infos:
+            return
+        rows = {
+            info.user_id: {
+                "user_id": UUID(info.user_id),
+                "building": info.building or "",
+                "entrance": info.entrance or 0,
+                "room": info.room or "",
+                "full_name": full_name_from_info(info),
+            }
+            for info in infos
+        }
+        stmt = self._insert().values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ResidentDirectoryModel.user_id],
+            set_={
+                "building": stmt.excluded.building,
+                "entrance": stmt.excluded.entrance,
+                "room": stmt.excluded.room,
+                "full_name": stmt.excluded.full_name,
+                "refreshed_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+        roster = ApprovedLeaveRosterModel.__table__
+        await self._session.execute(
+            update(roster)
+            .where(
+                roster.c.user_id == bindparam("b_user_id"),
+                roster.c.leave_date >= datetime.now(timezone.utc).date(),
+            )
+            .values(
+                building=bindparam("b_building"),
+                entrance=bindparam("b_entrance"),
+                room=bindparam("b_room"),
+                user_name=bindparam("b_full_name"),
+            ),
+            [{f"b_{k}": v for k, v in row.items()} for row in rows.values()],
+        )
+
+    async def mark_refreshed(self, user_ids: list[UUID]) -> None:
+        """
+        Tombstone for users auth-service no longer knows: existing rows keep their data and
+        only move to the back of the refresh queue; unknown users get an empty row.
+        """
+        if not user_ids:
+            return
+        stmt = self._insert().values(
+            [
+                {"user_id": user_id, "building": "", "entrance": 0, "room": "", "full_name": ""}
+                for user_id in dict.fromkeys(user_ids)
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ResidentDirectoryModel.user_id],
+            set_={"refreshed_at": func.now()},
+        )
+        await self._session.execute(stmt)
+
+    async def get_user_ids_to_refresh(self, refreshed_before: datetime, limit: int) -> list[UUID]:
+        """
+        Applicants with no directory row (backfill) or a row older than refreshed_before,
+        missing and oldest first.
+        """
+        q = (
+            select(ApplicationModel.user_id)
+            .outerjoin(ResidentDirectoryModel, ResidentDirectoryModel.user_id == ApplicationModel.user_id)
+            .where(
+                or_(
+                    ResidentDirectoryModel.user_id.is_(None),
+                    ResidentDirectoryModel.refreshed_at < refreshed_before,
+                )
+            )
+            .group_by(ApplicationModel.user_id, ResidentDirectoryModel.refreshed_at)
+            .order_by(ResidentDirectoryModel.refreshed_at.asc().nulls_first())
+            .limit(limit)
+        )
+        result = await self._session.execute(q)
+        return list(result.scalars().all())
+
+    async def get_many(self, user_ids: list[UUID]) -> dict[UUID, ResidentDirectoryModel]:
+        """Directory rows by user id; tombstones count as missing."""
+        if not user_ids:
+            return {}
+        result = await self._session.execute(
+            select(ResidentDirectoryModel).where(
+                ResidentDirectoryModel.user_id.in_(user_ids),
+                ResidentDirectoryModel.full_name != "",
+            )
+        )
+        return {row.user_id: row for row in result.scalars().all()}
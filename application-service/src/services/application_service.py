@@ -1,6 +1,11 @@
-from datetime import date, datetime
+from collections.abc import AsyncGenerator, AsyncIterator
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
+
+from src.constants.count_mode import COUNT_MODE_EXACT, COUNT_MODES
 from src.constants.document_type import (
     DOCUMENT_TYPES,
     DOCUMENT_TYPE_VOICE_MESSAGE,
@@ -9,6 +14,11 @@ from src.constants.document_type import (
     SCAN_ALLOWED_EXTENSIONS,
     VOICE_ALLOWED_EXTENSIONS,
 )
+from src.constants.error_codes import (
+    APP_ALREADY_DECIDED,
+    APP_APPLICATION_NOT_FOUND,
+    APP_MINOR_VOICE_REQUIRED,
+)
 import re
 
 from src.domain.exceptions import (
@@ -21,9 +31,23 @@ from src.domain.exceptions import (
     ValidationError,
 )
 from src.grpc_clients.auth_client import AuthClientProtocol
+from src.models.ids import uuid7
 from src.repositories.application_document_repository import ApplicationDocumentRepository
-from src.repositories.application_repository import ApplicationRepository
-from src.storage.minio_storage import MinioStorage
+from src.repositories.application_repository import ApplicationRepository, is_leave_overlap
+from src.repositories.approved_leave_roster_repository import ApprovedLeaveRosterRepository
+from src.repositories.resident_directory_repository import ResidentDirectoryRepository
+from src.services.cursor import decode_cursor, encode_cursor
+from src.services.document_file import (
+    DocumentFileInfo,
+    RangeNotSatisfiableError,
+    UploadSession,
+    etag_matches,
+    parse_byte_range,
+)
+from src.services.resident_directory import user_name_from_info
+from src.storage.document_storage import StorageProtocol, document_object_name
+
+MAX_DECIDE_BATCH_SIZE = 200
 
 
 class ApplicationService:
@@ -31,13 +55,17 @@ class ApplicationService:
         self,
         application_repository: ApplicationRepository,
         document_repository: ApplicationDocumentRepository,
-        storage: MinioStorage,
+        storage: StorageProtocol,
         auth_client: AuthClientProtocol,
+        resident_repository: ResidentDirectoryRepository | None = None,
+        roster_repository: ApprovedLeaveRosterRepository | None = None,
     ) -> None:
         self._app_repo = application_repository
         self._doc_repo = document_repository
         self._storage = storage
         self._auth = auth_client
+        self._resident_repo = resident_repository
+        self._roster_repo = roster_repository
 
     async def create_application(
         self,
@@ -47,8 +75,9 @@ class ApplicationService:
         reason: str,
         contact_phone: str,
     ) -> tuple[object, bool]:
-        if return_time < leave_time:
-            raise ValidationError("Дата возвращения должна быть не раньше даты выхода")
+        # Zero-length periods are rejected too: '[)' makes them empty ranges that never overlap.
+        if return_time <= leave_time:
+            raise ValidationError("Дата возвращения должна быть позже даты выхода")
         for dt in (leave_time, return_time):
             if dt.year < 2000 or dt.year > 2100:
                 raise ValidationError("Дата должна быть в диапазоне 2000–2100")
@@ -60,14 +89,23 @@ class ApplicationService:
         if not user_info:
             raise ForbiddenApplicationError()
         is_minor = user_info.is_minor
-        model = await self._app_repo.create(
-            user_id=user_id,
-            is_minor=is_minor,
-            leave_time=leave_time,
-            return_time=return_time,
-            reason=reason,
-            contact_phone=contact_phone,
-        )
+        if self._resident_repo is not None:
+            # Write-through so the applicant is immediately visible to entrance/room filters.
+            await self._resident_repo.upsert_many([user_info])
+        try:
+            model = await self._app_repo.create(
+                user_id=user_id,
+                is_minor=is_minor,
+                leave_time=leave_time,
+                return_time=return_time,
+                reason=reason,
+                contact_phone=contact_phone,
+            )
+        except IntegrityError as e:
+            # Enforced by the database, so concurrent submissions cannot both pass.
+            if is_leave_overlap(e):
+                raise ValidationError("У студента уже есть заявление на пересекающийся период", e) from e
+            raise
         return model, is_minor
 
     async def ensure_minor_voice_if_required(self, application_id: UUID) -> None:
@@ -76,7 +114,7 @@ class ApplicationService:
             raise ApplicationNotFoundError(str(application_id))
         if not app.is_minor:
             return
-        count = await self._doc_repo.count_voice_messages_for_application(application_id)
+        count = await self._doc_repo.count_voice_messages_for_application(application_id, app.leave_time)
         if count == 0:
             raise MinorVoiceRequiredError()
 
@@ -91,21 +129,36 @@ class ApplicationService:
         date_to: date | None = None,
         page: int = 1,
         size: int = 20,
-    ) -> tuple[list[object], int]:
-        user_ids: list[UUID] | None = None
-        if user_id is None and (entrance is not None or room is not None):
-            ids = await self._auth.get_user_ids(entrance=entrance, room=room)
-            user_ids = [UUID(v) for v in ids]
-        items, total = await self._app_repo.get_list(
+        cursor: str | None = None,
+        count_mode: str = COUNT_MODE_EXACT,
+    ) -> tuple[list[object], int | None, str | None]:
+        """
+        Returns (items, total, next_cursor); next_cursor is None on the last page.
+        total is None in has_more mode and approximate in estimated mode.
+        """
+        if count_mode not in COUNT_MODES:
+            raise ValidationError(f"count_mode must be one of: {', '.join(sorted(COUNT_MODES))}")
+        if user_id is not None:
+            entrance = None
+            room = None
+        after = decode_cursor(cursor) if cursor else None
+        items, total, has_more = await self._app_repo.get_list(
             user_id=user_id,
-            user_ids=user_ids,
+            entrance=entrance,
+            room=room,
             status=status,
             date_from=date_from,
             date_to=date_to,
             page=page,
             size=size,
+            after=after,
+            count_mode=count_mode,
         )
-        return items, total
+        next_cursor = None
+        if has_more and items:
+            last = items[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return items, total, next_cursor
 
     async def get_application(
         self,
@@ -132,32 +185,85 @@ class ApplicationService:
         decided_at: datetime,
         reject_reason: str | None = None,
     ) -> object:
-        app = await self._app_repo.get_by_id(application_id)
-        if not app:
-            raise ApplicationNotFoundError(str(application_id))
-        if app.status != "pending":
-            raise ApplicationAlreadyDecidedError()
         if status not in ("approved", "rejected"):
             raise InvalidDocumentTypeError(f"status={status}")
-        await self.ensure_minor_voice_if_required(application_id)
-        updated = await self._app_repo.update_status(
+        updated = await self._app_repo.decide(
             application_id=application_id,
             status=status,
             decided_by=decided_by,
             decided_at=decided_at,
             reject_reason=reject_reason,
         )
-        return updated
+        if updated is not None:
+            if status == "approved":
+                await self._add_to_roster([updated])
+            return updated
+        # The conditional UPDATE matched nothing; a read on this failure path only
+        # classifies why, the decision itself was never applied.
+        app = await self._app_repo.get_by_id(application_id)
+        if not app:
+            raise ApplicationNotFoundError(str(application_id))
+        if app.status != "pending":
+            raise ApplicationAlreadyDecidedError()
+        if app.is_minor:
+            raise MinorVoiceRequiredError()
+        raise ApplicationAlreadyDecidedError()
 
-    async def upload_document(
+    async def decide_applications(
+        self,
+        application_ids: list[UUID],
+        status: str,
+        decided_by: UUID,
+        decided_at: datetime,
+        reject_reason: str | None = None,
+    ) -> list[tuple[UUID, object | None, str | None]]:
+        """
+        Bulk decide: one conditional UPDATE for the whole batch plus, only when some ids
+        were not applied, one read to classify them. Returns (id, application, error_code)
+        per unique id in request order; error_code is None for applied decisions.
+        """
+        if status not in ("approved", "rejected"):
+            raise InvalidDocumentTypeError(f"status={status}")
+        unique_ids = list(dict.fromkeys(application_ids))
+        if len(unique_ids) > MAX_DECIDE_BATCH_SIZE:
+            raise ValidationError(f"At most {MAX_DECIDE_BATCH_SIZE} applications per batch")
+        decided = {
+            m.id: m
+            for m in await self._app_repo.decide_many(
+                unique_ids,
+                status=status,
+                decided_by=decided_by,
+                decided_at=decided_at,
+                reject_reason=reject_reason,
+            )
+        }
+        if status == "approved":
+            await self._add_to_roster(list(decided.values()))
+        rest = [i for i in unique_ids if i not in decided]
+        states = await self._app_repo.get_decision_states(rest) if rest else {}
+        results: list[tuple[UUID, object | None, str | None]] = []
+        for application_id in unique_ids:
+            if application_id in decided:
+                results.append((application_id, decided[application_id], None))
+                continue
+            state = states.get(application_id)
+            if state is None:
+                code = APP_APPLICATION_NOT_FOUND
+            elif state[0] == "pending" and state[1]:
+                code = APP_MINOR_VOICE_REQUIRED
+            else:
+                code = APP_ALREADY_DECIDED
+            results.append((application_id, None, code))
+        return results
+
+    async def _check_upload(
         self,
         application_id: UUID,
         document_type: str,
-        file_data: bytes,
-        content_type: str,
         filename: str,
         uploaded_by: UUID,
-    ) -> object:
+    ) -> tuple[Any, str, int, str]:
+        """Validate an upload before any bytes are stored: (application, extension, max size, kind)."""
         if document_type not in DOCUMENT_TYPES:
             raise InvalidDocumentTypeError(document_type)
         app = await self._app_repo.get_by_id(application_id)
@@ -169,16 +275,24 @@ class ApplicationService:
         if document_type == DOCUMENT_TYPE_VOICE_MESSAGE:
             if ext not in VOICE_ALLOWED_EXTENSIONS:
                 raise InvalidDocumentTypeError(f"voice extension .{ext}")
-            if len(file_data) > MAX_VOICE_SIZE_BYTES:
-                raise InvalidDocumentTypeError("voice file too large")
-        else:
-            if ext not in SCAN_ALLOWED_EXTENSIONS:
-                raise InvalidDocumentTypeError(f"scan extension .{ext}")
-            if len(file_data) > MAX_SCAN_SIZE_BYTES:
-                raise InvalidDocumentTypeError("scan file too large")
-        from uuid import uuid4
-
-        doc_id = uuid4()
+            return app, ext, MAX_VOICE_SIZE_BYTES, "voice"
+        if ext not in SCAN_ALLOWED_EXTENSIONS:
+            raise InvalidDocumentTypeError(f"scan extension .{ext}")
+        return app, ext, MAX_SCAN_SIZE_BYTES, "scan"
+
+    async def upload_document(
+        self,
+        application_id: UUID,
+        document_type: str,
+        file_data: bytes,
+        content_type: str,
+        filename: str,
+        uploaded_by: UUID,
+    ) -> object:
+        app, ext, max_size, kind = await self._check_upload(application_id, document_type, filename, uploaded_by)
+        if len(file_data) > max_size:
+            raise InvalidDocumentTypeError(f"{kind} file too large")
+        doc_id = uuid7()
         object_name = await self._storage.upload_file(
             application_id=application_id,
             document_id=doc_id,
@@ -186,14 +300,132 @@ class ApplicationService:
             content_type=content_type,
             extension=ext,
         )
-        doc = await self._doc_repo.create(
+        return await self._doc_repo.create(
             application_id=application_id,
             document_type=document_type,
             file_url=object_name,
             uploaded_by=uploaded_by,
             document_id=doc_id,
+            application_leave_time=app.leave_time,
         )
-        return doc
+
+    async def upload_document_stream(
+        self,
+        application_id: UUID,
+        document_type: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        filename: str,
+        uploaded_by: UUID,
+    ) -> object:
+        """
+        Like upload_document, but the file arrives as chunks that are passed on to a
+        streaming multipart put as they come; the whole file is never held in memory.
+        Exceeding the size limit aborts the upload mid-stream.
+        """
+        app, ext, max_size, kind = await self._check_upload(application_id, document_type, filename, uploaded_by)
+
+        async def _limited() -> AsyncIterator[bytes]:
+            received = 0
+            async for chunk in chunks:
+                received += len(chunk)
+                if received > max_size:
+                    raise InvalidDocumentTypeError(f"{kind} file too large")
+                yield chunk
+
+        doc_id = uuid7()
+        object_name = await self._storage.upload_stream(
+            application_id=application_id,
+            document_id=doc_id,
+            chunks=_limited(),
+            content_type=content_type,
+            extension=ext,
+        )
+        return await self._doc_repo.create(
+            application_id=application_id,
+            document_type=document_type,
+            file_url=object_name,
+            uploaded_by=uploaded_by,
+            document_id=doc_id,
+            application_leave_time=app.leave_time,
+        )
+
+    async def create_upload_session(
+        self,
+        application_id: UUID,
+        document_type: str,
+        content_type: str,
+        filename: str,
+        uploaded_by: UUID,
+        size: int = 0,
+        expiry_seconds: int = 900,
+    ) -> UploadSession:
+        """
+        Let the client upload a document straight to storage. The same checks as
+        upload_document run up front; the returned POST policy pins the object key
+        (which includes the document type), Content-Type and the size limit. Nothing is
+        recorded until confirm_upload.
+        `size`, when the client knows it, is checked against the limit right away.
+        """
+        _, ext, max_size, kind = await self._check_upload(application_id, document_type, filename, uploaded_by)
+        if size > max_size:
+            raise InvalidDocumentTypeError(f"{kind} file too large")
+        doc_id = uuid7()
+        url, fields = await self._storage.presigned_upload_policy(
+            document_object_name(application_id, doc_id, ext, document_type),
+            content_type,
+            max_size,
+            expiry_seconds,
+        )
+        return UploadSession(
+            document_id=str(doc_id),
+            url=url,
+            fields=fields,
+            max_size=max_size,
+            expires_at=datetime.now(timezone.utc) + timedelta(seconds=expiry_seconds),
+        )
+
+    async def confirm_upload(
+        self,
+        application_id: UUID,
+        document_id: UUID,
+        document_type: str,
+        filename: str,
+        uploaded_by: UUID,
+    ) -> object:
+        """
+        Record a document uploaded through create_upload_session once its object is in
+        storage. The object is looked up under the key of `document_type`, so a session
+        cannot be confirmed as another type. Repeating the call, also concurrently,
+        returns the already recorded document.
+        """
+        app, ext, max_size, kind = await self._check_upload(application_id, document_type, filename, uploaded_by)
+        existing = await self._doc_repo.get_by_id(document_id, app.leave_time)
+        if existing:
+            return _confirmed_document(existing, application_id, document_type)
+        object_name = document_object_name(application_id, document_id, ext, document_type)
+        size = await self._storage.head_object(object_name)
+        if size is None:
+            raise ValidationError("Файл документа не загружен в хранилище")
+        if size > max_size:
+            # The policy already forbids this; guard against objects put by other means.
+            await self._storage.delete_file(object_name)
+            raise InvalidDocumentTypeError(f"{kind} file too large")
+        created = await self._doc_repo.create_if_absent(
+            document_id=document_id,
+            application_id=application_id,
+            application_leave_time=app.leave_time,
+            document_type=document_type,
+            file_url=object_name,
+            uploaded_by=uploaded_by,
+        )
+        if created is None:
+            # A concurrent confirm of the same session recorded it first.
+            existing = await self._doc_repo.get_by_id(document_id, app.leave_time)
+            if existing is None:
+                raise DocumentNotFoundError(str(document_id))
+            return _confirmed_document(existing, application_id, document_type)
+        return created
 
     async def get_document_download_url(
         self,
@@ -214,7 +446,7 @@ class ApplicationService:
         if not is_owner and not is_educator:
             raise ForbiddenApplicationError()
 
-        doc = await self._doc_repo.get_by_id(document_id)
+        doc = await self._doc_repo.get_by_id(document_id, app.leave_time)
         if not doc or doc.application_id != application_id:
             from src.domain.exceptions import DocumentNotFoundError
 
@@ -225,14 +457,20 @@ class ApplicationService:
             expiry_seconds=expiry_seconds,
         )
 
-    async def get_document_file(
+    async def open_document_file(
         self,
         application_id: UUID,
         document_id: UUID,
         current_user_id: UUID,
         current_user_roles: list[str],
-    ) -> tuple[bytes, str, str]:
-        """Stream document file through backend. Returns (data, content_type, filename)."""
+        range_header: str = "",
+        if_none_match: str = "",
+    ) -> tuple[DocumentFileInfo, AsyncGenerator[bytes, None] | None]:
+        """
+        Stream a document through the backend. Returns the file info and an iterator
+        over the requested bytes (one Range, or the whole file), or None when nothing
+        is to be sent: If-None-Match matched the ETag or the range is not satisfiable.
+        """
         app = await self._app_repo.get_by_id(application_id)
         if not app:
             raise ApplicationNotFoundError(str(application_id))
@@ -242,12 +480,25 @@ class ApplicationService:
         )
         if not is_owner and not is_educator:
             raise ForbiddenApplicationError()
-        doc = await self._doc_repo.get_by_id(document_id)
+        doc = await self._doc_repo.get_by_id(document_id, app.leave_time)
         if not doc or doc.application_id != application_id:
             raise DocumentNotFoundError(str(document_id))
-        data, content_type = await self._storage.get_object(object_name=doc.file_url)
+        size, content_type, etag = await self._storage.stat_object(doc.file_url)
         filename = doc.file_url.split("/")[-1] if "/" in doc.file_url else doc.file_url
-        return data, content_type, filename
+        info = DocumentFileInfo(filename=filename, content_type=content_type, size=size, etag=etag)
+        if if_none_match and etag_matches(if_none_match, etag):
+            info.not_modified = True
+            return info, None
+        try:
+            byte_range = parse_byte_range(range_header, size) if range_header else None
+        except RangeNotSatisfiableError:
+            info.range_not_satisfiable = True
+            return info, None
+        if byte_range is None:
+            return info, self._storage.iter_object(doc.file_url)
+        info.range_start, info.range_end = byte_range
+        info.partial = True
+        return info, self._storage.iter_object(doc.file_url, offset=info.range_start, length=info.length)
 
     async def delete_document(
         self,
@@ -267,11 +518,48 @@ class ApplicationService:
         )
         if not is_owner and not is_educator:
             raise ForbiddenApplicationError()
-        doc = await self._doc_repo.get_by_id(document_id)
+        doc = await self._doc_repo.get_by_id(document_id, app.leave_time)
         if not doc or doc.application_id != application_id:
             raise DocumentNotFoundError(str(document_id))
         await self._storage.delete_file(doc.file_url)
-        await self._doc_repo.delete(document_id)
+        await self._doc_repo.delete(document_id, app.leave_time)
+
+    async def _add_to_roster(self, applications: list) -> None:
+        """
+        Put freshly approved applications on the GetApprovedLeaves roster, in the caller's
+        transaction. Resident data comes from resident_directory; applicants missing there
+        are fetched from auth-service in one batch call and written through.
+        """
+        if self._roster_repo is None or not applications:
+            return
+        user_ids = list({app.user_id for app in applications})
+        residents: dict[str, object] = {}
+        if self._resident_repo is not None:
+            residents = {str(k): v for k, v in (await self._resident_repo.get_many(user_ids)).items()}
+        missing = [str(u) for u in user_ids if str(u) not in residents]
+        if missing:
+            infos = await self._auth.get_users_info(missing)
+            if self._resident_repo is not None and infos:
+                await self._resident_repo.upsert_many(list(infos.values()))
+            residents.update(infos)
+        rows = []
+        for app in applications:
+            resident = residents.get(str(app.user_id))
+            rows.append(
+                {
+                    "application_id": app.id,
+                    "user_id": app.user_id,
+                    "leave_date": app.leave_time.astimezone(timezone.utc).date(),
+                    "building": getattr(resident, "building", "") or "",
+                    "entrance": getattr(resident, "entrance", 0) or 0,
+                    "room": getattr(resident, "room", "") or "",
+                    "user_name": user_name_from_info(resident) or "",
+                    "leave_time": app.leave_time,
+                    "return_time": app.return_time,
+                    "reason": app.reason,
+                }
+            )
+        await self._roster_repo.add_many(rows)
 
     async def get_approved_leaves_for_date(
         self,
@@ -279,30 +567,34 @@ class ApplicationService:
         building: str | None = None,
         entrance: int | None = None,
     ) -> list[tuple[str, str, str, datetime, datetime, str]]:
-        applications = await self._app_repo.get_approved_for_leave_date(
+        if self._roster_repo is None:
+            raise RuntimeError("ApplicationService needs roster_repository for approved leaves")
+        rows = await self._roster_repo.get_for_leave_date(
             leave_date=leave_date,
             building=building,
+            entrance=entrance or None,
         )
-        result: list[tuple[str, str, str, datetime, datetime, str]] = []
-        for app in applications:
-            user_info = await self._auth.get_user_info(str(app.user_id))
-            user_name = ""
-            room = ""
-            if user_info:
-                if building and user_info.building != building:
-                    continue
-                if entrance is not None and entrance != 0 and user_info.entrance != entrance:
-                    continue
-                user_name = f"{user_info.last_name} {user_info.first_name} {user_info.patronymic or ''}".strip()
-                room = user_info.room
-            result.append(
-                (
-                    str(app.user_id),
-                    user_name,
-                    room,
-                    app.leave_time,
-                    app.return_time,
-                    app.reason,
-                )
-            )
-        return result
+        return [_leave_record(row) for row in rows]
+
+    async def get_students_out_at(
+        self,
+        at: datetime,
+        building: str | None = None,
+        entrance: int | None = None,
+    ) -> list[tuple[str, str, str, datetime, datetime, str]]:
+        """Students on an approved leave at `at` (leave_time <= at < return_time)."""
+        if self._roster_repo is None:
+            raise RuntimeError("ApplicationService needs roster_repository for approved leaves")
+        rows = await self._roster_repo.get_out_at(at=at, building=building, entrance=entrance or None)
+        return [_leave_record(row) for row in rows]
+
+
+def _confirmed_document(existing: object, application_id: UUID, document_type: str) -> object:
+    """An already recorded document is only returned to a confirm for the same application and type."""
+    if existing.application_id != application_id or existing.document_type != document_type:  # type: ignore[attr-defined]
+        raise DocumentNotFoundError(str(existing.id))  # type: ignore[attr-defined]
+    return existing
+
+
+def _leave_record(row: object) -> tuple[str, str, str, datetime, datetime, str]:
+    return (str(row.user_id), row.user_name, row.room, row.leave_time, row.return_time, row.reason)  # type: ignore[attr-defined]
@@ -0,0 +1,21 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.exceptions import ValidationError
+
+
+def encode_cursor(created_at: datetime, application_id: UUID) -> str:
+    """Opaque keyset cursor for ListApplications: position after (created_at, id)."""
+    raw = f"{created_at.isoformat()}|{application_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, application_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(application_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValidationError("Invalid cursor", cause=e) from e
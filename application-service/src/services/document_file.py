@@ -0,0 +1,73 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+class RangeNotSatisfiableError(Exception):
+    """A well-formed Range that selects no byte of the file (HTTP 416)."""
+
+
+@dataclass
+class DocumentFileInfo:
+    """What a download answers with before (or instead of) the bytes."""
+
+    filename: str
+    content_type: str
+    size: int
+    etag: str
+    range_start: int = 0
+    range_end: int = -1
+    partial: bool = False
+    not_modified: bool = False
+    range_not_satisfiable: bool = False
+
+    @property
+    def length(self) -> int:
+        """Bytes that follow: the selected range, or the whole file."""
+        if self.not_modified or self.range_not_satisfiable:
+            return 0
+        return self.range_end - self.range_start + 1 if self.partial else self.size
+
+
+@dataclass
+class UploadSession:
+    """Presigned POST a client uploads a document with, straight to storage."""
+
+    document_id: str
+    url: str
+    fields: dict[str, str]
+    max_size: int
+    expires_at: datetime
+
+
+def parse_byte_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Single `bytes=` range from an HTTP Range header as inclusive (start, end) clamped
+    to the file. Returns None when the header is absent, malformed or asks for several
+    ranges, in which case the whole file is served (RFC 9110, 14.2).
+    """
+    match = _RANGE.fullmatch(header.strip().replace(" ", ""))
+    if not match or match[1] == match[2] == "":
+        return None
+    if match[1] == "":
+        suffix = int(match[2])
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiableError()
+        return max(size - suffix, 0), size - 1
+    start = int(match[1])
+    end = int(match[2]) if match[2] else size - 1
+    if match[2] and end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiableError()
+    return start, min(end, size - 1)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of If-None-Match against the quoted ETag, as HTTP requires for it."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
@@ -0,0 +1,78 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+import structlog
+
+from src.repositories.partition_repository import PartitionRepository
+
+logger = structlog.get_logger(__name__)
+
+# BR-EXIT-007: application history is kept for at least a year.
+MIN_HISTORY_MONTHS = 12
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+async def maintain_partitions(
+    repository: PartitionRepository,
+    *,
+    today: date,
+    months_ahead: int,
+    archive_after_months: int,
+    archive_tablespace: str = "",
+) -> tuple[int, int]:
+    """
+    Create the partitions for the current month and `months_ahead` following ones, and
+    archive months that ended more than `archive_after_months` ago (0 keeps everything;
+    smaller values are raised to MIN_HISTORY_MONTHS). Returns (created, archived).
+    """
+    current = today.replace(day=1)
+    existing = set(await repository.list_months())
+    created = 0
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        if month not in existing:
+            await repository.create_month(month)
+            created += 1
+    archived = 0
+    if archive_after_months > 0:
+        cutoff = add_months(current, -max(archive_after_months, MIN_HISTORY_MONTHS))
+        for month in sorted(existing):
+            if month < cutoff:
+                await repository.archive_month(month, archive_tablespace)
+                archived += 1
+    return created, archived
+
+
+async def run_partition_maintenance(
+    *,
+    interval_seconds: float,
+    months_ahead: int,
+    archive_after_months: int,
+    archive_tablespace: str,
+) -> None:
+    """Background loop started from the app lifespan; one instance at a time does the work."""
+    from src.database import async_session_factory
+
+    while True:
+        try:
+            async with async_session_factory() as session:
+                if session.get_bind().dialect.name == "postgresql":
+                    repository = PartitionRepository(session)
+                    if await repository.try_lock():
+                        created, archived = await maintain_partitions(
+                            repository,
+                            today=datetime.now(timezone.utc).date(),
+                            months_ahead=months_ahead,
+                            archive_after_months=archive_after_months,
+                            archive_tablespace=archive_tablespace,
+                        )
+                        await session.commit()
+                        if created or archived:
+                            logger.info("partitions_maintained", created=created, archived=archived)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("partition_maintenance_failed", error=str(e))
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import structlog
+
+from src.grpc_clients.auth_client import AuthClientProtocol
+from src.repositories.resident_directory_repository import ResidentDirectoryRepository
+
+logger = structlog.get_logger(__name__)
+
+
+def user_name_from_info(info: object | None) -> str | None:
+    """Display name from a resident_directory row (full_name) or an auth UserInfo (name parts)."""
+    if info is None:
+        return None
+    full_name = getattr(info, "full_name", None)
+    if full_name is not None:
+        return full_name or None
+    last = getattr(info, "last_name", "") or ""
+    first = getattr(info, "first_name", "") or ""
+    patronymic = getattr(info, "patronymic", "") or ""
+    return f"{last} {first} {patronymic}".strip() or None
+
+
+async def resolve_residents(auth: AuthClientProtocol, applications: list) -> dict[str, object]:
+    """
+    Map user_id -> resident data for enrichment. Uses the `resident` rows loaded by
+    the list query and asks auth-service (one batch call) only for applicants not
+    yet in the local directory or tombstoned there.
+    """
+    residents: dict[str, object] = {}
+    for app in applications:
+        resident = getattr(app, "resident", None)
+        if resident is not None and resident.full_name:
+            residents[str(app.user_id)] = resident
+    missing = [str(app.user_id) for app in applications if str(app.user_id) not in residents]
+    if missing:
+        residents.update(await auth.get_users_info(missing))
+    return residents
+
+
+async def refresh_stale_residents(
+    repository: ResidentDirectoryRepository,
+    auth: AuthClientProtocol,
+    *,
+    max_age_seconds: float,
+    batch_size: int,
+) -> int:
+    """
+    Refresh one batch of missing or stale directory rows from auth-service. Users auth
+    no longer returns are tombstoned so they do not hold the head of the queue.
+    Returns the number of users processed.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=max_age_seconds)
+    user_ids = await repository.get_user_ids_to_refresh(refreshed_before=cutoff, limit=batch_size)
+    if not user_ids:
+        return 0
+    infos = await auth.get_users_info([str(u) for u in user_ids])
+    await repository.upsert_many(list(infos.values()))
+    await repository.mark_refreshed([u for u in user_ids if str(u) not in infos])
+    return len(user_ids)
+
+
+async def run_resident_directory_refresh(
+    *,
+    interval_seconds: float,
+    max_age_seconds: float,
+    batch_size: int,
+) -> None:
+    """
+    Background loop started from the app lifespan; drains stale rows batch by batch.
+    Bypasses the user-info cache, whose negative entries would re-tombstone users
+    auth-service has learned about since.
+    """
+    from src.database import async_session_factory
+    from src.grpc_clients.auth_client import get_uncached_auth_client
+
+    auth = get_uncached_auth_client()
+    while True:
+        try:
+            while True:
+                async with async_session_factory() as session:
+                    refreshed = await refresh_stale_residents(
+                        ResidentDirectoryRepository(session),
+                        auth,
+                        max_age_seconds=max_age_seconds,
+                        batch_size=batch_size,
+                    )
+                    await session.commit()
+                if refreshed:
+                    logger.info("resident_directory_refreshed", count=refreshed)
+                if refreshed < batch_size:
+                    break
+        except Exception as e:  # noqa: BLE001
+            logger.warning("resident_directory_refresh_failed", error=str(e))
+        await asyncio.sleep(interval_seconds)
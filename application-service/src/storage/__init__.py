@@ -1,3 +1,12 @@
+from src.storage.document_storage import StorageProtocol, close_storage, get_storage, init_storage
 from src.storage.minio_storage import MinioStorage
+from src.storage.s3_storage import AsyncS3Storage
 
-__all__ = ["MinioStorage"]
+__all__ = [
+    "AsyncS3Storage",
+    "MinioStorage",
+    "StorageProtocol",
+    "close_storage",
+    "get_storage",
+    "init_storage",
+]
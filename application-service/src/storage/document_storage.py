@@ -0,0 +1,128 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Protocol
+from uuid import UUID
+
+import structlog
+
+from src.config import minio_settings
+
+# Pieces a download is read from storage and passed on in.
+DOWNLOAD_CHUNK_SIZE_BYTES = 256 * 1024
+# Smallest part S3 accepts in a multipart upload (all but the last part).
+UPLOAD_PART_SIZE_BYTES = 5 * 1024 * 1024
+
+STORAGE_BACKEND_THREADED = "threaded"
+STORAGE_BACKEND_ASYNC = "async"
+
+logger = structlog.get_logger(__name__)
+
+
+def document_object_name(
+    application_id: UUID, document_id: UUID, extension: str, document_type: str | None = None
+) -> str:
+    """
+    Object key of a document. Direct uploads also carry the document type, so the key
+    a POST policy pins binds the type chosen at session creation.
+    """
+    if document_type is not None:
+        return f"{application_id}/{document_type}/{document_id}.{extension}"
+    return f"{application_id}/{document_id}.{extension}"
+
+
+class StorageProtocol(Protocol):
+    async def ensure_bucket(self) -> None:
+        ...
+
+    async def upload_file(
+        self,
+        application_id: UUID,
+        document_id: UUID,
+        data: bytes,
+        content_type: str,
+        extension: str,
+    ) -> str:
+        ...
+
+    async def upload_stream(
+        self,
+        application_id: UUID,
+        document_id: UUID,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        extension: str,
+    ) -> str:
+        ...
+
+    async def presigned_upload_policy(
+        self,
+        object_name: str,
+        content_type: str,
+        max_size: int,
+        expiry_seconds: int = 900,
+    ) -> tuple[str, dict[str, str]]:
+        ...
+
+    async def get_presigned_download_url(self, object_name: str, expiry_seconds: int = 3600) -> str:
+        ...
+
+    async def stat_object(self, object_name: str) -> tuple[int, str, str]:
+        """(size, content_type, quoted ETag) of an object, without reading it."""
+        ...
+
+    async def head_object(self, object_name: str) -> int | None:
+        """Size of an object, or None when it does not exist (yet)."""
+        ...
+
+    def iter_object(
+        self,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE_BYTES,
+    ) -> AsyncGenerator[bytes, None]:
+        ...
+
+    async def delete_file(self, object_name: str) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+_storage: StorageProtocol | None = None
+
+
+def get_storage() -> StorageProtocol:
+    """Process-wide storage shared by the gRPC servicer and REST dependencies."""
+    global _storage
+    if _storage is None:
+        if minio_settings.backend == STORAGE_BACKEND_ASYNC:
+            from src.storage.s3_storage import AsyncS3Storage
+
+            _storage = AsyncS3Storage()
+        else:
+            from src.storage.minio_storage import MinioStorage
+
+            _storage = MinioStorage()
+    return _storage
+
+
+async def init_storage() -> StorageProtocol:
+    """Create the storage and make sure the bucket exists; called once from the app lifespan."""
+    storage = get_storage()
+    try:
+        # Bounded so an unreachable MinIO cannot hold up startup; uploads retry the check.
+        await asyncio.wait_for(storage.ensure_bucket(), minio_settings.startup_check_timeout_seconds)
+    except Exception as e:  # noqa: BLE001
+        logger.warning(
+            "minio_bucket_check_failed", bucket=minio_settings.bucket_applications, error=str(e) or type(e).__name__
+        )
+    return storage
+
+
+async def close_storage() -> None:
+    global _storage
+    storage, _storage = _storage, None
+    if storage is not None:
+        await storage.close()
@@ -1,21 +1,115 @@
 import asyncio
-from datetime import timedelta
-from io import BytesIO
+import os
+from collections.abc import AsyncGenerator, AsyncIterator
+from datetime import datetime, timedelta, timezone
+from io import BytesIO, RawIOBase
 from uuid import UUID
 
+import certifi
+import urllib3
 from minio import Minio
+from minio.datatypes import PostPolicy
 from minio.error import S3Error
 
 from src.config import minio_settings
+from src.storage.document_storage import (
+    DOWNLOAD_CHUNK_SIZE_BYTES,
+    UPLOAD_PART_SIZE_BYTES,
+    document_object_name,
+)
+
+
+class _ChunkStreamReader(RawIOBase):
+    """
+    Blocking file-like view of an async chunk iterator, for minio's put_object running
+    in a worker thread. Each read() pulls the next chunk on the event loop and hands
+    out at most one chunk, so only the part being assembled and one chunk are in memory.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], loop: asyncio.AbstractEventLoop) -> None:
+        self._chunks = chunks
+        self._loop = loop
+        self._pending = b""
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    async def _next_chunk(self) -> bytes:
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._pending and not self._eof:
+            self._pending = asyncio.run_coroutine_threadsafe(self._next_chunk(), self._loop).result()
+            self._eof = not self._pending
+        if size < 0 or size >= len(self._pending):
+            data, self._pending = self._pending, b""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+
+def presign_upload_policy(
+    client: Minio,
+    bucket: str,
+    object_name: str,
+    content_type: str,
+    max_size: int,
+    expiry_seconds: int,
+) -> tuple[str, dict[str, str]]:
+    """
+    Browser-side POST upload of exactly `object_name`: the form action URL and the
+    fields to send before the file. MinIO itself rejects other keys, another
+    Content-Type and bodies outside 1..max_size bytes.
+    """
+    policy = PostPolicy(bucket, datetime.now(timezone.utc) + timedelta(seconds=expiry_seconds))
+    policy.add_equals_condition("key", object_name)
+    policy.add_equals_condition("Content-Type", content_type)
+    policy.add_content_length_range_condition(1, max_size)
+    fields = client.presigned_post_policy(policy)
+    fields.update({"key": object_name, "Content-Type": content_type})
+    scheme = "https" if minio_settings.secure else "http"
+    endpoint = minio_settings.public_endpoint or minio_settings.endpoint
+    return f"{scheme}://{endpoint}/{bucket}", fields
+
+
+def presign_download_url(client: Minio, bucket: str, object_name: str, expiry_seconds: int) -> str:
+    return client.presigned_get_object(bucket, object_name, expires=timedelta(seconds=expiry_seconds))
+
+
+def _http_client() -> urllib3.PoolManager:
+    """
+    minio's default pool (read timeout, retries, CA bundle) with the configured size and
+    a short connect timeout, so an unreachable MinIO fails fast instead of after minutes.
+    """
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=minio_settings.connect_timeout_seconds, read=300),
+        maxsize=minio_settings.pool_maxsize,
+        block=False,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
 
 
 class MinioStorage:
-    def __init__(self) -> None:
+    """
+    minio-py calls offloaded to worker threads (MINIO_BACKEND=threaded, the default).
+    One per process (see document_storage.get_storage): the clients share a single urllib3 pool, and the
+    bucket is checked once by ensure_bucket at startup rather than before every call.
+    """
+
+    def __init__(self, http_client: urllib3.PoolManager | None = None) -> None:
+        self._http = http_client or _http_client()
         self._client = Minio(
             minio_settings.endpoint,
             access_key=minio_settings.access_key,
             secret_key=minio_settings.secret_key,
             secure=minio_settings.secure,
+            http_client=self._http,
         )
         self._presign_client = (
             Minio(
@@ -24,18 +118,32 @@ class MinioStorage:
                 secret_key=minio_settings.secret_key,
                 secure=minio_settings.secure,
                 region="us-east-1",
+                http_client=self._http,
             )
             if minio_settings.public_endpoint
             else self._client
         )
         self._bucket = minio_settings.bucket_applications
+        self._bucket_ready = False
 
     def _ensure_bucket(self) -> None:
+        """Create the bucket if missing; after the first success this costs nothing."""
+        if self._bucket_ready:
+            return
         try:
             if not self._client.bucket_exists(self._bucket):
                 self._client.make_bucket(self._bucket)
-        except S3Error:
-            pass
+        except S3Error as e:
+            # Another instance created it between the two calls.
+            if e.code not in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+                raise
+        self._bucket_ready = True
+
+    async def ensure_bucket(self) -> None:
+        await asyncio.to_thread(self._ensure_bucket)
+
+    async def close(self) -> None:
+        self._http.clear()
 
     async def upload_file(
         self,
@@ -47,7 +155,7 @@ class MinioStorage:
     ) -> str:
         def _put() -> str:
             self._ensure_bucket()
-            object_name = f"{application_id}/{document_id}.{extension}"
+            object_name = document_object_name(application_id, document_id, extension)
             self._client.put_object(
                 self._bucket,
                 object_name,
@@ -59,45 +167,109 @@ class MinioStorage:
 
         return await asyncio.to_thread(_put)
 
+    async def upload_stream(
+        self,
+        application_id: UUID,
+        document_id: UUID,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        extension: str,
+    ) -> str:
+        """
+        Streaming multipart put: parts of UPLOAD_PART_SIZE_BYTES are sent as soon as
+        they fill up (smaller files go out as a single PUT). If `chunks` raises, the
+        multipart upload is aborted and the error propagates.
+        """
+        reader = _ChunkStreamReader(chunks, asyncio.get_running_loop())
+
+        def _put() -> str:
+            self._ensure_bucket()
+            object_name = document_object_name(application_id, document_id, extension)
+            self._client.put_object(
+                self._bucket,
+                object_name,
+                reader,
+                length=-1,
+                part_size=UPLOAD_PART_SIZE_BYTES,
+                content_type=content_type,
+                num_parallel_uploads=1,  # parallel parts would buffer several parts at once
+            )
+            return object_name
+
+        return await asyncio.to_thread(_put)
+
     async def get_presigned_download_url(
         self,
         object_name: str,
         expiry_seconds: int = 3600,
     ) -> str:
         def _presign() -> str:
-            return self._presign_client.presigned_get_object(
-                self._bucket,
-                object_name,
-                expires=timedelta(seconds=expiry_seconds),
-            )
+            return presign_download_url(self._presign_client, self._bucket, object_name, expiry_seconds)
 
         return await asyncio.to_thread(_presign)
 
-    async def get_object(
+    async def presigned_upload_policy(
         self,
         object_name: str,
-    ) -> tuple[bytes, str]:
-        """Get object bytes and content_type. Uses internal endpoint (no public URL)."""
+        content_type: str,
+        max_size: int,
+        expiry_seconds: int = 900,
+    ) -> tuple[str, dict[str, str]]:
+        """See presign_upload_policy; runs in a thread as minio may look up the bucket region."""
 
-        def _get() -> tuple[bytes, str]:
+        def _presign() -> tuple[str, dict[str, str]]:
             self._ensure_bucket()
-            response = self._client.get_object(self._bucket, object_name)
+            return presign_upload_policy(
+                self._presign_client, self._bucket, object_name, content_type, max_size, expiry_seconds
+            )
+
+        return await asyncio.to_thread(_presign)
+
+    async def head_object(self, object_name: str) -> int | None:
+        """Size of an object, or None when it does not exist (yet)."""
+
+        def _head() -> int | None:
             try:
-                data = response.read()
-                content_type = (
-                    response.headers.get("Content-Type")
-                    if hasattr(response.headers, "get")
-                    else getattr(response, "content_type", None)
-                ) or "application/octet-stream"
-                return data, content_type
-            finally:
-                response.close()
-
-        return await asyncio.to_thread(_get)
+                return self._client.stat_object(self._bucket, object_name).size or 0
+            except S3Error as e:
+                if e.code in ("NoSuchKey", "NoSuchObject"):
+                    return None
+                raise
+
+        return await asyncio.to_thread(_head)
+
+    async def stat_object(self, object_name: str) -> tuple[int, str, str]:
+        """(size, content_type, quoted ETag) of an object, without reading it."""
+
+        def _stat() -> tuple[int, str, str]:
+            stat = self._client.stat_object(self._bucket, object_name)
+            return stat.size or 0, stat.content_type or "application/octet-stream", f'"{stat.etag}"'
+
+        return await asyncio.to_thread(_stat)
+
+    async def iter_object(
+        self,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE_BYTES,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Object bytes from `offset` (`length` bytes, 0 = to the end) as chunks of at most
+        `chunk_size`, read from the internal endpoint one chunk at a time.
+        """
+        response = await asyncio.to_thread(
+            self._client.get_object, self._bucket, object_name, offset=offset, length=length
+        )
+        try:
+            while chunk := await asyncio.to_thread(response.read, chunk_size):
+                yield chunk
+        finally:
+            response.close()
+            response.release_conn()
 
     async def delete_file(self, object_name: str) -> None:
         def _remove() -> None:
-            self._ensure_bucket()
             self._client.remove_object(self._bucket, object_name)
 
         await asyncio.to_thread(_remove)
@@ -0,0 +1,368 @@
+import asyncio
+import hashlib
+import itertools
+import random
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from urllib.parse import quote, urlsplit
+from uuid import UUID
+from xml.etree import ElementTree
+
+import httpx
+from minio import Minio
+from minio.credentials import Credentials
+from minio.signer import sign_v4_s3
+from minio.time import to_amz_date
+
+from src.config import minio_settings
+from src.storage.document_storage import (
+    DOWNLOAD_CHUNK_SIZE_BYTES,
+    UPLOAD_PART_SIZE_BYTES,
+    document_object_name,
+)
+from src.storage.minio_storage import presign_download_url, presign_upload_policy
+
+# httpcore re-checks every idle connection of a pool on each request, so one large pool
+# costs O(connections) CPU per request; several small pools keep that constant.
+CONNECTIONS_PER_POOL = 4
+_UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+class S3RequestError(Exception):
+    def __init__(self, status: int, code: str, message: str = "") -> None:
+        super().__init__(f"{status} {code}: {message}" if message else f"{status} {code}")
+        self.status = status
+        self.code = code
+
+
+def _error_from(response: httpx.Response, body: bytes = b"") -> S3RequestError:
+    code, message = "", ""
+    if body:
+        try:
+            root = ElementTree.fromstring(body)
+            code, message = root.findtext("Code") or "", root.findtext("Message") or ""
+        except ElementTree.ParseError:
+            pass
+    if not code:
+        code = "NoSuchKey" if response.status_code == 404 else response.reason_phrase
+    return S3RequestError(response.status_code, code, message)
+
+
+class AsyncS3Storage:
+    """
+    S3 requests sent from the event loop with httpx (MINIO_BACKEND=async), instead of
+    minio-py calls parked on the default thread pool. At most `max_concurrency` requests
+    are in flight, spread over small connection pools; waiting for a slot and each request
+    are bounded by the timeout, and idempotent requests are retried on network errors and
+    5xx with full-jitter backoff.
+    Requests are signed with minio-py's SigV4 helper; presigned URLs and POST policies
+    need no I/O and are still produced by minio-py.
+    """
+
+    def __init__(
+        self,
+        clients: list[httpx.AsyncClient] | None = None,
+        *,
+        download_clients: list[httpx.AsyncClient] | None = None,
+        max_concurrency: int | None = None,
+        timeout_seconds: float | None = None,
+        max_retries: int | None = None,
+        retry_backoff_seconds: float | None = None,
+    ) -> None:
+        max_concurrency = max_concurrency or minio_settings.max_concurrent_requests
+        self._timeout = timeout_seconds or minio_settings.request_timeout_seconds
+        limits = httpx.Limits(max_connections=CONNECTIONS_PER_POOL, max_keepalive_connections=CONNECTIONS_PER_POOL)
+
+        def _pools() -> list[httpx.AsyncClient]:
+            return [
+                httpx.AsyncClient(timeout=self._timeout, limits=limits)
+                for _ in range(-(-max_concurrency // CONNECTIONS_PER_POOL))
+            ]
+
+        self._clients = clients or _pools()
+        # Download bodies are read at the client's pace; their connections live in separate
+        # pools so slow readers cannot block uploads, HEADs and deletes.
+        self._download_clients = download_clients or clients or _pools()
+        self._next_client = itertools.cycle(self._clients)
+        self._next_download_client = itertools.cycle(self._download_clients)
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._max_retries = minio_settings.max_retries if max_retries is None else max_retries
+        self._retry_backoff = (
+            minio_settings.retry_backoff_seconds if retry_backoff_seconds is None else retry_backoff_seconds
+        )
+        self._secure = minio_settings.secure
+        self._base_url = f"{'https' if self._secure else 'http'}://{minio_settings.endpoint}"
+        self._region = minio_settings.region
+        self._credentials = Credentials(minio_settings.access_key, minio_settings.secret_key)
+        self._bucket = minio_settings.bucket_applications
+        self._bucket_ready = False
+        # Signing only: with the region given, minio-py presigns without any request.
+        self._presign_client = Minio(
+            minio_settings.public_endpoint or minio_settings.endpoint,
+            access_key=minio_settings.access_key,
+            secret_key=minio_settings.secret_key,
+            secure=self._secure,
+            region=self._region,
+        )
+
+    def _url(self, object_name: str = "", query: dict[str, str] | None = None) -> str:
+        path = f"/{self._bucket}" + (f"/{quote(object_name, safe='/~')}" if object_name else "")
+        if query:
+            path += "?" + "&".join(f"{quote(k, safe='~')}={quote(v, safe='~')}" for k, v in sorted(query.items()))
+        return self._base_url + path
+
+    def _build(
+        self, client: httpx.AsyncClient, method: str, url: str, headers: dict[str, str] | None, body: bytes | None
+    ) -> httpx.Request:
+        """Sign a request; done per attempt, since the signature covers the timestamp."""
+        now = datetime.now(timezone.utc)
+        split = urlsplit(url)
+        if not body:
+            payload_hash = _EMPTY_SHA256
+        elif self._secure:
+            payload_hash = _UNSIGNED_PAYLOAD
+        else:
+            payload_hash = hashlib.sha256(body).hexdigest()
+        signed = {
+            **(headers or {}),
+            "Host": split.netloc,
+            "x-amz-date": to_amz_date(now),
+            "x-amz-content-sha256": payload_hash,
+        }
+        signed = sign_v4_s3(
+            method=method,
+            url=split,
+            region=self._region,
+            headers=signed,
+            credentials=self._credentials,
+            content_sha256=payload_hash,
+            date=now,
+        )
+        return client.build_request(method, url, headers=signed, content=body or None)
+
+    @asynccontextmanager
+    async def _slot(self) -> AsyncIterator[None]:
+        """A concurrency slot, waited for at most the request timeout."""
+        try:
+            async with asyncio.timeout(self._timeout):
+                await self._slots.acquire()
+        except TimeoutError:
+            raise S3RequestError(503, "SlowDown", "no free storage request slot") from None
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    async def _backoff(self, attempt: int) -> None:
+        await asyncio.sleep(random.uniform(0, self._retry_backoff * 2**attempt))
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        retry: bool = True,
+        stream: bool = False,
+        pools: Iterator[httpx.AsyncClient] | None = None,
+    ) -> httpx.Response:
+        """
+        One request, retried when `retry` on network errors and 5xx. The caller holds a
+        concurrency slot; a streamed response must be closed by the caller.
+        """
+        attempts = self._max_retries + 1 if retry else 1
+        for attempt in range(attempts):
+            client = next(pools or self._next_client)
+            try:
+                response = await client.send(self._build(client, method, url, headers, body), stream=stream)
+            except httpx.TransportError:
+                if attempt + 1 >= attempts:
+                    raise
+            else:
+                if response.status_code < 500 or attempt + 1 >= attempts:
+                    return response
+                await response.aclose()
+            await self._backoff(attempt)
+        raise AssertionError("unreachable")
+
+    async def _request(
+        self,
+        method: str,
+        object_name: str = "",
+        *,
+        query: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        retry: bool = True,
+        allow: tuple[int, ...] = (),
+    ) -> httpx.Response:
+        """Request with a concurrency slot; non-2xx statuses not in `allow` raise S3RequestError."""
+        async with self._slot():
+            response = await self._send(
+                method, self._url(object_name, query), headers=headers, body=body, retry=retry
+            )
+        if response.status_code >= 300 and response.status_code not in allow:
+            raise _error_from(response, response.content)
+        return response
+
+    async def ensure_bucket(self) -> None:
+        if self._bucket_ready:
+            return
+        if (await self._request("HEAD", allow=(404,))).status_code == 404:
+            await self._request("PUT", allow=(409,))  # 409: created meanwhile by another instance
+        self._bucket_ready = True
+
+    async def upload_file(
+        self,
+        application_id: UUID,
+        document_id: UUID,
+        data: bytes,
+        content_type: str,
+        extension: str,
+    ) -> str:
+        await self.ensure_bucket()
+        object_name = document_object_name(application_id, document_id, extension)
+        await self._request("PUT", object_name, headers={"Content-Type": content_type}, body=data)
+        return object_name
+
+    async def upload_stream(
+        self,
+        application_id: UUID,
+        document_id: UUID,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        extension: str,
+    ) -> str:
+        """
+        Same contract as MinioStorage.upload_stream: parts of at least UPLOAD_PART_SIZE_BYTES
+        go out one at a time as they fill up, a file smaller than one part is a single
+        PUT, and an error from `chunks` (or cancellation) aborts the multipart upload.
+        """
+        await self.ensure_bucket()
+        object_name = document_object_name(application_id, document_id, extension)
+        buffer = bytearray()
+        upload_id = ""
+        etags: list[str] = []
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                if len(buffer) >= UPLOAD_PART_SIZE_BYTES:
+                    if not upload_id:
+                        upload_id = await self._create_multipart(object_name, content_type)
+                    etags.append(await self._upload_part(object_name, upload_id, len(etags) + 1, bytes(buffer)))
+                    buffer.clear()
+            if not upload_id:
+                await self._request("PUT", object_name, headers={"Content-Type": content_type}, body=bytes(buffer))
+                return object_name
+            if buffer:
+                etags.append(await self._upload_part(object_name, upload_id, len(etags) + 1, bytes(buffer)))
+            await self._complete_multipart(object_name, upload_id, etags)
+        except BaseException:
+            if upload_id:
+                await self._abort_multipart(object_name, upload_id)
+            raise
+        return object_name
+
+    async def _create_multipart(self, object_name: str, content_type: str) -> str:
+        # Not retried: a repeat would leave an orphaned upload behind.
+        response = await self._request(
+            "POST", object_name, query={"uploads": ""}, headers={"Content-Type": content_type}, retry=False
+        )
+        return ElementTree.fromstring(response.content).findtext("{*}UploadId") or ""
+
+    async def _upload_part(self, object_name: str, upload_id: str, number: int, data: bytes) -> str:
+        response = await self._request(
+            "PUT", object_name, query={"partNumber": str(number), "uploadId": upload_id}, body=data
+        )
+        return response.headers["ETag"]
+
+    async def _complete_multipart(self, object_name: str, upload_id: str, etags: list[str]) -> None:
+        # Not retried: if the first attempt completed the upload, a repeat gets NoSuchUpload.
+        parts = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in enumerate(etags, start=1)
+        )
+        response = await self._request(
+            "POST",
+            object_name,
+            query={"uploadId": upload_id},
+            headers={"Content-Type": "application/xml"},
+            body=f"<CompleteMultipartUpload>{parts}</CompleteMultipartUpload>".encode(),
+            retry=False,
+        )
+        # S3 may report a failed completion in the body of a 200 response.
+        if ElementTree.fromstring(response.content).tag.endswith("Error"):
+            raise _error_from(response, response.content)
+
+    async def _abort_multipart(self, object_name: str, upload_id: str) -> None:
+        try:
+            await self._request("DELETE", object_name, query={"uploadId": upload_id}, allow=(404,))
+        except Exception:  # noqa: BLE001
+            pass  # the bucket lifecycle cleans up what could not be aborted
+
+    async def presigned_upload_policy(
+        self,
+        object_name: str,
+        content_type: str,
+        max_size: int,
+        expiry_seconds: int = 900,
+    ) -> tuple[str, dict[str, str]]:
+        await self.ensure_bucket()
+        return presign_upload_policy(
+            self._presign_client, self._bucket, object_name, content_type, max_size, expiry_seconds
+        )
+
+    async def get_presigned_download_url(self, object_name: str, expiry_seconds: int = 3600) -> str:
+        return presign_download_url(self._presign_client, self._bucket, object_name, expiry_seconds)
+
+    async def stat_object(self, object_name: str) -> tuple[int, str, str]:
+        response = await self._request("HEAD", object_name)
+        etag = response.headers.get("ETag", "")
+        return (
+            int(response.headers.get("Content-Length", 0)),
+            response.headers.get("Content-Type") or "application/octet-stream",
+            etag if etag.startswith('"') else f'"{etag}"',
+        )
+
+    async def head_object(self, object_name: str) -> int | None:
+        response = await self._request("HEAD", object_name, allow=(404,))
+        if response.status_code == 404:
+            return None
+        return int(response.headers.get("Content-Length", 0))
+
+    async def iter_object(
+        self,
+        object_name: str,
+        offset: int = 0,
+        length: int = 0,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE_BYTES,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Object bytes from `offset` (`length` bytes, 0 = to the end) in chunks of
+        `chunk_size`. A concurrency slot is held only until the response headers arrive;
+        the body is read from the download pools.
+        """
+        headers = {}
+        if offset or length:
+            headers["Range"] = f"bytes={offset}-{offset + length - 1 if length else ''}"
+        async with self._slot():
+            response = await self._send(
+                "GET", self._url(object_name), headers=headers, stream=True, pools=self._next_download_client
+            )
+        try:
+            if response.status_code >= 300:
+                raise _error_from(response, await response.aread())
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def delete_file(self, object_name: str) -> None:
+        await self._request("DELETE", object_name)
+
+    async def close(self) -> None:
+        for client in {*self._clients, *self._download_clients}:
+            await client.aclose()
@@ -52,8 +52,8 @@ def mock_app(mock_user_id):
 @pytest.fixture
 def mock_service(mock_app):
     class MockService:
-        async def list_applications(self, *, user_id=None, entrance=None, room=None, status=None, date_from=None, date_to=None, page=1, size=20):
-            return [mock_app], 1
+        async def list_applications(self, *, user_id=None, entrance=None, room=None, status=None, date_from=None, date_to=None, page=1, size=20, cursor=None, count_mode="exact"):
+            return [mock_app], 1, None
 
         async def get_application(self, application_id, current_user_id, current_user_roles):
             return mock_app
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from src.models.base import Base
 from src.models.application import ApplicationModel
 from src.models.application_document import ApplicationDocumentModel
+from src.models.resident_directory import ResidentDirectoryModel
 
 
 @pytest.fixture(scope="session")
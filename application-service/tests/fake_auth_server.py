@@ -0,0 +1,136 @@
+"""
+In-memory auth-service (campus.auth.AuthService) for tests and benchmarks.
+
+Run standalone to point a local application-service at it:
+    python -m tests.fake_auth_server --port 50051 --users 1000 --latency-ms 2
+"""
+import argparse
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+
+import grpc
+
+from tests.grpc_codegen import ensure_generated
+
+ensure_generated("auth.proto")
+
+import auth_pb2  # type: ignore[import-not-found]  # noqa: E402
+import auth_pb2_grpc  # type: ignore[import-not-found]  # noqa: E402
+
+
+@dataclass
+class FakeUser:
+    user_id: str
+    last_name: str = "Иванов"
+    first_name: str = "Иван"
+    patronymic: str = "Иванович"
+    building: str = "8"
+    entrance: int = 1
+    floor: int = 3
+    room: str = "301"
+    roles: list[str] = field(default_factory=lambda: ["student"])
+    is_minor: bool = False
+
+
+def _to_proto(user: FakeUser):
+    return auth_pb2.UserInfoResponse(
+        user_id=user.user_id,
+        last_name=user.last_name,
+        first_name=user.first_name,
+        patronymic=user.patronymic,
+        building=user.building,
+        entrance=user.entrance,
+        floor=user.floor,
+        room=user.room,
+        roles=user.roles,
+        is_minor=user.is_minor,
+    )
+
+
+class FakeAuthServicer(auth_pb2_grpc.AuthServiceServicer):
+    """Tokens are accepted when they map to a known user id; every call is counted."""
+
+    def __init__(self, users: list[FakeUser], tokens: dict[str, str] | None = None, latency_seconds: float = 0.0) -> None:
+        self.users = {u.user_id: u for u in users}
+        self.tokens = tokens or {}
+        self.latency_seconds = latency_seconds
+        self.calls: dict[str, int] = {}
+
+    async def _tick(self, method: str) -> None:
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+
+    async def ValidateToken(self, request, context):
+        await self._tick("ValidateToken")
+        user = self.users.get(self.tokens.get(request.token, ""))
+        if user is None:
+            return auth_pb2.ValidateTokenResponse(valid=False)
+        return auth_pb2.ValidateTokenResponse(
+            valid=True,
+            user_id=user.user_id,
+            roles=user.roles,
+            building=user.building,
+            entrance=user.entrance,
+            floor=user.floor,
+            room=user.room,
+        )
+
+    async def GetUserInfo(self, request, context):
+        await self._tick("GetUserInfo")
+        user = self.users.get(request.user_id)
+        if user is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
+        return _to_proto(user)
+
+    async def GetUsersInfo(self, request, context):
+        await self._tick("GetUsersInfo")
+        return auth_pb2.GetUsersInfoResponse(
+            users=[_to_proto(self.users[uid]) for uid in request.user_ids if uid in self.users]
+        )
+
+    async def GetUsers(self, request, context):
+        await self._tick("GetUsers")
+        matched = [
+            u
+            for u in self.users.values()
+            if (not request.entrance or u.entrance == request.entrance)
+            and (not request.room or u.room == request.room)
+        ]
+        return auth_pb2.GetUsersResponse(users=[_to_proto(u) for u in matched], total=len(matched))
+
+
+async def start_fake_auth_server(
+    servicer: FakeAuthServicer,
+    port: int = 0,
+) -> tuple[grpc.aio.Server, str]:
+    """Start the fake server on localhost; port 0 picks a free port. Returns (server, target)."""
+    server = grpc.aio.server()
+    auth_pb2_grpc.add_AuthServiceServicer_to_server(servicer, server)
+    bound = server.add_insecure_port(f"127.0.0.1:{port}")
+    await server.start()
+    return server, f"127.0.0.1:{bound}"
+
+
+def make_users(count: int) -> list[FakeUser]:
+    return [
+        FakeUser(user_id=str(uuid.UUID(int=i + 1)), entrance=i % 4 + 1, room=str(100 + i % 400))
+        for i in range(count)
+    ]
+
+
+async def _serve(port: int, users: int, latency_ms: float) -> None:
+    servicer = FakeAuthServicer(make_users(users), latency_seconds=latency_ms / 1000)
+    server, target = await start_fake_auth_server(servicer, port=port)
+    print(f"fake auth-service listening on {target} with {users} users")
+    await server.wait_for_termination()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=50051)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(_serve(args.port, args.users, args.latency_ms))
@@ -0,0 +1,76 @@
+"""
+Minimal S3/MinIO stand-in for benchmarks and local runs: an ASGI app that accepts any
+signature, answers bucket, object and multipart requests with plausible responses and
+keeps only object sizes (reads return zeros).
+
+Run standalone (uvicorn) to point a local application-service at it:
+    python -m tests.fake_s3_server --port 9000 --latency-ms 2
+"""
+import argparse
+import asyncio
+import os
+
+_LATENCY_ENV = "FAKE_S3_LATENCY_MS"
+_LOCATION = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<LocationConstraint xmlns="http://s3.amazonaws.com/doc/2006-03-01/"></LocationConstraint>'
+)
+
+_sizes: dict[str, int] = {}
+_parts: dict[str, int] = {}
+
+
+async def app(scope, receive, send) -> None:
+    if scope["type"] != "http":
+        return
+    received = 0
+    more = True
+    while more:
+        message = await receive()
+        received += len(message.get("body", b""))
+        more = message.get("more_body", False)
+    latency_ms = float(os.environ.get(_LATENCY_ENV, "0"))
+    if latency_ms:
+        await asyncio.sleep(latency_ms / 1000)
+
+    method, path, query = scope["method"], scope["path"], scope["query_string"].decode()
+    key = path.split("/", 2)[2] if path.count("/") > 1 else ""
+    status, body, headers = 200, b"", [(b"etag", b'"00000000000000000000000000000000"')]
+    if query.startswith("location"):
+        body = _LOCATION
+    elif method == "POST" and query.startswith("uploads"):
+        body = f"<InitiateMultipartUploadResult><UploadId>{key}</UploadId></InitiateMultipartUploadResult>".encode()
+    elif method == "POST" and "uploadId" in query:
+        _sizes[key] = _parts.pop(key, 0)
+        body = b"<CompleteMultipartUploadResult/>"
+    elif method == "PUT" and "partNumber" in query:
+        _parts[key] = _parts.get(key, 0) + received
+    elif method == "PUT" and key:
+        _sizes[key] = received
+    elif method == "DELETE":
+        _sizes.pop(key, None)
+        status = 204
+    elif method in ("HEAD", "GET") and key:
+        if key not in _sizes:
+            status = 404
+        else:
+            headers.append((b"content-type", b"application/octet-stream"))
+            if method == "GET":
+                body = bytes(_sizes[key])
+            else:
+                headers.append((b"content-length", str(_sizes[key]).encode()))
+    if method != "HEAD":
+        headers.append((b"content-length", str(len(body)).encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    os.environ[_LATENCY_ENV] = str(args.latency_ms)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning", lifespan="off")
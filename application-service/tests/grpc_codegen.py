@@ -0,0 +1,38 @@
+"""Generate gRPC modules from proto/ for tests and benchmarks (the image does this at build time)."""
+import importlib
+import sys
+import tempfile
+from pathlib import Path
+
+PROTO_DIR = Path(__file__).resolve().parent.parent / "proto"
+_out_dir: Path | None = None
+
+
+def ensure_generated(proto_name: str) -> None:
+    """Make `<name>_pb2` and `<name>_pb2_grpc` importable, compiling the proto if needed."""
+    global _out_dir
+    stem = Path(proto_name).stem
+    try:
+        importlib.import_module(f"{stem}_pb2")
+        importlib.import_module(f"{stem}_pb2_grpc")
+        return
+    except ImportError:
+        pass
+
+    from grpc_tools import protoc
+
+    if _out_dir is None:
+        _out_dir = Path(tempfile.mkdtemp(prefix="grpc_gen_"))
+        sys.path.insert(0, str(_out_dir))
+    code = protoc.main(
+        [
+            "grpc_tools.protoc",
+            f"-I{PROTO_DIR}",
+            f"--python_out={_out_dir}",
+            f"--grpc_python_out={_out_dir}",
+            str(PROTO_DIR / proto_name),
+        ]
+    )
+    if code != 0:
+        raise RuntimeError(f"protoc failed for {proto_name}")
+    importlib.invalidate_caches()
@@ -0,0 +1,105 @@
+"""Bulk DecideApplications: one UPDATE for the batch, one SELECT to classify the rest."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.constants.error_codes import APP_ALREADY_DECIDED, APP_APPLICATION_NOT_FOUND, APP_MINOR_VOICE_REQUIRED
+from src.domain.exceptions import ValidationError
+from src.grpc_clients.auth_client import AuthClientStub
+from src.repositories.application_document_repository import ApplicationDocumentRepository
+from src.repositories.application_repository import ApplicationRepository
+from src.services.application_service import MAX_DECIDE_BATCH_SIZE, ApplicationService
+
+
+async def _create(repo: ApplicationRepository, is_minor: bool = False):
+    now = datetime.now(timezone.utc)
+    return await repo.create(
+        user_id=uuid4(),
+        is_minor=is_minor,
+        leave_time=now,
+        return_time=now + timedelta(hours=2),
+        reason="Магазин",
+        contact_phone="+79001234567",
+    )
+
+
+def _service(db_session) -> ApplicationService:
+    return ApplicationService(
+        application_repository=ApplicationRepository(db_session),
+        document_repository=ApplicationDocumentRepository(db_session),
+        storage=None,  # type: ignore[arg-type]
+        auth_client=AuthClientStub(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_mixed_batch_in_two_statements(db_session) -> None:
+    repo = ApplicationRepository(db_session)
+    documents = ApplicationDocumentRepository(db_session)
+    adult = await _create(repo)
+    minor_with_voice = await _create(repo, is_minor=True)
+    await documents.create(
+        application_id=minor_with_voice.id,
+        document_type="voice_message",
+        file_url=f"{minor_with_voice.id}/voice.m4a",
+        uploaded_by=minor_with_voice.user_id,
+    )
+    minor_without_voice = await _create(repo, is_minor=True)
+    decided = await _create(repo)
+    await repo.decide(decided.id, "rejected", uuid4(), datetime.now(timezone.utc))
+    missing = uuid4()
+    ids = [adult.id, minor_with_voice.id, minor_without_voice.id, decided.id, missing, adult.id]
+
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", _capture)
+    try:
+        results = await _service(db_session).decide_applications(ids, "approved", uuid4(), datetime.now(timezone.utc))
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", _capture)
+
+    assert [s.lstrip().split(None, 1)[0].upper() for s in statements] == ["UPDATE", "SELECT"]
+    # Both go through the leave-time lookup so PostgreSQL prunes to the rows' partitions.
+    assert all("application_leave_times" in s for s in statements)
+    assert [(application_id, code) for application_id, _, code in results] == [
+        (adult.id, None),
+        (minor_with_voice.id, None),
+        (minor_without_voice.id, APP_MINOR_VOICE_REQUIRED),
+        (decided.id, APP_ALREADY_DECIDED),
+        (missing, APP_APPLICATION_NOT_FOUND),
+    ]
+    assert results[0][1].status == "approved"
+    assert (await repo.get_by_id(decided.id)).status == "rejected"
+
+
+@pytest.mark.asyncio
+async def test_fully_applied_batch_skips_classification(db_session) -> None:
+    repo = ApplicationRepository(db_session)
+    apps = [await _create(repo) for _ in range(3)]
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", _capture)
+    try:
+        results = await _service(db_session).decide_applications(
+            [a.id for a in apps], "rejected", uuid4(), datetime.now(timezone.utc), reject_reason="Карантин"
+        )
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", _capture)
+
+    assert len(statements) == 1
+    assert all(code is None and app.reject_reason == "Карантин" for _, app, code in results)
+
+
+@pytest.mark.asyncio
+async def test_batch_size_is_capped(db_session) -> None:
+    ids = [uuid4() for _ in range(MAX_DECIDE_BATCH_SIZE + 1)]
+    with pytest.raises(ValidationError):
+        await _service(db_session).decide_applications(ids, "approved", uuid4(), datetime.now(timezone.utc))
@@ -0,0 +1,102 @@
+"""ApplicationRepository.decide: single conditional UPDATE ... RETURNING."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.domain.exceptions import ApplicationAlreadyDecidedError, MinorVoiceRequiredError
+from src.grpc_clients.auth_client import AuthClientStub
+from src.repositories.application_document_repository import ApplicationDocumentRepository
+from src.repositories.application_repository import ApplicationRepository
+from src.services.application_service import ApplicationService
+
+
+async def _create(repo: ApplicationRepository, is_minor: bool = False):
+    now = datetime.now(timezone.utc)
+    return await repo.create(
+        user_id=uuid4(),
+        is_minor=is_minor,
+        leave_time=now,
+        return_time=now + timedelta(hours=2),
+        reason="Магазин",
+        contact_phone="+79001234567",
+    )
+
+
+async def _decide(repo: ApplicationRepository, application_id, status: str = "approved"):
+    return await repo.decide(
+        application_id=application_id,
+        status=status,
+        decided_by=uuid4(),
+        decided_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_decide_is_one_statement(db_session) -> None:
+    repo = ApplicationRepository(db_session)
+    app = await _create(repo)
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", _capture)
+    try:
+        updated = await _decide(repo, app.id)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", _capture)
+
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+    assert updated is not None
+    assert updated.status == "approved"
+    assert updated.decided_by is not None
+
+
+@pytest.mark.asyncio
+async def test_second_decision_does_not_apply(db_session) -> None:
+    repo = ApplicationRepository(db_session)
+    app = await _create(repo)
+
+    assert await _decide(repo, app.id, "approved") is not None
+    assert await _decide(repo, app.id, "rejected") is None
+    assert (await repo.get_by_id(app.id)).status == "approved"
+
+
+@pytest.mark.asyncio
+async def test_minor_requires_voice_message(db_session) -> None:
+    repo = ApplicationRepository(db_session)
+    documents = ApplicationDocumentRepository(db_session)
+    app = await _create(repo, is_minor=True)
+
+    assert await _decide(repo, app.id) is None
+
+    await documents.create(
+        application_id=app.id,
+        document_type="voice_message",
+        file_url=f"{app.id}/voice.m4a",
+        uploaded_by=app.user_id,
+    )
+    assert await _decide(repo, app.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_service_maps_failed_transition(db_session) -> None:
+    repo = ApplicationRepository(db_session)
+    service = ApplicationService(
+        application_repository=repo,
+        document_repository=ApplicationDocumentRepository(db_session),
+        storage=None,  # type: ignore[arg-type]
+        auth_client=AuthClientStub(),
+    )
+    minor = await _create(repo, is_minor=True)
+    adult = await _create(repo)
+    await _decide(repo, adult.id)
+    now = datetime.now(timezone.utc)
+
+    with pytest.raises(MinorVoiceRequiredError):
+        await service.decide_application(minor.id, "approved", uuid4(), now)
+    with pytest.raises(ApplicationAlreadyDecidedError):
+        await service.decide_application(adult.id, "rejected", uuid4(), now)
@@ -0,0 +1,109 @@
+"""ListApplications count modes: exact, window (one round trip), estimated, has_more."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.constants.count_mode import (
+    COUNT_MODE_ESTIMATED,
+    COUNT_MODE_EXACT,
+    COUNT_MODE_HAS_MORE,
+    COUNT_MODE_WINDOW,
+)
+from src.domain.exceptions import ValidationError
+from src.grpc_clients.auth_client import AuthClientStub
+from src.models.application import ApplicationModel
+from src.repositories.application_repository import ApplicationRepository
+from src.services.application_service import ApplicationService
+
+
+async def _seed(db_session, count: int, status: str = "pending") -> None:
+    base = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    for i in range(count):
+        db_session.add(
+            ApplicationModel(
+                user_id=uuid4(),
+                is_minor=False,
+                leave_time=base,
+                return_time=base + timedelta(hours=2),
+                reason="Магазин",
+                contact_phone="+79001234567",
+                status=status,
+                created_at=base + timedelta(minutes=i),
+                updated_at=base,
+            )
+        )
+    await db_session.flush()
+
+
+class _StatementCounter:
+    def __init__(self, db_session) -> None:
+        self.count = 0
+        self._engine = db_session.get_bind()
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "_StatementCounter":
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("count_mode", "statements"),
+    [(COUNT_MODE_EXACT, 2), (COUNT_MODE_WINDOW, 1), (COUNT_MODE_HAS_MORE, 1)],
+)
+async def test_round_trips_per_mode(db_session, count_mode: str, statements: int) -> None:
+    await _seed(db_session, 5)
+    await _seed(db_session, 2, status="approved")
+    repo = ApplicationRepository(db_session)
+
+    with _StatementCounter(db_session) as counter:
+        rows, total, has_more = await repo.get_list(status="pending", size=2, count_mode=count_mode)
+
+    assert counter.count == statements
+    assert len(rows) == 2
+    assert has_more is True
+    assert total == (None if count_mode == COUNT_MODE_HAS_MORE else 5)
+
+
+@pytest.mark.asyncio
+async def test_window_total_is_full_count_in_keyset_and_past_the_end(db_session) -> None:
+    await _seed(db_session, 5)
+    repo = ApplicationRepository(db_session)
+
+    first, _, _ = await repo.get_list(size=2, count_mode=COUNT_MODE_WINDOW)
+    last = first[-1]
+    _, total, _ = await repo.get_list(size=2, after=(last.created_at, last.id), count_mode=COUNT_MODE_WINDOW)
+    assert total == 5
+
+    rows, total, has_more = await repo.get_list(page=10, size=2, count_mode=COUNT_MODE_WINDOW)
+    assert (rows, total, has_more) == ([], 5, False)
+
+
+@pytest.mark.asyncio
+async def test_estimated_falls_back_without_planner_statistics(db_session) -> None:
+    await _seed(db_session, 3)
+    repo = ApplicationRepository(db_session)
+
+    _, total, _ = await repo.get_list(count_mode=COUNT_MODE_ESTIMATED)
+    assert total == 3
+    _, total, _ = await repo.get_list(status="approved", count_mode=COUNT_MODE_ESTIMATED)
+    assert total == 0
+
+
+@pytest.mark.asyncio
+async def test_service_rejects_unknown_count_mode(db_session) -> None:
+    service = ApplicationService(
+        application_repository=ApplicationRepository(db_session),
+        document_repository=None,  # type: ignore[arg-type]
+        storage=None,  # type: ignore[arg-type]
+        auth_client=AuthClientStub(),
+    )
+    with pytest.raises(ValidationError):
+        await service.list_applications(count_mode="approximate")
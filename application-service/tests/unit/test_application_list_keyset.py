@@ -0,0 +1,85 @@
+"""Keyset (cursor) pagination for ListApplications: (created_at, id) seek, opaque cursor."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.domain.exceptions import ValidationError
+from src.grpc_clients.auth_client import AuthClientStub
+from src.models.application import ApplicationModel
+from src.repositories.application_repository import ApplicationRepository
+from src.services.application_service import ApplicationService
+from src.services.cursor import decode_cursor, encode_cursor
+
+
+async def _seed(db_session, count: int) -> list[ApplicationModel]:
+    """Rows in pairs sharing created_at, so the id tie-breaker is exercised."""
+    base = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    rows = []
+    for i in range(count):
+        model = ApplicationModel(
+            user_id=uuid4(),
+            is_minor=False,
+            leave_time=base,
+            return_time=base + timedelta(hours=2),
+            reason="Магазин",
+            contact_phone="+79001234567",
+            status="pending",
+            created_at=base + timedelta(minutes=i // 2),
+            updated_at=base,
+        )
+        db_session.add(model)
+        rows.append(model)
+    await db_session.flush()
+    return rows
+
+
+def _service(db_session) -> ApplicationService:
+    return ApplicationService(
+        application_repository=ApplicationRepository(db_session),
+        document_repository=None,  # type: ignore[arg-type]
+        storage=None,  # type: ignore[arg-type]
+        auth_client=AuthClientStub(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_cursor_walk_matches_offset_order(db_session) -> None:
+    await _seed(db_session, 7)
+    service = _service(db_session)
+
+    offset_ids = []
+    for page in (1, 2, 3):
+        items, _, _ = await service.list_applications(page=page, size=3)
+        offset_ids += [i.id for i in items]
+
+    cursor_ids = []
+    items, total, cursor = await service.list_applications(size=3)
+    cursor_ids += [i.id for i in items]
+    while cursor:
+        items, total, cursor = await service.list_applications(size=3, cursor=cursor)
+        cursor_ids += [i.id for i in items]
+
+    assert total == 7
+    assert len(cursor_ids) == 7
+    assert cursor_ids == offset_ids
+
+
+@pytest.mark.asyncio
+async def test_last_page_has_no_cursor(db_session) -> None:
+    await _seed(db_session, 3)
+    service = _service(db_session)
+
+    items, _, cursor = await service.list_applications(size=3)
+
+    assert len(items) == 3
+    assert cursor is None
+
+
+def test_cursor_round_trip_and_invalid_cursor() -> None:
+    created_at = datetime(2026, 3, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+    application_id = uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, application_id)) == (created_at, application_id)
+    with pytest.raises(ValidationError):
+        decode_cursor("not a cursor")
@@ -0,0 +1,146 @@
+"""
+EXPLAIN checks that the list / approved-leaves queries use the indexes built for them.
+
+The SQL the repository actually emits is captured and re-run under EXPLAIN. SQLite
+runs always; set TEST_POSTGRES_URL (postgresql+asyncpg://...) to run the same checks
+against PostgreSQL, where sequential scans are disabled so that a plan without the
+index can only mean the predicate cannot use it.
+"""
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.constants.count_mode import COUNT_MODE_HAS_MORE
+from src.models.application import ApplicationModel
+from src.models.base import Base
+from src.repositories.application_repository import ApplicationRepository
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+KNOWN_USER = UUID("0f5e7c2a-3b1d-4e8f-9a6b-c4d2e1f0a7b3")
+
+
+async def _seed(session: AsyncSession) -> None:
+    """Mostly decided applications with a small pending fraction, as in production."""
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for i in range(300):
+        session.add(
+            ApplicationModel(
+                user_id=KNOWN_USER if i % 50 == 0 else uuid4(),
+                is_minor=False,
+                leave_time=base + timedelta(hours=i),
+                return_time=base + timedelta(hours=i + 2),
+                reason="Магазин",
+                contact_phone="+79001234567",
+                status="pending" if i % 10 == 0 else "approved",
+                created_at=base + timedelta(minutes=i),
+                updated_at=base,
+            )
+        )
+    await session.flush()
+
+
+async def _plan(session: AsyncSession, call: Callable[[ApplicationRepository], Awaitable[object]]) -> str:
+    """Run one repository call, EXPLAIN the statement it issued and return the plan text."""
+    engine = session.get_bind()
+    captured: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        await call(ApplicationRepository(session))
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert len(captured) == 1
+    statement, parameters = captured[0]
+    conn = await session.connection()
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    result = await conn.exec_driver_sql(prefix + statement, parameters)
+    return "\n".join(str(row[-1]) for row in result.all())
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+async def plan_session(request) -> AsyncGenerator[AsyncSession, None]:
+    if request.param == "sqlite":
+        url = "sqlite+aiosqlite:///:memory:"
+    elif TEST_POSTGRES_URL:
+        url = TEST_POSTGRES_URL
+    else:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        await _seed(session)
+        conn = await session.connection()
+        await conn.exec_driver_sql("ANALYZE")
+        if request.param == "postgresql":
+            await conn.exec_driver_sql("SET enable_seqscan = off")
+        yield session
+        await session.rollback()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_student_list_uses_user_id_created_at_index(plan_session) -> None:
+    plan = await _plan(
+        plan_session,
+        lambda repo: repo.get_list(user_id=KNOWN_USER, count_mode=COUNT_MODE_HAS_MORE),
+    )
+    assert "ix_applications_user_id_created_at" in plan
+
+
+@pytest.mark.asyncio
+async def test_pending_queue_uses_partial_index(plan_session) -> None:
+    plan = await _plan(
+        plan_session,
+        lambda repo: repo.get_list(status="pending", count_mode=COUNT_MODE_HAS_MORE),
+    )
+    assert "ix_applications_pending_created_at" in plan
+
+
+@pytest.mark.asyncio
+async def test_status_with_date_range_uses_status_leave_time_index(plan_session) -> None:
+    plan = await _plan(
+        plan_session,
+        lambda repo: repo.get_list(
+            status="approved",
+            date_from=date(2026, 1, 3),
+            date_to=date(2026, 1, 4),
+            count_mode=COUNT_MODE_HAS_MORE,
+        ),
+    )
+    assert "ix_applications_status_leave_time" in plan
+
+
+@pytest.mark.asyncio
+async def test_date_range_is_half_open_in_utc(db_session) -> None:
+    base = datetime(2026, 1, 3, tzinfo=timezone.utc)
+    for leave_time in (base - timedelta(microseconds=1), base, base + timedelta(days=1, microseconds=-1), base + timedelta(days=1)):
+        db_session.add(
+            ApplicationModel(
+                user_id=uuid4(),
+                is_minor=False,
+                leave_time=leave_time,
+                return_time=leave_time + timedelta(hours=2),
+                reason="Магазин",
+                contact_phone="+79001234567",
+                status="approved",
+            )
+        )
+    await db_session.flush()
+    repo = ApplicationRepository(db_session)
+
+    rows, total, _ = await repo.get_list(date_from=date(2026, 1, 3), date_to=date(2026, 1, 3))
+    assert total == 2
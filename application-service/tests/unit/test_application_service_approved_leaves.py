@@ -0,0 +1,156 @@
+"""GetApprovedLeaves roster: written on approve in the decide transaction, read with one indexed query."""
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.grpc_clients.auth_client import UserInfo
+from src.models.application import ApplicationModel
+from src.repositories.application_document_repository import ApplicationDocumentRepository
+from src.repositories.application_repository import ApplicationRepository
+from src.repositories.approved_leave_roster_repository import ApprovedLeaveRosterRepository
+from src.repositories.resident_directory_repository import ResidentDirectoryRepository
+from src.services.application_service import ApplicationService
+
+LEAVE_TIME = datetime(2026, 3, 1, 18, 0, tzinfo=timezone.utc)
+
+
+def _user_info(user_id: UUID, entrance: int, room: str) -> UserInfo:
+    return UserInfo(
+        user_id=str(user_id),
+        last_name="Петров",
+        first_name="Пётр",
+        patronymic="",
+        building="8",
+        entrance=entrance,
+        floor=1,
+        room=room,
+        roles=["student"],
+        phone="",
+        email="",
+        is_minor=False,
+    )
+
+
+class _Auth:
+    def __init__(self, infos: dict[str, UserInfo]) -> None:
+        self._infos = infos
+        self.batch_calls: list[list[str]] = []
+
+    async def get_user_info(self, user_id: str) -> UserInfo | None:
+        raise AssertionError("per-row get_user_info must not be used")
+
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        self.batch_calls.append(sorted(user_ids))
+        return {uid: self._infos[uid] for uid in user_ids if uid in self._infos}
+
+
+class _Storage:
+    pass
+
+
+def _service(db_session, auth: _Auth) -> ApplicationService:
+    return ApplicationService(
+        application_repository=ApplicationRepository(db_session),
+        document_repository=ApplicationDocumentRepository(db_session),
+        storage=_Storage(),  # type: ignore[arg-type]
+        auth_client=auth,  # type: ignore[arg-type]
+        resident_repository=ResidentDirectoryRepository(db_session),
+        roster_repository=ApprovedLeaveRosterRepository(db_session),
+    )
+
+
+async def _pending(db_session, user_id: UUID, leave_time: datetime = LEAVE_TIME) -> ApplicationModel:
+    app = ApplicationModel(
+        user_id=user_id,
+        is_minor=False,
+        leave_time=leave_time,
+        return_time=leave_time + timedelta(hours=2),
+        reason="Магазин",
+        contact_phone="+79001234567",
+        status="pending",
+    )
+    db_session.add(app)
+    await db_session.flush()
+    return app
+
+
+@pytest.mark.asyncio
+async def test_approve_adds_roster_rows_and_read_filters_by_entrance(db_session) -> None:
+    known, fetched, unknown = uuid4(), uuid4(), uuid4()
+    await ResidentDirectoryRepository(db_session).upsert_many([_user_info(known, entrance=1, room="101")])
+    auth = _Auth({str(fetched): _user_info(fetched, entrance=2, room="201")})
+    service = _service(db_session, auth)
+    first = await _pending(db_session, known)
+    second = await _pending(db_session, fetched, LEAVE_TIME + timedelta(minutes=5))
+    third = await _pending(db_session, unknown, LEAVE_TIME + timedelta(minutes=10))
+    rejected = await _pending(db_session, known)
+    decided_by, decided_at = uuid4(), datetime.now(timezone.utc)
+
+    await service.decide_application(first.id, "approved", decided_by, decided_at)
+    await service.decide_applications([second.id, third.id], "approved", decided_by, decided_at)
+    await service.decide_application(rejected.id, "rejected", decided_by, decided_at, reject_reason="Нет")
+
+    # Only applicants missing from resident_directory go to auth-service, once per decision.
+    assert auth.batch_calls == [sorted([str(fetched), str(unknown)])]
+    entrance_one = await service.get_approved_leaves_for_date(date(2026, 3, 1), building="8", entrance=1)
+    assert [r[0] for r in entrance_one] == [str(known), str(unknown)]
+    assert entrance_one[0][1:3] == ("Петров Пётр", "101")
+    assert entrance_one[1][1:3] == ("", "")
+    everyone = await service.get_approved_leaves_for_date(date(2026, 3, 1))
+    assert [r[0] for r in everyone] == [str(known), str(fetched), str(unknown)]
+    assert await service.get_approved_leaves_for_date(date(2026, 3, 2)) == []
+
+
+@pytest.mark.asyncio
+async def test_roster_read_is_single_statement(db_session) -> None:
+    statements: list[str] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    service = _service(db_session, _Auth({}))
+    event.listen(db_session.get_bind(), "before_cursor_execute", _capture)
+    try:
+        await service.get_approved_leaves_for_date(date(2026, 3, 1), building="8", entrance=3)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", _capture)
+
+    assert len(statements) == 1
+    assert "approved_leave_roster" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_students_out_at_uses_half_open_interval(db_session) -> None:
+    student = uuid4()
+    await ResidentDirectoryRepository(db_session).upsert_many([_user_info(student, entrance=2, room="201")])
+    service = _service(db_session, _Auth({}))
+    app = await _pending(db_session, student)
+    await service.decide_application(app.id, "approved", uuid4(), datetime.now(timezone.utc))
+
+    back = LEAVE_TIME + timedelta(hours=2)
+    assert [r[0] for r in await service.get_students_out_at(LEAVE_TIME, building="8", entrance=2)] == [str(student)]
+    assert len(await service.get_students_out_at(back - timedelta(seconds=1))) == 1
+    assert await service.get_students_out_at(back) == []
+    assert await service.get_students_out_at(LEAVE_TIME - timedelta(seconds=1)) == []
+    assert await service.get_students_out_at(LEAVE_TIME, entrance=3) == []
+
+
+@pytest.mark.asyncio
+async def test_directory_update_moves_upcoming_roster_rows_only(db_session) -> None:
+    student = uuid4()
+    residents = ResidentDirectoryRepository(db_session)
+    await residents.upsert_many([_user_info(student, entrance=1, room="101")])
+    service = _service(db_session, _Auth({}))
+    upcoming_time = datetime.now(timezone.utc) + timedelta(days=1)
+    past = await _pending(db_session, student)
+    upcoming = await _pending(db_session, student, upcoming_time)
+    await service.decide_applications([past.id, upcoming.id], "approved", uuid4(), datetime.now(timezone.utc))
+
+    await residents.upsert_many([_user_info(student, entrance=3, room="305")])
+
+    upcoming_rows = await service.get_approved_leaves_for_date(upcoming_time.date())
+    assert [r[2] for r in upcoming_rows] == ["305"]
+    assert await service.get_approved_leaves_for_date(upcoming_time.date(), entrance=1) == []
+    assert [r[2] for r in await service.get_approved_leaves_for_date(date(2026, 3, 1))] == ["101"]
@@ -0,0 +1,102 @@
+"""CreateApplication: an overlapping active leave is rejected by the database constraint, not a pre-check."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.exceptions import ValidationError
+from src.grpc_clients.auth_client import AuthClientStub
+from src.repositories.application_repository import LEAVE_OVERLAP_CONSTRAINT, is_leave_overlap
+from src.services.application_service import ApplicationService
+
+
+class _AppRepo:
+    def __init__(self, error: Exception) -> None:
+        self._error = error
+        self.calls = 0
+
+    async def create(self, **kwargs: object) -> object:
+        self.calls += 1
+        raise self._error
+
+
+class _Unused:
+    pass
+
+
+class _DriverError(Exception):
+    """Stands in for asyncpg's error: SQLSTATE and constraint name as attributes."""
+
+    def __init__(self, sqlstate: str, constraint_name: str | None) -> None:
+        super().__init__("сообщение на языке сервера")
+        self.sqlstate = sqlstate
+        self.constraint_name = constraint_name
+
+
+def _integrity_error(sqlstate: str, constraint_name: str | None) -> IntegrityError:
+    """IntegrityError as SQLAlchemy raises it for asyncpg: the driver error is the adapter error's cause."""
+    orig = Exception("<class 'asyncpg.exceptions.IntegrityConstraintViolationError'>")
+    orig.__cause__ = _DriverError(sqlstate, constraint_name)
+    return IntegrityError("INSERT INTO applications ...", {}, orig)
+
+
+def _service(app_repo: _AppRepo) -> ApplicationService:
+    return ApplicationService(
+        application_repository=app_repo,  # type: ignore[arg-type]
+        document_repository=_Unused(),  # type: ignore[arg-type]
+        storage=_Unused(),  # type: ignore[arg-type]
+        auth_client=AuthClientStub(),
+    )
+
+
+async def _create(service: ApplicationService) -> None:
+    leave_time = datetime.now(timezone.utc) + timedelta(days=1)
+    await service.create_application(
+        user_id=uuid4(),
+        leave_time=leave_time,
+        return_time=leave_time + timedelta(hours=2),
+        reason="Магазин",
+        contact_phone="+79001234567",
+    )
+
+
+@pytest.mark.asyncio
+async def test_exclusion_violation_becomes_validation_error() -> None:
+    repo = _AppRepo(_integrity_error("23P01", LEAVE_OVERLAP_CONSTRAINT))
+
+    with pytest.raises(ValidationError, match="пересекающийся"):
+        await _create(_service(repo))
+    assert repo.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_other_integrity_errors_propagate() -> None:
+    repo = _AppRepo(_integrity_error("23505", "applications_pkey"))
+
+    with pytest.raises(IntegrityError):
+        await _create(_service(repo))
+
+
+def test_overlap_is_recognised_by_sqlstate_and_constraint() -> None:
+    assert is_leave_overlap(_integrity_error("23P01", LEAVE_OVERLAP_CONSTRAINT))
+    assert is_leave_overlap(_integrity_error("23P01", None))
+    assert not is_leave_overlap(_integrity_error("23P01", "ex_some_other_constraint"))
+    assert not is_leave_overlap(_integrity_error("23505", None))
+    assert not is_leave_overlap(IntegrityError("INSERT ...", {}, Exception(LEAVE_OVERLAP_CONSTRAINT)))
+
+
+@pytest.mark.asyncio
+async def test_zero_length_leave_is_rejected_before_insert() -> None:
+    repo = _AppRepo(AssertionError("not reached"))
+    leave_time = datetime.now(timezone.utc) + timedelta(days=1)
+
+    with pytest.raises(ValidationError, match="позже даты выхода"):
+        await _service(repo).create_application(
+            user_id=uuid4(),
+            leave_time=leave_time,
+            return_time=leave_time,
+            reason="Магазин",
+            contact_phone="+79001234567",
+        )
+    assert repo.calls == 0
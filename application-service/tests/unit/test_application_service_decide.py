@@ -1,4 +1,4 @@
-"""Unit tests for ApplicationService.decide_application and ensure_minor_voice_if_required."""
+"""Unit tests for ApplicationService.decide_application (conditional transition and error mapping)."""
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
 
@@ -29,38 +29,36 @@ class _App:
 
 
 class _AppRepo:
-    def __init__(self, app: _App | None) -> None:
+    """Mimics the conditional UPDATE: applies only to a pending row, minors need a voice message."""
+
+    def __init__(self, app: _App | None, voice_count: int = 0) -> None:
         self._app = app
-        self.update_status_called: list[tuple[UUID, str]] = []
+        self._voice_count = voice_count
+        self.decided: list[tuple[UUID, str]] = []
 
     async def get_by_id(self, application_id: UUID) -> _App | None:
         if self._app and self._app.id == application_id:
             return self._app
         return None
 
-    async def update_status(
+    async def decide(
         self,
         application_id: UUID,
         status: str,
         decided_by: UUID,
         decided_at: datetime,
         reject_reason: str | None = None,
-    ) -> _App:
-        self.update_status_called.append((application_id, status))
-        return _App(
-            id=application_id,
-            user_id=self._app.user_id if self._app else uuid4(),
-            is_minor=self._app.is_minor if self._app else False,
-            status=status,
-        )
+    ) -> _App | None:
+        app = await self.get_by_id(application_id)
+        if app is None or app.status != "pending" or (app.is_minor and self._voice_count == 0):
+            return None
+        self.decided.append((application_id, status))
+        app.status = status
+        return app
 
 
 class _DocRepo:
-    def __init__(self, voice_count: int = 0) -> None:
-        self._voice_count = voice_count
-
-    async def count_voice_messages_for_application(self, application_id: UUID) -> int:
-        return self._voice_count
+    pass
 
 
 class _Storage:
@@ -76,8 +74,8 @@ async def test_decide_minor_without_voice_raises() -> None:
     app_id = uuid4()
     user_id = uuid4()
     app = _App(id=app_id, user_id=user_id, is_minor=True, status="pending")
-    app_repo = _AppRepo(app)
-    doc_repo = _DocRepo(voice_count=0)
+    app_repo = _AppRepo(app, voice_count=0)
+    doc_repo = _DocRepo()
 
     service = ApplicationService(
         application_repository=app_repo,  # type: ignore[arg-type]
@@ -94,7 +92,7 @@ async def test_decide_minor_without_voice_raises() -> None:
             decided_at=datetime.now(timezone.utc),
         )
 
-    assert len(app_repo.update_status_called) == 0
+    assert app_repo.decided == []
 
 
 @pytest.mark.asyncio
@@ -102,8 +100,8 @@ async def test_decide_minor_with_voice_ok() -> None:
     app_id = uuid4()
     user_id = uuid4()
     app = _App(id=app_id, user_id=user_id, is_minor=True, status="pending")
-    app_repo = _AppRepo(app)
-    doc_repo = _DocRepo(voice_count=1)
+    app_repo = _AppRepo(app, voice_count=1)
+    doc_repo = _DocRepo()
 
     service = ApplicationService(
         application_repository=app_repo,  # type: ignore[arg-type]
@@ -120,7 +118,7 @@ async def test_decide_minor_with_voice_ok() -> None:
     )
 
     assert result.status == "approved"
-    assert app_repo.update_status_called == [(app_id, "approved")]
+    assert app_repo.decided == [(app_id, "approved")]
 
 
 @pytest.mark.asyncio
@@ -128,8 +126,8 @@ async def test_decide_not_minor_no_voice_required() -> None:
     app_id = uuid4()
     user_id = uuid4()
     app = _App(id=app_id, user_id=user_id, is_minor=False, status="pending")
-    app_repo = _AppRepo(app)
-    doc_repo = _DocRepo(voice_count=0)
+    app_repo = _AppRepo(app, voice_count=0)
+    doc_repo = _DocRepo()
 
     service = ApplicationService(
         application_repository=app_repo,  # type: ignore[arg-type]
@@ -147,15 +145,15 @@ async def test_decide_not_minor_no_voice_required() -> None:
     )
 
     assert result.status == "rejected"
-    assert app_repo.update_status_called == [(app_id, "rejected")]
+    assert app_repo.decided == [(app_id, "rejected")]
 
 
 @pytest.mark.asyncio
 async def test_decide_application_not_found() -> None:
     app_id = uuid4()
     user_id = uuid4()
-    app_repo = _AppRepo(None)
-    doc_repo = _DocRepo(0)
+    app_repo = _AppRepo(None, voice_count=0)
+    doc_repo = _DocRepo()
 
     service = ApplicationService(
         application_repository=app_repo,  # type: ignore[arg-type]
@@ -178,8 +176,8 @@ async def test_decide_already_decided_raises() -> None:
     app_id = uuid4()
     user_id = uuid4()
     app = _App(id=app_id, user_id=user_id, is_minor=False, status="approved")
-    app_repo = _AppRepo(app)
-    doc_repo = _DocRepo(0)
+    app_repo = _AppRepo(app, voice_count=0)
+    doc_repo = _DocRepo()
 
     service = ApplicationService(
         application_repository=app_repo,  # type: ignore[arg-type]
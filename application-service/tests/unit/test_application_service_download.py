@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID, uuid4
 
 import pytest
@@ -12,6 +13,7 @@ class _App:
     id: UUID
     user_id: UUID
     is_minor: bool = False
+    leave_time: datetime | None = None
 
 
 @dataclass
@@ -35,7 +37,7 @@ class _DocRepo:
     def __init__(self, doc: _Doc | None) -> None:
         self._doc = doc
 
-    async def get_by_id(self, document_id: UUID):
+    async def get_by_id(self, document_id: UUID, application_leave_time: datetime | None = None):
         if self._doc and self._doc.id == document_id:
             return self._doc
         return None
@@ -37,22 +37,30 @@ class _AppRepo:
         *,
         user_id: UUID | None = None,
         user_ids: list[UUID] | None = None,
+        entrance: int | None = None,
+        room: str | None = None,
         status: str | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
         page: int = 1,
         size: int = 20,
-    ) -> tuple[list, int]:
+        after: tuple | None = None,
+        count_mode: str = "exact",
+    ) -> tuple[list, int, bool]:
         self.last_get_list_kw = {
             "user_id": user_id,
             "user_ids": user_ids,
+            "entrance": entrance,
+            "room": room,
             "status": status,
             "date_from": date_from,
             "date_to": date_to,
             "page": page,
             "size": size,
+            "after": after,
+            "count_mode": count_mode,
         }
-        return self._items, self._total
+        return self._items, self._total, False
 
 
 class _DocRepo:
@@ -79,7 +87,7 @@ class _Auth:
 
 
 @pytest.mark.asyncio
-async def test_list_applications_educator_with_entrance_room_calls_auth_and_passes_user_ids() -> None:
+async def test_list_applications_educator_with_entrance_room_filters_in_repository() -> None:
     user_uuid = uuid4()
     auth = _Auth(user_ids=[str(user_uuid)])
     app = _App(id=uuid4(), user_id=user_uuid)
@@ -92,7 +100,7 @@ async def test_list_applications_educator_with_entrance_room_calls_auth_and_pass
         auth_client=auth,  # type: ignore[arg-type]
     )
 
-    items, total = await service.list_applications(
+    items, total, next_cursor = await service.list_applications(
         user_id=None,
         entrance=1,
         room="301",
@@ -102,10 +110,13 @@ async def test_list_applications_educator_with_entrance_room_calls_auth_and_pass
 
     assert total == 1
     assert len(items) == 1
-    assert auth.get_user_ids_called == [(1, "301")]
+    assert next_cursor is None
+    assert auth.get_user_ids_called == []
     assert app_repo.last_get_list_kw is not None
     assert app_repo.last_get_list_kw["user_id"] is None
-    assert app_repo.last_get_list_kw["user_ids"] == [user_uuid]
+    assert app_repo.last_get_list_kw["user_ids"] is None
+    assert app_repo.last_get_list_kw["entrance"] == 1
+    assert app_repo.last_get_list_kw["room"] == "301"
     assert app_repo.last_get_list_kw["status"] is None
     assert app_repo.last_get_list_kw["page"] == 1
     assert app_repo.last_get_list_kw["size"] == 20
@@ -124,7 +135,7 @@ async def test_list_applications_student_ignores_entrance_room() -> None:
         auth_client=auth,  # type: ignore[arg-type]
     )
 
-    items, total = await service.list_applications(
+    items, total, next_cursor = await service.list_applications(
         user_id=user_id,
         entrance=1,
         room="301",
@@ -135,29 +146,5 @@ async def test_list_applications_student_ignores_entrance_room() -> None:
     assert total == 0
     assert auth.get_user_ids_called == []
     assert app_repo.last_get_list_kw["user_id"] == user_id
-    assert app_repo.last_get_list_kw["user_ids"] is None
-
-
-@pytest.mark.asyncio
-async def test_list_applications_educator_empty_filter_returns_empty() -> None:
-    auth = _Auth(user_ids=[])
-    app_repo = _AppRepo(items=[], total=0)
-
-    service = ApplicationService(
-        application_repository=app_repo,  # type: ignore[arg-type]
-        document_repository=_DocRepo(),  # type: ignore[arg-type]
-        storage=_Storage(),  # type: ignore[arg-type]
-        auth_client=auth,  # type: ignore[arg-type]
-    )
-
-    items, total = await service.list_applications(
-        user_id=None,
-        entrance=2,
-        room="401",
-        page=1,
-        size=20,
-    )
-
-    assert total == 0
-    assert auth.get_user_ids_called == [(2, "401")]
-    assert app_repo.last_get_list_kw["user_ids"] == []
+    assert app_repo.last_get_list_kw["entrance"] is None
+    assert app_repo.last_get_list_kw["room"] is None
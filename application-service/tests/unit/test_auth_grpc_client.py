@@ -0,0 +1,107 @@
+"""AuthGrpcClient against the in-process fake auth-service."""
+import grpc
+import pytest
+
+from tests.fake_auth_server import FakeAuthServicer, make_users, start_fake_auth_server
+from src.grpc_clients.auth_grpc_client import AuthGrpcClient
+
+
+@pytest.fixture
+async def fake_auth():
+    users = make_users(20)
+    servicer = FakeAuthServicer(users, tokens={"good-token": users[0].user_id})
+    servers = []
+    targets = []
+    for _ in range(2):
+        server, target = await start_fake_auth_server(servicer)
+        servers.append(server)
+        targets.append(target)
+    yield servicer, targets
+    for server in servers:
+        await server.stop(grace=None)
+
+
+async def test_validate_token(fake_auth) -> None:
+    servicer, targets = fake_auth
+    client = AuthGrpcClient(targets[:1], timeout_seconds=2)
+    try:
+        validation = await client.validate_token("good-token")
+        assert validation is not None
+        assert validation.user_id == servicer.tokens["good-token"]
+        assert await client.validate_token("bad-token") is None
+    finally:
+        await client.close()
+
+
+async def test_user_info_and_not_found(fake_auth) -> None:
+    servicer, targets = fake_auth
+    client = AuthGrpcClient(targets[:1], timeout_seconds=2)
+    user_id = next(iter(servicer.users))
+    try:
+        info = await client.get_user_info(user_id)
+        assert info is not None and info.user_id == user_id
+        assert await client.get_user_info("00000000-0000-0000-0000-00000000ffff") is None
+    finally:
+        await client.close()
+
+
+async def test_batch_lookup_is_split_per_shard(fake_auth) -> None:
+    servicer, targets = fake_auth
+    client = AuthGrpcClient(targets, timeout_seconds=2)
+    user_ids = list(servicer.users)
+    try:
+        result = await client.get_users_info(user_ids + ["unknown"])
+    finally:
+        await client.close()
+    assert set(result) == set(user_ids)
+    assert servicer.calls["GetUsersInfo"] == 2
+    assert "GetUserInfo" not in servicer.calls
+
+
+async def test_deadline_is_applied(fake_auth) -> None:
+    servicer, targets = fake_auth
+    servicer.latency_seconds = 0.5
+    client = AuthGrpcClient(targets[:1], timeout_seconds=0.05, retry_max_attempts=1)
+    try:
+        with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+            await client.get_user_info(next(iter(servicer.users)))
+    finally:
+        await client.close()
+    assert exc_info.value.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+
+
+class _Tz0AuthServicer(FakeAuthServicer):
+    """auth-service built from the tz-0 contract, without the GetUsersInfo extension."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def GetUsersInfo(self, request, context):
+        await self._tick("GetUsersInfo")
+        await context.abort(grpc.StatusCode.UNIMPLEMENTED, "Method not found!")
+
+    async def GetUserInfo(self, request, context):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await super().GetUserInfo(request, context)
+        finally:
+            self.in_flight -= 1
+
+
+async def test_batch_lookup_falls_back_when_unimplemented() -> None:
+    servicer = _Tz0AuthServicer(make_users(10), latency_seconds=0.01)
+    server, target = await start_fake_auth_server(servicer)
+    client = AuthGrpcClient([target], timeout_seconds=2, fallback_concurrency=3)
+    user_ids = list(servicer.users)
+    try:
+        first = await client.get_users_info(user_ids + ["00000000-0000-0000-0000-00000000ffff"])
+        second = await client.get_users_info(user_ids[:2])
+    finally:
+        await client.close()
+        await server.stop(grace=None)
+    assert set(first) == set(user_ids)
+    assert set(second) == set(user_ids[:2])
+    assert servicer.calls["GetUsersInfo"] == 1
+    assert servicer.calls["GetUserInfo"] == 13
+    assert servicer.max_in_flight == 3
@@ -0,0 +1,59 @@
+"""Connection pool metrics (db_pool_*) and startup pre-warm."""
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.database import create_instrumented_engine, prewarm_pool
+
+
+def _sample(name: str, engine: str) -> float:
+    return REGISTRY.get_sample_value(name, {"engine": engine}) or 0.0
+
+
+@pytest.fixture
+async def pool_engine(tmp_path):
+    engine = create_instrumented_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        "test",
+        pool_size=2,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_gauges_follow_checkouts_and_overflow(pool_engine) -> None:
+    assert _sample("db_pool_size", "test") == 2
+    waits = _sample("db_pool_wait_seconds_count", "test")
+
+    async with pool_engine.connect(), pool_engine.connect():
+        assert _sample("db_pool_checked_out", "test") == 2
+        assert _sample("db_pool_overflow", "test") == 0
+        async with pool_engine.connect():
+            assert _sample("db_pool_checked_out", "test") == 3
+            assert _sample("db_pool_overflow", "test") == 1
+
+    assert _sample("db_pool_checked_out", "test") == 0
+    assert _sample("db_pool_wait_seconds_count", "test") == waits + 3
+
+
+@pytest.mark.asyncio
+async def test_exhausted_pool_counts_timeout(pool_engine) -> None:
+    timeouts = _sample("db_pool_timeouts_total", "test")
+
+    async with pool_engine.connect(), pool_engine.connect(), pool_engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            async with pool_engine.connect():
+                pass
+
+    assert _sample("db_pool_timeouts_total", "test") == timeouts + 1
+
+
+@pytest.mark.asyncio
+async def test_prewarm_leaves_connections_idle_in_pool(pool_engine) -> None:
+    await prewarm_pool(pool_engine, 2)
+
+    assert pool_engine.pool.checkedin() == 2
+    assert _sample("db_pool_checked_out", "test") == 0
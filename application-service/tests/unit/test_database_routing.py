@@ -0,0 +1,134 @@
+"""Read-replica routing: RoutingSession bind selection and ReplicaMonitor fallback."""
+from collections.abc import AsyncGenerator
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from src.constants.count_mode import COUNT_MODE_ESTIMATED
+from src.database import ReplicaMonitor, RoutingSession
+from src.models.application import ApplicationModel
+from src.models.base import Base
+from src.repositories.application_repository import ApplicationRepository
+from src.repositories.approved_leave_roster_repository import ApprovedLeaveRosterRepository
+
+
+def _application(reason: str) -> ApplicationModel:
+    now = datetime.now(timezone.utc)
+    return ApplicationModel(
+        user_id=uuid4(),
+        is_minor=False,
+        leave_time=now,
+        return_time=now + timedelta(hours=2),
+        reason=reason,
+        contact_phone="+79001234567",
+        status="pending",
+    )
+
+
+@pytest.fixture
+async def engines(tmp_path) -> AsyncGenerator[tuple[AsyncEngine, AsyncEngine], None]:
+    """Two databases told apart by the reason of the single row each one holds."""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+    for engine, reason in ((primary, "primary"), (replica, "replica")):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(_application(reason))
+            await session.commit()
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+def _factory(primary: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(primary, sync_session_class=RoutingSession, expire_on_commit=False, autoflush=False)
+
+
+async def _reasons(session: AsyncSession) -> set[str]:
+    return set((await session.scalars(select(ApplicationModel.reason))).all())
+
+
+@pytest.mark.asyncio
+async def test_selects_go_to_replica_until_first_write(engines) -> None:
+    primary, replica = engines
+    async with _factory(primary)(replica=replica.sync_engine) as session:
+        assert await _reasons(session) == {"replica"}
+
+        await ApplicationRepository(session).create(
+            user_id=uuid4(),
+            is_minor=False,
+            leave_time=datetime.now(timezone.utc),
+            return_time=datetime.now(timezone.utc) + timedelta(hours=2),
+            reason="written",
+            contact_phone="+79001234567",
+        )
+
+        assert await _reasons(session) == {"primary", "written"}
+        assert session.sync_session.on_replica is False
+
+
+@pytest.mark.asyncio
+async def test_repository_lambda_reads_go_to_replica(engines) -> None:
+    primary, replica = engines
+    async with _factory(primary)(replica=replica.sync_engine) as session:
+        repo = ApplicationRepository(session)
+        items, total, _ = await repo.get_list()
+        assert [a.reason for a in items] == ["replica"] and total == 1
+        assert (await repo.get_by_id(items[0].id)).reason == "replica"
+        await repo.get_list(count_mode=COUNT_MODE_ESTIMATED)
+        await ApprovedLeaveRosterRepository(session).get_out_at(datetime.now(timezone.utc))
+        assert session.sync_session.on_replica is True
+
+
+@pytest.mark.asyncio
+async def test_locking_select_and_missing_replica_use_primary(engines) -> None:
+    primary, replica = engines
+    async with _factory(primary)(replica=replica.sync_engine) as session:
+        await session.execute(select(ApplicationModel.id).with_for_update())
+        assert await _reasons(session) == {"primary"}
+
+    async with _factory(primary)(replica=replica.sync_engine) as session:
+        await session.execute(lambda_stmt(lambda: select(ApplicationModel.id).with_for_update()))
+        assert await _reasons(session) == {"primary"}
+
+    async with _factory(primary)() as session:
+        assert await _reasons(session) == {"primary"}
+
+
+class _LaggingMonitor(ReplicaMonitor):
+    lag = 0.0
+    probes = 0
+
+    async def _lag_seconds(self) -> float:
+        self.probes += 1
+        return self.lag
+
+
+@pytest.mark.asyncio
+async def test_monitor_rejects_lagging_replica_and_caches_result(engines) -> None:
+    _, replica = engines
+    monitor = _LaggingMonitor(replica, max_lag_seconds=5.0, check_interval_seconds=60.0, timeout_seconds=1.0)
+
+    assert await monitor.is_usable() is True
+    monitor.lag = 30.0
+    assert await monitor.is_usable() is True
+    assert monitor.probes == 1
+
+    monitor = _LaggingMonitor(replica, max_lag_seconds=5.0, check_interval_seconds=0.0, timeout_seconds=1.0)
+    monitor.lag = 30.0
+    assert await monitor.is_usable() is False
+
+
+@pytest.mark.asyncio
+async def test_monitor_falls_back_when_replica_is_down(engines, tmp_path) -> None:
+    _, replica = engines
+    assert await ReplicaMonitor(replica, max_lag_seconds=5.0, check_interval_seconds=0.0, timeout_seconds=1.0).is_usable()
+
+    down = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    monitor = ReplicaMonitor(down, max_lag_seconds=5.0, check_interval_seconds=0.0, timeout_seconds=1.0)
+    assert await monitor.is_usable() is False
+    await down.dispose()
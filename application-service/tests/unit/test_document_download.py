@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.services.application_service import ApplicationService
+from src.services.document_file import RangeNotSatisfiableError, etag_matches, parse_byte_range
+from src.storage.minio_storage import MinioStorage
+
+
+@dataclass
+class _App:
+    id: UUID
+    user_id: UUID
+    leave_time: datetime | None = None
+
+
+@dataclass
+class _Doc:
+    id: UUID
+    application_id: UUID
+    file_url: str
+
+
+class _AppRepo:
+    def __init__(self, app: _App) -> None:
+        self._app = app
+
+    async def get_by_id(self, application_id: UUID):
+        return self._app if self._app.id == application_id else None
+
+
+class _DocRepo:
+    def __init__(self, doc: _Doc) -> None:
+        self._doc = doc
+
+    async def get_by_id(self, document_id: UUID, application_leave_time: datetime | None = None):
+        return self._doc if self._doc.id == document_id else None
+
+
+class _Storage:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    async def stat_object(self, object_name: str) -> tuple[int, str, str]:
+        return len(self._data), "application/pdf", '"abc"'
+
+    async def iter_object(self, object_name: str, offset: int = 0, length: int = 0):
+        end = offset + length if length else len(self._data)
+        yield self._data[offset:end]
+
+
+class _Auth:
+    async def get_user_info(self, user_id: str):
+        return None
+
+
+def test_parse_byte_range() -> None:
+    assert parse_byte_range("bytes=0-3", 10) == (0, 3)
+    assert parse_byte_range("bytes=4-", 10) == (4, 9)
+    assert parse_byte_range("bytes=-3", 10) == (7, 9)
+    assert parse_byte_range("bytes=5-100", 10) == (5, 9)
+    assert parse_byte_range("bytes=0-1,4-5", 10) is None
+    assert parse_byte_range("items=0-1", 10) is None
+    with pytest.raises(RangeNotSatisfiableError):
+        parse_byte_range("bytes=10-", 10)
+
+
+def test_etag_matches() -> None:
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"def"', '"abc"')
+
+
+async def _open(range_header: str = "", if_none_match: str = ""):
+    app = _App(id=uuid4(), user_id=uuid4())
+    doc = _Doc(id=uuid4(), application_id=app.id, file_url=f"{app.id}/passport.pdf")
+    service = ApplicationService(
+        application_repository=_AppRepo(app),  # type: ignore[arg-type]
+        document_repository=_DocRepo(doc),  # type: ignore[arg-type]
+        storage=_Storage(b"0123456789"),  # type: ignore[arg-type]
+        auth_client=_Auth(),  # type: ignore[arg-type]
+    )
+    info, body = await service.open_document_file(
+        app.id, doc.id, app.user_id, ["student"], range_header=range_header, if_none_match=if_none_match
+    )
+    data = b"".join([chunk async for chunk in body]) if body is not None else None
+    return info, data
+
+
+@pytest.mark.asyncio
+async def test_open_document_file_whole_and_partial() -> None:
+    info, data = await _open()
+    assert (info.filename, info.partial, info.length, data) == ("passport.pdf", False, 10, b"0123456789")
+
+    info, data = await _open(range_header="bytes=2-5")
+    assert (info.partial, info.range_start, info.range_end, data) == (True, 2, 5, b"2345")
+
+
+@pytest.mark.asyncio
+async def test_open_document_file_sends_no_body_for_304_and_416() -> None:
+    info, data = await _open(if_none_match='"abc"')
+    assert info.not_modified and data is None
+
+    info, data = await _open(range_header="bytes=20-")
+    assert info.range_not_satisfiable and data is None
+
+
+class _Object:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self.released = False
+
+    def read(self, amt: int) -> bytes:
+        chunk, self._data = self._data[:amt], self._data[amt:]
+        return chunk
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+class _Minio:
+    def __init__(self, obj: _Object) -> None:
+        self.obj = obj
+        self.calls: list[tuple[int, int]] = []
+
+    def get_object(self, bucket: str, name: str, offset: int = 0, length: int = 0) -> _Object:
+        self.calls.append((offset, length))
+        return self.obj
+
+
+@pytest.mark.asyncio
+async def test_iter_object_reads_in_chunks_and_releases_connection() -> None:
+    storage = MinioStorage()
+    storage._client = _Minio(_Object(b"x" * 10))  # type: ignore[assignment]
+    chunks = [c async for c in storage.iter_object("a/b.pdf", offset=3, length=7, chunk_size=4)]
+    assert chunks == [b"xxxx", b"xxxx", b"xx"]
+    assert storage._client.calls == [(3, 7)]
+    assert storage._client.obj.released
+
+
+class _RpcContext:
+    def __init__(self, user_id: UUID) -> None:
+        self._metadata = (("x-user-id", str(user_id)),)
+
+    def invocation_metadata(self):
+        return self._metadata
+
+
+@pytest.mark.asyncio
+async def test_download_rpc_closes_storage_stream_when_client_leaves(monkeypatch) -> None:
+    from contextlib import asynccontextmanager
+
+    from src.grpc_server import server
+    from src.services.document_file import DocumentFileInfo
+    from tests.grpc_codegen import ensure_generated
+
+    ensure_generated("application.proto")
+    import application_pb2  # type: ignore[import-not-found]
+
+    closed: list[bool] = []
+
+    async def _chunks():
+        try:
+            while True:
+                yield b"x" * 8
+        finally:
+            closed.append(True)
+
+    class _Service:
+        async def open_document_file(self, **kwargs):
+            return DocumentFileInfo(filename="a.pdf", content_type="application/pdf", size=80, etag='"e"'), _chunks()
+
+    @asynccontextmanager
+    async def _session():
+        yield None
+
+    monkeypatch.setattr(server, "read_session", _session)
+    servicer = server._ApplicationGrpcServicer.__new__(server._ApplicationGrpcServicer)
+    servicer._make_service = lambda session: _Service()  # type: ignore[method-assign]
+    request = application_pb2.DownloadDocumentRequest(application_id=str(uuid4()), document_id=str(uuid4()))
+
+    stream = servicer.DownloadDocument(request, _RpcContext(uuid4()))
+    assert (await anext(stream)).info.filename == "a.pdf"
+    assert (await anext(stream)).data == b"x" * 8
+    await stream.aclose()  # what grpc.aio does when the call is cancelled
+
+    assert closed == [True]
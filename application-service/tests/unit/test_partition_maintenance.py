@@ -0,0 +1,217 @@
+"""
+Monthly partition maintenance: months created ahead, archive cutoff and the document partition key.
+
+The DDL itself only exists on PostgreSQL: set TEST_POSTGRES_URL (postgresql+asyncpg://...)
+to run it against a database migrated from scratch. The database is wiped.
+"""
+import asyncio
+import os
+from collections.abc import AsyncGenerator
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import database_settings
+from src.constants.count_mode import COUNT_MODE_ESTIMATED
+from src.repositories.application_document_repository import ApplicationDocumentRepository
+from src.repositories.application_repository import ApplicationRepository
+from src.repositories.partition_repository import PartitionRepository
+from src.services.partition_maintenance import add_months, maintain_partitions
+
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+SERVICE_ROOT = Path(__file__).resolve().parents[2]
+
+
+class _FakePartitionRepository:
+    def __init__(self, months: list[date]) -> None:
+        self.months = months
+        self.created: list[date] = []
+        self.archived: list[tuple[date, str]] = []
+
+    async def list_months(self) -> list[date]:
+        return list(self.months)
+
+    async def create_month(self, month: date) -> int:
+        self.created.append(month)
+        return 0
+
+    async def archive_month(self, month: date, tablespace: str = "") -> None:
+        self.archived.append((month, tablespace))
+
+
+def test_add_months_crosses_years() -> None:
+    assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert add_months(date(2026, 1, 1), -13) == date(2024, 12, 1)
+
+
+@pytest.mark.asyncio
+async def test_creates_missing_months_and_archives_old_ones() -> None:
+    existing = [date(2024, 9, 1), date(2024, 10, 1), date(2024, 11, 1), date(2026, 10, 1)]
+    repo = _FakePartitionRepository(existing)
+
+    created, archived = await maintain_partitions(
+        repo,  # type: ignore[arg-type]
+        today=date(2026, 10, 17),
+        months_ahead=2,
+        archive_after_months=24,
+        archive_tablespace="cold",
+    )
+
+    assert repo.created == [date(2026, 11, 1), date(2026, 12, 1)]
+    assert repo.archived == [(date(2024, 9, 1), "cold")]
+    assert (created, archived) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_archive_keeps_at_least_a_year() -> None:
+    repo = _FakePartitionRepository([date(2025, 9, 1), date(2025, 10, 1)])
+
+    await maintain_partitions(repo, today=date(2026, 10, 17), months_ahead=0, archive_after_months=3)  # type: ignore[arg-type]
+
+    assert repo.archived == [(date(2025, 9, 1), "")]
+
+
+@pytest.mark.asyncio
+async def test_archive_disabled() -> None:
+    repo = _FakePartitionRepository([date(2020, 1, 1)])
+
+    await maintain_partitions(repo, today=date(2026, 10, 17), months_ahead=0, archive_after_months=0)  # type: ignore[arg-type]
+
+    assert repo.archived == []
+    assert repo.created == [date(2026, 10, 1)]
+
+
+@pytest.mark.asyncio
+async def test_document_gets_application_leave_time_without_hint(db_session) -> None:
+    leave_time = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    app = await ApplicationRepository(db_session).create(
+        user_id=uuid4(),
+        is_minor=True,
+        leave_time=leave_time,
+        return_time=leave_time + timedelta(hours=2),
+        reason="Магазин",
+        contact_phone="+79001234567",
+    )
+    doc_repo = ApplicationDocumentRepository(db_session)
+
+    doc = await doc_repo.create(
+        application_id=app.id, document_type="parent_consent", file_url="key", uploaded_by=app.user_id
+    )
+    await db_session.refresh(doc)
+
+    assert doc.application_leave_time.replace(tzinfo=timezone.utc) == leave_time
+    assert (await doc_repo.get_by_id(doc.id, application_leave_time=leave_time)) is not None
+
+
+async def _reset_schema(engine) -> None:
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql("DROP SCHEMA IF EXISTS archive CASCADE")
+        await conn.exec_driver_sql("DROP SCHEMA public CASCADE")
+        await conn.exec_driver_sql("CREATE SCHEMA public")
+
+
+@pytest.fixture
+async def migrated_session(monkeypatch) -> AsyncGenerator[AsyncSession, None]:
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_async_engine(TEST_POSTGRES_URL)
+    await _reset_schema(engine)
+    monkeypatch.setattr(database_settings, "database_url", TEST_POSTGRES_URL)
+    config = Config()  # no ini file: keeps alembic's logging setup away from the test run
+    config.set_main_option("script_location", str(SERVICE_ROOT / "alembic"))
+    # alembic's env.py runs its own event loop.
+    await asyncio.to_thread(command.upgrade, config, "head")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+        await session.rollback()
+    await _reset_schema(engine)
+    await engine.dispose()
+
+
+async def _create_application(session: AsyncSession, leave_time: datetime):
+    return await ApplicationRepository(session).create(
+        user_id=uuid4(),
+        is_minor=False,
+        leave_time=leave_time,
+        return_time=leave_time + timedelta(hours=2),
+        reason="Магазин",
+        contact_phone="+79001234567",
+    )
+
+
+async def test_create_and_archive_month_on_postgres(migrated_session) -> None:
+    month = date(2024, 1, 1)
+    app = await _create_application(migrated_session, datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc))
+    documents = ApplicationDocumentRepository(migrated_session)
+    await documents.create(application_id=app.id, document_type="parent_consent", file_url="key", uploaded_by=app.user_id)
+    partitions = PartitionRepository(migrated_session)
+    applications = ApplicationRepository(migrated_session)
+
+    assert await partitions.create_month(month) == 1
+    assert month in await partitions.list_months()
+    moved = await applications.get_by_id_with_documents(app.id)
+    assert moved is not None and len(moved.documents) == 1
+    decided = await applications.decide(app.id, "rejected", uuid4(), datetime.now(timezone.utc), reject_reason="Нет")
+    assert decided is not None and decided.status == "rejected"
+
+    await partitions.archive_month(month)
+    assert month not in await partitions.list_months()
+    assert await applications.get_by_id(app.id) is None
+    archived = await migrated_session.execute(text("SELECT count(*) FROM archive.applications_p2024_01"))
+    assert archived.scalar() == 1
+    lookup = await migrated_session.execute(text("SELECT count(*) FROM application_leave_times"))
+    assert lookup.scalar() == 0
+
+
+async def test_id_lookup_scans_one_partition_on_postgres(migrated_session) -> None:
+    now = datetime.now(timezone.utc)
+    for months in (0, 1, 2):
+        await _create_application(migrated_session, now + timedelta(days=31 * months))
+    app = await _create_application(migrated_session, now + timedelta(hours=1))
+    engine = migrated_session.get_bind()
+    captured: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        assert (await ApplicationRepository(migrated_session).get_by_id(app.id)) is not None
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    statement, parameters = captured[0]
+    conn = await migrated_session.connection()
+    result = await conn.exec_driver_sql("EXPLAIN (ANALYZE, COSTS OFF, TIMING OFF) " + statement, parameters)
+    scans = [str(row[0]) for row in result.all() if " on applications_" in str(row[0])]
+    # The InitPlan's leave_time prunes the other partitions at run time.
+    assert len(scans) > 1
+    assert len([line for line in scans if "never executed" not in line]) == 1
+
+
+async def test_estimated_count_sums_leaf_partitions_on_postgres(migrated_session) -> None:
+    now = datetime.now(timezone.utc)
+    for days in (0, 0, 31, 62):
+        await _create_application(migrated_session, now + timedelta(days=days))
+    await migrated_session.execute(text("ANALYZE"))
+    repo = ApplicationRepository(migrated_session)
+
+    _, total, _ = await repo.get_list(count_mode=COUNT_MODE_ESTIMATED)
+    assert total == 4
+
+    # New rows show up once their partition is analyzed (autovacuum), not the parent.
+    await _create_application(migrated_session, now + timedelta(days=31, hours=5))
+    for (partition,) in (
+        await migrated_session.execute(
+            text("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = 'applications'::regclass")
+        )
+    ).all():
+        await migrated_session.execute(text(f"ANALYZE {partition}"))
+    _, total, _ = await repo.get_list(count_mode=COUNT_MODE_ESTIMATED)
+    assert total == 5
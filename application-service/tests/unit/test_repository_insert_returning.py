@@ -0,0 +1,84 @@
+"""Create paths hydrate models from a single INSERT ... RETURNING (no refresh SELECT)."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.repositories.application_document_repository import ApplicationDocumentRepository
+from src.repositories.application_repository import ApplicationRepository
+
+
+class _Statements:
+    def __init__(self, db_session) -> None:
+        self.sql: list[str] = []
+        self._engine = db_session.get_bind()
+
+    def _on_execute(self, conn, cursor, statement, *args) -> None:
+        self.sql.append(statement.lstrip().split(None, 1)[0].upper())
+
+    def __enter__(self) -> "_Statements":
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.mark.asyncio
+async def test_application_and_document_create_are_single_inserts(db_session) -> None:
+    now = datetime.now(timezone.utc)
+    user_id = uuid4()
+    document_id = uuid4()
+
+    with _Statements(db_session) as statements:
+        app = await ApplicationRepository(db_session).create(
+            user_id=user_id,
+            is_minor=False,
+            leave_time=now,
+            return_time=now + timedelta(hours=2),
+            reason="Магазин",
+            contact_phone="+79001234567",
+        )
+        doc = await ApplicationDocumentRepository(db_session).create(
+            application_id=app.id,
+            document_type="signed_application",
+            file_url=f"{app.id}/scan.pdf",
+            uploaded_by=user_id,
+            document_id=document_id,
+        )
+
+    assert statements.sql == ["INSERT", "INSERT"]
+    assert app.status == "pending"
+    assert app.created_at is not None and app.updated_at is not None
+    assert doc.id == document_id
+    assert doc.created_at is not None
+
+
+@pytest.mark.asyncio
+async def test_document_create_if_absent_skips_existing_id(db_session) -> None:
+    now = datetime.now(timezone.utc)
+    app = await ApplicationRepository(db_session).create(
+        user_id=uuid4(),
+        is_minor=False,
+        leave_time=now,
+        return_time=now + timedelta(hours=2),
+        reason="Магазин",
+        contact_phone="+79001234567",
+    )
+    documents = ApplicationDocumentRepository(db_session)
+    document_id = uuid4()
+    values = dict(
+        document_id=document_id,
+        application_id=app.id,
+        application_leave_time=app.leave_time,
+        document_type="signed_application",
+        uploaded_by=app.user_id,
+    )
+
+    first = await documents.create_if_absent(file_url="first", **values)
+    second = await documents.create_if_absent(file_url="second", **values)
+
+    assert first is not None and first.id == document_id
+    assert second is None
+    assert (await documents.get_by_id(document_id)).file_url == "first"
@@ -0,0 +1,72 @@
+"""lambda_stmt read paths: values are re-bound on every call and the compiled form is reused."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from src.constants.count_mode import COUNT_MODE_EXACT, COUNT_MODE_WINDOW
+from src.models.application import ApplicationModel
+from src.repositories.application_repository import ApplicationRepository
+
+
+async def _seed(db_session) -> list[ApplicationModel]:
+    base = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+    rows = [
+        ApplicationModel(
+            user_id=uuid4(),
+            is_minor=False,
+            leave_time=base + timedelta(days=i % 2),
+            return_time=base + timedelta(days=i % 2, hours=2),
+            reason="Магазин",
+            contact_phone="+79001234567",
+            status="pending" if i < 3 else "approved",
+            created_at=base + timedelta(minutes=i),
+            updated_at=base,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(rows)
+    await db_session.flush()
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_same_shape_calls_bind_their_own_values(db_session) -> None:
+    rows = await _seed(db_session)
+    repo = ApplicationRepository(db_session)
+
+    assert (await repo.get_by_id(rows[0].id)).id == rows[0].id
+    assert (await repo.get_by_id(rows[1].id)).id == rows[1].id
+
+    for count_mode in (COUNT_MODE_EXACT, COUNT_MODE_WINDOW):
+        pending, total, _ = await repo.get_list(status="pending", count_mode=count_mode)
+        approved, approved_total, _ = await repo.get_list(status="approved", count_mode=count_mode)
+        assert (total, approved_total) == (3, 2)
+        assert {r.status for r in pending} == {"pending"}
+        assert {r.status for r in approved} == {"approved"}
+
+    first, _, _ = await repo.get_list(size=2)
+    second, _, _ = await repo.get_list(size=2, after=(first[-1].created_at, first[-1].id))
+    third, _, _ = await repo.get_list(size=2, page=3)
+    assert [r.id for r in first + second + third] == [r.id for r in reversed(rows)]
+
+
+@pytest.mark.asyncio
+async def test_repeated_call_hits_compiled_cache(db_session) -> None:
+    rows = await _seed(db_session)
+    repo = ApplicationRepository(db_session)
+    hits: list[bool] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        hits.append(context.cache_hit == context.dialect.CACHE_HIT)
+
+    event.listen(db_session.get_bind(), "before_cursor_execute", _capture)
+    try:
+        await repo.get_by_id_with_documents(rows[0].id)
+        await repo.get_by_id_with_documents(rows[1].id)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", _capture)
+
+    # Each call is the application SELECT plus the selectinload for documents.
+    assert hits[2:] == [True, True]
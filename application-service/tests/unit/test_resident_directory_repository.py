@@ -0,0 +1,199 @@
+"""resident_directory projection: upsert, refresh selection and the entrance/room JOIN in get_list."""
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.grpc_clients.auth_client import AuthClientStub, UserInfo
+from src.repositories.application_repository import ApplicationRepository
+from src.repositories.resident_directory_repository import ResidentDirectoryRepository
+from src.services.resident_directory import refresh_stale_residents, resolve_residents
+
+
+def _info(user_id: UUID, entrance: int, room: str, last_name: str = "Сидоров") -> UserInfo:
+    return UserInfo(
+        user_id=str(user_id),
+        last_name=last_name,
+        first_name="Семён",
+        patronymic="",
+        building="8",
+        entrance=entrance,
+        floor=1,
+        room=room,
+        roles=["student"],
+        phone="",
+        email="",
+        is_minor=False,
+    )
+
+
+async def _create_application(repo: ApplicationRepository, user_id: UUID):
+    now = datetime.now(timezone.utc)
+    return await repo.create(
+        user_id=user_id,
+        is_minor=False,
+        leave_time=now,
+        return_time=now + timedelta(hours=2),
+        reason="Магазин",
+        contact_phone="+79001234567",
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_list_filters_by_entrance_and_room_via_directory(db_session) -> None:
+    app_repo = ApplicationRepository(db_session)
+    residents = ResidentDirectoryRepository(db_session)
+    in_room, other_room, unknown = uuid4(), uuid4(), uuid4()
+    await residents.upsert_many([_info(in_room, 1, "301"), _info(other_room, 1, "302")])
+    for user_id in (in_room, other_room, unknown):
+        await _create_application(app_repo, user_id)
+
+    items, total, _ = await app_repo.get_list(entrance=1, room="301")
+    assert total == 1
+    assert [i.user_id for i in items] == [in_room]
+    assert items[0].resident is not None
+    assert items[0].resident.full_name == "Сидоров Семён"
+
+    items, total, _ = await app_repo.get_list(entrance=2)
+    assert (items, total) == ([], 0)
+
+    items, total, _ = await app_repo.get_list()
+    assert total == 3
+    assert {i.user_id for i in items if i.resident is None} == {unknown}
+
+
+@pytest.mark.asyncio
+async def test_upsert_updates_existing_row(db_session) -> None:
+    app_repo = ApplicationRepository(db_session)
+    residents = ResidentDirectoryRepository(db_session)
+    user_id = uuid4()
+    await _create_application(app_repo, user_id)
+    await residents.upsert_many([_info(user_id, 1, "301")])
+    await residents.upsert_many([_info(user_id, 3, "405", last_name="Новиков")])
+
+    items, _, _ = await app_repo.get_list(entrance=3, room="405")
+    assert len(items) == 1
+    assert items[0].resident.full_name == "Новиков Семён"
+
+
+@pytest.mark.asyncio
+async def test_refresh_backfills_applicants_missing_from_directory(db_session) -> None:
+    app_repo = ApplicationRepository(db_session)
+    residents = ResidentDirectoryRepository(db_session)
+    user_id = uuid4()
+    await _create_application(app_repo, user_id)
+
+    refreshed = await refresh_stale_residents(
+        residents, AuthClientStub(), max_age_seconds=3600, batch_size=100
+    )
+    assert refreshed == 1
+    assert await residents.get_user_ids_to_refresh(
+        refreshed_before=datetime.now(timezone.utc) - timedelta(hours=1), limit=100
+    ) == []
+
+    items, _, _ = await app_repo.get_list(entrance=1, room="301")
+    assert [i.user_id for i in items] == [user_id]
+
+
+class _CountingAuth(AuthClientStub):
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        self.batches.append(list(user_ids))
+        return await super().get_users_info(user_ids)
+
+
+@pytest.mark.asyncio
+async def test_resolve_residents_asks_auth_only_for_missing(db_session) -> None:
+    app_repo = ApplicationRepository(db_session)
+    residents = ResidentDirectoryRepository(db_session)
+    known, missing = uuid4(), uuid4()
+    await residents.upsert_many([_info(known, 2, "201")])
+    await _create_application(app_repo, known)
+    await _create_application(app_repo, missing)
+    items, _, _ = await app_repo.get_list()
+
+    auth = _CountingAuth()
+    resolved = await resolve_residents(auth, items)
+
+    assert auth.batches == [[str(missing)]]
+    assert getattr(resolved[str(known)], "room") == "201"
+    assert str(missing) in resolved
+
+
+class _PartialAuth(AuthClientStub):
+    """auth-service that no longer knows some of the users."""
+
+    def __init__(self, unknown: set[str]) -> None:
+        self.unknown = unknown
+
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        found = await super().get_users_info(user_ids)
+        return {k: v for k, v in found.items() if k not in self.unknown}
+
+
+@pytest.mark.asyncio
+async def test_refresh_tombstones_users_unknown_to_auth(db_session) -> None:
+    app_repo = ApplicationRepository(db_session)
+    residents = ResidentDirectoryRepository(db_session)
+    gone, fresh = uuid4(), uuid4()
+    for user_id in (gone, fresh):
+        await _create_application(app_repo, user_id)
+
+    processed = await refresh_stale_residents(
+        residents, _PartialAuth({str(gone)}), max_age_seconds=3600, batch_size=2
+    )
+    assert processed == 2
+    assert await residents.get_user_ids_to_refresh(
+        refreshed_before=datetime.now(timezone.utc) - timedelta(hours=1), limit=100
+    ) == []
+    rows = await residents.get_many([gone, fresh])
+    assert gone not in rows
+    assert rows[fresh].room == "301"
+
+
+@pytest.mark.asyncio
+async def test_tombstoned_user_is_recovered_by_a_later_refresh(db_session) -> None:
+    app_repo = ApplicationRepository(db_session)
+    residents = ResidentDirectoryRepository(db_session)
+    user_id = uuid4()
+    await _create_application(app_repo, user_id)
+    await refresh_stale_residents(residents, _PartialAuth({str(user_id)}), max_age_seconds=3600, batch_size=10)
+
+    # The tombstone neither matches the filter nor stands in for auth data.
+    items, _, _ = await app_repo.get_list(entrance=0)
+    assert items == []
+    items, _, _ = await app_repo.get_list()
+    assert items[0].resident is None
+    auth = _CountingAuth()
+    await resolve_residents(auth, items)
+    assert auth.batches == [[str(user_id)]]
+
+    # auth-service knows the user again: the next refresh (every row stale) replaces the tombstone.
+    await refresh_stale_residents(residents, _PartialAuth(set()), max_age_seconds=-60, batch_size=10)
+    db_session.expunge_all()
+    items, _, _ = await app_repo.get_list(entrance=1, room="301")
+    assert [i.user_id for i in items] == [user_id]
+    auth = _CountingAuth()
+    resolved = await resolve_residents(auth, items)
+    assert auth.batches == []
+    assert getattr(resolved[str(user_id)], "full_name") == "Иванов Иван Иванович"
+
+
+@pytest.mark.asyncio
+async def test_refresh_queue_puts_missing_rows_first_then_oldest(db_session) -> None:
+    app_repo = ApplicationRepository(db_session)
+    residents = ResidentDirectoryRepository(db_session)
+    older, newer, missing = uuid4(), uuid4(), uuid4()
+    for user_id in (older, newer, missing):
+        await _create_application(app_repo, user_id)
+    await residents.upsert_many([_info(older, 1, "301"), _info(newer, 1, "302")])
+    rows = await residents.get_many([older, newer])
+    rows[older].refreshed_at = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    rows[newer].refreshed_at = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    await db_session.flush()
+
+    assert await residents.get_user_ids_to_refresh(
+        refreshed_before=datetime(2022, 1, 1, tzinfo=timezone.utc), limit=2
+    ) == [missing, older]
@@ -0,0 +1,196 @@
+"""Async S3 backend against an in-memory S3 behind httpx.MockTransport."""
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.domain.exceptions import InvalidDocumentTypeError
+from src.storage.document_storage import UPLOAD_PART_SIZE_BYTES
+from src.storage.s3_storage import AsyncS3Storage, S3RequestError
+
+
+class _FakeS3:
+    def __init__(self, *, failures: int = 0, delay: float = 0.0) -> None:
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.failures = failures
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"].startswith("AWS4-HMAC-SHA256 Credential=")
+        self.requests.append((request.method, request.url.query.decode()))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                return httpx.Response(503)
+            return self._handle(request, request.url.path.split("/", 2)[2] if request.url.path.count("/") > 1 else "")
+        finally:
+            self.in_flight -= 1
+
+    def _handle(self, request: httpx.Request, key: str) -> httpx.Response:
+        params = request.url.params
+        if not key:
+            return httpx.Response(200)
+        if request.method == "POST" and "uploads" in params:
+            upload_id = f"u{len(self.uploads)}"
+            self.uploads[upload_id] = {}
+            return httpx.Response(200, content=f"<InitiateMultipartUploadResult><UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>".encode())
+        if request.method == "PUT" and "partNumber" in params:
+            self.uploads[params["uploadId"]][int(params["partNumber"])] = request.content
+            return httpx.Response(200, headers={"ETag": f'"p{params["partNumber"]}"'})
+        if request.method == "POST" and "uploadId" in params:
+            parts = self.uploads.pop(params["uploadId"])
+            self.objects[key] = b"".join(parts[n] for n in sorted(parts))
+            return httpx.Response(200, content=b"<CompleteMultipartUploadResult/>")
+        if request.method == "DELETE" and "uploadId" in params:
+            self.uploads.pop(params["uploadId"], None)
+            return httpx.Response(204)
+        if request.method == "PUT":
+            self.objects[key] = request.content
+            return httpx.Response(200, headers={"ETag": '"e"'})
+        if request.method == "DELETE":
+            self.objects.pop(key, None)  # S3 answers 204 for missing keys too
+            return httpx.Response(204)
+        if key not in self.objects:
+            return httpx.Response(404, content=b"<Error><Code>NoSuchKey</Code></Error>" if request.method != "HEAD" else b"")
+        data = self.objects[key]
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={"Content-Length": str(len(data)), "ETag": '"e"', "Content-Type": "application/pdf"})
+        if request.method == "GET":
+            start, _, end = request.headers.get("Range", "bytes=0-").removeprefix("bytes=").partition("-")
+            return httpx.Response(206, content=data[int(start) : int(end) + 1 if end else None])
+        return httpx.Response(405)
+
+
+def _storage(s3: _FakeS3, **kwargs) -> AsyncS3Storage:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(s3))
+    return AsyncS3Storage([client], retry_backoff_seconds=0, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_put_stat_read_delete_round_trip() -> None:
+    s3 = _FakeS3()
+    storage = _storage(s3)
+    name = await storage.upload_file(uuid4(), uuid4(), b"0123456789", "application/pdf", "pdf")
+
+    assert await storage.stat_object(name) == (10, "application/pdf", '"e"')
+    assert [c async for c in storage.iter_object(name, offset=2, length=6, chunk_size=4)] == [b"2345", b"67"]
+    await storage.delete_file(name)
+    assert await storage.head_object(name) is None
+    with pytest.raises(S3RequestError):
+        await storage.stat_object(name)
+
+
+@pytest.mark.asyncio
+async def test_bucket_checked_once() -> None:
+    s3 = _FakeS3()
+    storage = _storage(s3)
+    await storage.ensure_bucket()
+    s3.requests.clear()
+    await storage.upload_file(uuid4(), uuid4(), b"x", "application/pdf", "pdf")
+    assert s3.requests == [("PUT", "")]
+
+
+@pytest.mark.asyncio
+async def test_5xx_is_retried_then_surfaced() -> None:
+    s3 = _FakeS3(failures=2)
+    storage = _storage(s3, max_retries=2)
+    await storage.delete_file("a/b.pdf")  # third attempt succeeds
+    assert len(s3.requests) == 3
+
+    s3.failures = 3
+    with pytest.raises(S3RequestError) as exc:
+        await storage.delete_file("a/b.pdf")
+    assert exc.value.status == 503
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded() -> None:
+    s3 = _FakeS3(delay=0.01)
+    storage = _storage(s3, max_concurrency=4)
+    storage._bucket_ready = True
+    await asyncio.gather(*(storage.upload_file(uuid4(), uuid4(), b"x", "application/pdf", "pdf") for _ in range(20)))
+    assert len(s3.objects) == 20
+    assert s3.max_in_flight == 4
+
+
+async def _chunks(total: int, fail_after: int | None = None):
+    sent = 0
+    while sent < total:
+        if fail_after is not None and sent >= fail_after:
+            raise InvalidDocumentTypeError("voice file too large")
+        size = min(256 * 1024, total - sent)
+        sent += size
+        yield b"x" * size
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_uses_multipart_and_aborts_on_error() -> None:
+    s3 = _FakeS3()
+    storage = _storage(s3)
+    total = 2 * UPLOAD_PART_SIZE_BYTES + 1000
+    name = await storage.upload_stream(uuid4(), uuid4(), _chunks(total), "application/pdf", "pdf")
+    assert len(s3.objects[name]) == total
+    assert sum(1 for method, query in s3.requests if "partNumber" in query) == 3
+
+    small = await storage.upload_stream(uuid4(), uuid4(), _chunks(1000), "application/pdf", "pdf")
+    assert len(s3.objects[small]) == 1000
+
+    with pytest.raises(InvalidDocumentTypeError):
+        await storage.upload_stream(
+            uuid4(), uuid4(), _chunks(total, fail_after=UPLOAD_PART_SIZE_BYTES + 1), "audio/mpeg", "mp3"
+        )
+    assert s3.requests[-1][0] == "DELETE" and not s3.uploads
+
+
+class _LostCompletionS3(_FakeS3):
+    """Completes multipart uploads but loses the response."""
+
+    def _handle(self, request: httpx.Request, key: str) -> httpx.Response:
+        response = super()._handle(request, key)
+        if request.method == "POST" and "uploadId" in request.url.params:
+            return httpx.Response(503)
+        return response
+
+
+@pytest.mark.asyncio
+async def test_multipart_completion_is_not_retried() -> None:
+    s3 = _LostCompletionS3()
+    storage = _storage(s3, max_retries=2)
+    with pytest.raises(S3RequestError) as exc:
+        await storage.upload_stream(
+            uuid4(), uuid4(), _chunks(UPLOAD_PART_SIZE_BYTES + 1000), "application/pdf", "pdf"
+        )
+    assert exc.value.status == 503
+    completions = [q for method, q in s3.requests if method == "POST" and "uploadId" in q]
+    assert len(completions) == 1
+
+
+@pytest.mark.asyncio
+async def test_stalled_downloads_do_not_hold_slots() -> None:
+    s3 = _FakeS3()
+    storage = _storage(s3, max_concurrency=2, timeout_seconds=1)
+    name = await storage.upload_file(uuid4(), uuid4(), b"x" * 64, "application/pdf", "pdf")
+
+    readers = [storage.iter_object(name, chunk_size=8) for _ in range(2)]
+    for reader in readers:
+        assert await anext(reader) == b"x" * 8  # then the reader stalls
+    assert await asyncio.wait_for(storage.head_object(name), 1) == 64
+    for reader in readers:
+        await reader.aclose()
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_a_slot_times_out() -> None:
+    storage = _storage(_FakeS3(), max_concurrency=1, timeout_seconds=0.05)
+    await storage._slots.acquire()
+    with pytest.raises(S3RequestError) as exc:
+        await storage.head_object("a/b.pdf")
+    assert exc.value.status == 503
@@ -0,0 +1,124 @@
+"""Unit tests for SingleFlight and CoalescingAuthClient (in-flight deduplication)."""
+import asyncio
+
+import pytest
+
+from src.grpc_clients.auth_client import AuthClientStub, UserInfo
+from src.grpc_clients.single_flight import AUTH_COALESCED_CALLS, CoalescingAuthClient, SingleFlight
+
+
+class _SlowAuth(AuthClientStub):
+    """Holds every call until release is set, so callers overlap deterministically."""
+
+    def __init__(self, known: set[str]) -> None:
+        self._known = known
+        self.release = asyncio.Event()
+        self.single_calls: list[str] = []
+        self.batch_calls: list[list[str]] = []
+
+    async def get_user_info(self, user_id: str) -> UserInfo | None:
+        self.single_calls.append(user_id)
+        await self.release.wait()
+        if user_id not in self._known:
+            return None
+        return await super().get_user_info(user_id)
+
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        self.batch_calls.append(list(user_ids))
+        await self.release.wait()
+        result: dict[str, UserInfo] = {}
+        for user_id in user_ids:
+            if user_id in self._known:
+                info = await AuthClientStub.get_user_info(self, user_id)
+                assert info is not None
+                result[user_id] = info
+        return result
+
+
+def _coalesced(method: str) -> float:
+    return AUTH_COALESCED_CALLS.labels(method)._value.get()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_single_lookups_share_one_call() -> None:
+    inner = _SlowAuth({"a"})
+    client = CoalescingAuthClient(inner)
+    before = _coalesced("get_user_info")
+
+    tasks = [asyncio.create_task(client.get_user_info("a")) for _ in range(5)]
+    await asyncio.sleep(0)
+    inner.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert inner.single_calls == ["a"]
+    assert all(r is not None and r.user_id == "a" for r in results)
+    assert _coalesced("get_user_info") - before == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_joins_in_flight_keys_and_fetches_the_rest() -> None:
+    inner = _SlowAuth({"a", "b"})
+    client = CoalescingAuthClient(inner)
+
+    single = asyncio.create_task(client.get_user_info("a"))
+    await asyncio.sleep(0)
+    batch = asyncio.create_task(client.get_users_info(["a", "b", "missing"]))
+    await asyncio.sleep(0)
+    late_single = asyncio.create_task(client.get_user_info("b"))
+    await asyncio.sleep(0)
+    inner.release.set()
+
+    assert (await single) is not None
+    assert set(await batch) == {"a", "b"}
+    assert (await late_single) is not None
+    assert inner.single_calls == ["a"]
+    assert inner.batch_calls == [["b", "missing"]]
+
+
+@pytest.mark.asyncio
+async def test_keys_are_forgotten_after_completion() -> None:
+    inner = _SlowAuth({"a"})
+    inner.release.set()
+    client = CoalescingAuthClient(inner)
+
+    await client.get_user_info("a")
+    await client.get_user_info("a")
+
+    assert inner.single_calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_error_is_shared_and_not_remembered() -> None:
+    flight: SingleFlight[str, int] = SingleFlight("test")
+    calls = 0
+    gate = asyncio.Event()
+
+    async def failing() -> int:
+        nonlocal calls
+        calls += 1
+        await gate.wait()
+        raise RuntimeError("auth down")
+
+    tasks = [asyncio.create_task(flight.do("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call() -> None:
+    inner = _SlowAuth({"a"})
+    client = CoalescingAuthClient(inner)
+
+    first = asyncio.create_task(client.get_user_info("a"))
+    second = asyncio.create_task(client.get_user_info("a"))
+    await asyncio.sleep(0)
+    first.cancel()
+    inner.release.set()
+
+    assert (await second) is not None
+    assert inner.single_calls == ["a"]
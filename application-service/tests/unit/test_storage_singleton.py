@@ -0,0 +1,77 @@
+"""Storage is shared per process and checks the bucket once, not before every operation."""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.config import minio_settings
+from src.storage import document_storage
+from src.storage.document_storage import close_storage, get_storage, init_storage
+from src.storage.minio_storage import MinioStorage
+
+
+class _CountingClient:
+    def __init__(self, exists: bool) -> None:
+        self.exists = exists
+        self.calls: list[str] = []
+
+    def bucket_exists(self, bucket: str) -> bool:
+        self.calls.append("bucket_exists")
+        return self.exists
+
+    def make_bucket(self, bucket: str) -> None:
+        self.calls.append("make_bucket")
+        self.exists = True
+
+    def put_object(self, bucket, object_name, data, length, **kwargs) -> None:
+        self.calls.append("put_object")
+
+    def remove_object(self, bucket, object_name) -> None:
+        self.calls.append("remove_object")
+
+
+@pytest.mark.asyncio
+async def test_bucket_checked_once_then_one_request_per_operation() -> None:
+    storage = MinioStorage()
+    client = _CountingClient(exists=False)
+    storage._client = client  # type: ignore[assignment]
+
+    await storage.ensure_bucket()
+    await storage.ensure_bucket()
+    assert client.calls == ["bucket_exists", "make_bucket"]
+
+    client.calls.clear()
+    name = await storage.upload_file(uuid4(), uuid4(), b"data", "application/pdf", "pdf")
+    await storage.delete_file(name)
+    assert client.calls == ["put_object", "remove_object"]
+
+
+@pytest.mark.asyncio
+async def test_storage_is_shared_with_configured_pool(monkeypatch) -> None:
+    monkeypatch.setattr(minio_settings, "public_endpoint", "files.example.com")
+    monkeypatch.setattr(minio_settings, "pool_maxsize", 7)
+    monkeypatch.setattr(document_storage, "_storage", None)
+    storage = get_storage()
+    try:
+        assert get_storage() is storage
+        assert storage._http.connection_pool_kw["maxsize"] == 7
+        assert storage._http.connection_pool_kw["timeout"].connect_timeout == minio_settings.connect_timeout_seconds
+        assert storage._client._http is storage._http
+        assert storage._presign_client._http is storage._http
+    finally:
+        await close_storage()
+    assert document_storage._storage is None
+
+
+class _UnreachableStorage:
+    async def ensure_bucket(self) -> None:
+        await asyncio.sleep(3600)
+
+
+@pytest.mark.asyncio
+async def test_startup_bucket_check_is_bounded(monkeypatch) -> None:
+    storage = _UnreachableStorage()
+    monkeypatch.setattr(document_storage, "_storage", storage)
+    monkeypatch.setattr(minio_settings, "startup_check_timeout_seconds", 0.05)
+
+    assert await asyncio.wait_for(init_storage(), 1) is storage
@@ -0,0 +1,108 @@
+"""Unit tests for TokenValidationCache and its use in get_current_user."""
+import base64
+import json
+
+import pytest
+
+from src.dependencies import get_current_user
+from src.grpc_clients.auth_client import AuthClientStub, TokenValidation
+from src.grpc_clients.token_cache import TokenValidationCache
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": "u", "exp": exp}).encode()).rstrip(b"=")
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload.decode()}.signature"
+
+
+def _validation(user_id: str = "00000000-0000-0000-0000-000000000001") -> TokenValidation:
+    return TokenValidation(
+        valid=True,
+        user_id=user_id,
+        roles=["student"],
+        building="8",
+        entrance=1,
+        floor=3,
+        room="301",
+        is_minor=False,
+    )
+
+
+class _CountingAuth(AuthClientStub):
+    def __init__(self) -> None:
+        self.validate_calls = 0
+
+    async def validate_token(self, token: str) -> TokenValidation | None:
+        self.validate_calls += 1
+        return await super().validate_token(token)
+
+
+def test_entry_expires_at_configured_ttl() -> None:
+    clock = _Clock()
+    cache = TokenValidationCache(max_size=10, ttl_seconds=60, clock=clock)
+    cache.put("opaque-token", _validation())
+
+    clock.now += 59
+    assert cache.get("opaque-token") is not None
+    clock.now += 2
+    assert cache.get("opaque-token") is None
+
+
+def test_entry_expires_at_token_exp_when_earlier() -> None:
+    clock = _Clock()
+    cache = TokenValidationCache(max_size=10, ttl_seconds=600, clock=clock)
+    token = _jwt(exp=clock.now + 30)
+    cache.put(token, _validation())
+
+    clock.now += 29
+    assert cache.get(token) is not None
+    clock.now += 2
+    assert cache.get(token) is None
+
+
+def test_expired_token_is_not_cached() -> None:
+    clock = _Clock()
+    cache = TokenValidationCache(max_size=10, ttl_seconds=600, clock=clock)
+    token = _jwt(exp=clock.now - 1)
+    cache.put(token, _validation())
+    assert cache.get(token) is None
+
+
+def test_revoke_token_and_user() -> None:
+    cache = TokenValidationCache(max_size=10, ttl_seconds=60, clock=_Clock())
+    cache.put("a", _validation("user-1"))
+    cache.put("b", _validation("user-1"))
+    cache.put("c", _validation("user-2"))
+
+    cache.revoke("a")
+    assert cache.get("a") is None
+    cache.revoke_user("user-1")
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_size_bound() -> None:
+    cache = TokenValidationCache(max_size=2, ttl_seconds=60, clock=_Clock())
+    for token in ("a", "b", "c"):
+        cache.put(token, _validation())
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_skips_auth_on_repeat() -> None:
+    auth = _CountingAuth()
+    cache = TokenValidationCache(max_size=10, ttl_seconds=60)
+
+    first = await get_current_user("Bearer session-token", auth, cache)
+    second = await get_current_user("Bearer session-token", auth, cache)
+
+    assert first == second
+    assert auth.validate_calls == 1
@@ -0,0 +1,174 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.config import minio_settings
+from src.constants.document_type import MAX_SCAN_SIZE_BYTES
+from src.domain.exceptions import DocumentNotFoundError, InvalidDocumentTypeError, ValidationError
+from src.services.application_service import ApplicationService
+from src.storage.minio_storage import MinioStorage
+
+
+@dataclass
+class _App:
+    id: UUID
+    user_id: UUID
+    leave_time: datetime | None = None
+
+
+@dataclass
+class _Doc:
+    id: UUID
+    application_id: UUID
+    document_type: str
+    file_url: str
+
+
+class _AppRepo:
+    def __init__(self, app: _App) -> None:
+        self._app = app
+
+    async def get_by_id(self, application_id: UUID):
+        return self._app if self._app.id == application_id else None
+
+
+class _DocRepo:
+    def __init__(self) -> None:
+        self.docs: dict[UUID, _Doc] = {}
+
+    async def get_by_id(self, document_id: UUID, application_leave_time: datetime | None = None):
+        return self.docs.get(document_id)
+
+    async def create_if_absent(self, document_id, application_id, application_leave_time, document_type, file_url, uploaded_by):
+        if document_id in self.docs:
+            return None
+        self.docs[document_id] = _Doc(document_id, application_id, document_type, file_url)
+        return self.docs[document_id]
+
+
+class _Storage:
+    def __init__(self) -> None:
+        self.objects: dict[str, int] = {}
+        self.policies: list[tuple[str, str, int]] = []
+
+    async def presigned_upload_policy(self, object_name, content_type, max_size, expiry_seconds=900):
+        self.policies.append((object_name, content_type, max_size))
+        return "http://minio/applications", {"key": object_name}
+
+    async def head_object(self, object_name: str) -> int | None:
+        return self.objects.get(object_name)
+
+    async def delete_file(self, object_name: str) -> None:
+        self.objects.pop(object_name, None)
+
+
+class _Auth:
+    async def get_user_info(self, user_id: str):
+        return None
+
+
+def _service() -> tuple[ApplicationService, _App, _DocRepo, _Storage]:
+    app = _App(id=uuid4(), user_id=uuid4())
+    docs, storage = _DocRepo(), _Storage()
+    service = ApplicationService(
+        application_repository=_AppRepo(app),  # type: ignore[arg-type]
+        document_repository=docs,  # type: ignore[arg-type]
+        storage=storage,  # type: ignore[arg-type]
+        auth_client=_Auth(),  # type: ignore[arg-type]
+    )
+    return service, app, docs, storage
+
+
+@pytest.mark.asyncio
+async def test_upload_session_then_confirm_records_document_once() -> None:
+    service, app, docs, storage = _service()
+    session = await service.create_upload_session(
+        app.id, "signed_application", "application/pdf", "scan.PDF", app.user_id, size=1024
+    )
+    object_name = f"{app.id}/signed_application/{session.document_id}.pdf"
+    assert storage.policies == [(object_name, "application/pdf", MAX_SCAN_SIZE_BYTES)]
+    assert session.max_size == MAX_SCAN_SIZE_BYTES
+
+    with pytest.raises(ValidationError):
+        await service.confirm_upload(app.id, UUID(session.document_id), "signed_application", "scan.PDF", app.user_id)
+
+    storage.objects[object_name] = 1024
+    doc = await service.confirm_upload(app.id, UUID(session.document_id), "signed_application", "scan.PDF", app.user_id)
+    again = await service.confirm_upload(app.id, UUID(session.document_id), "signed_application", "scan.PDF", app.user_id)
+    assert doc is again and doc.file_url == object_name and len(docs.docs) == 1
+
+
+@pytest.mark.asyncio
+async def test_upload_session_rejects_bad_extension_and_declared_size() -> None:
+    service, app, _, storage = _service()
+    with pytest.raises(InvalidDocumentTypeError):
+        await service.create_upload_session(app.id, "signed_application", "text/plain", "notes.txt", app.user_id)
+    with pytest.raises(InvalidDocumentTypeError):
+        await service.create_upload_session(
+            app.id, "signed_application", "application/pdf", "scan.pdf", app.user_id, size=MAX_SCAN_SIZE_BYTES + 1
+        )
+    assert storage.policies == []
+
+
+@pytest.mark.asyncio
+async def test_confirm_removes_oversized_object() -> None:
+    service, app, docs, storage = _service()
+    document_id = uuid4()
+    object_name = f"{app.id}/signed_application/{document_id}.pdf"
+    storage.objects[object_name] = MAX_SCAN_SIZE_BYTES + 1
+    with pytest.raises(InvalidDocumentTypeError):
+        await service.confirm_upload(app.id, document_id, "signed_application", "scan.pdf", app.user_id)
+    assert object_name not in storage.objects and not docs.docs
+
+
+@pytest.mark.asyncio
+async def test_confirm_is_bound_to_the_session_document_type() -> None:
+    service, app, docs, storage = _service()
+    session = await service.create_upload_session(
+        app.id, "signed_application", "application/pdf", "scan.pdf", app.user_id
+    )
+    storage.objects[f"{app.id}/signed_application/{session.document_id}.pdf"] = 1024
+
+    with pytest.raises(ValidationError):
+        await service.confirm_upload(app.id, UUID(session.document_id), "parent_letter", "scan.pdf", app.user_id)
+    await service.confirm_upload(app.id, UUID(session.document_id), "signed_application", "scan.pdf", app.user_id)
+    with pytest.raises(DocumentNotFoundError):
+        await service.confirm_upload(app.id, UUID(session.document_id), "parent_letter", "scan.pdf", app.user_id)
+    assert [d.document_type for d in docs.docs.values()] == ["signed_application"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_confirm_returns_the_recorded_document() -> None:
+    service, app, docs, storage = _service()
+    document_id = uuid4()
+    storage.objects[f"{app.id}/signed_application/{document_id}.pdf"] = 1024
+    # The other confirm inserts between this one's existence check and its insert.
+    winner = _Doc(document_id, app.id, "signed_application", "key")
+    lookups = iter([None, winner])
+
+    async def _get_by_id(document_id, application_leave_time=None):
+        return next(lookups)
+
+    docs.get_by_id = _get_by_id  # type: ignore[method-assign]
+    docs.docs[document_id] = winner
+
+    assert await service.confirm_upload(app.id, document_id, "signed_application", "scan.pdf", app.user_id) is winner
+
+
+@pytest.mark.asyncio
+async def test_presigned_upload_policy_pins_key_type_and_size(monkeypatch) -> None:
+    monkeypatch.setattr(minio_settings, "public_endpoint", "files.example.com")
+    storage = MinioStorage()
+    storage._bucket_ready = True
+    url, fields = await storage.presigned_upload_policy("a/b.pdf", "application/pdf", 1000)
+
+    assert url == "http://files.example.com/applications"
+    assert fields["key"] == "a/b.pdf" and fields["Content-Type"] == "application/pdf"
+    conditions = json.loads(base64.b64decode(fields["policy"]))["conditions"]
+    assert ["eq", "$key", "a/b.pdf"] in conditions
+    assert ["eq", "$Content-Type", "application/pdf"] in conditions
+    assert ["content-length-range", 1, 1000] in conditions
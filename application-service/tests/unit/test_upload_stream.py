@@ -0,0 +1,137 @@
+"""Streaming upload: chunks go to a multipart put as they arrive and oversize files abort it."""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from minio.helpers import read_part_data
+
+from src.constants.document_type import MAX_VOICE_SIZE_BYTES
+from src.domain.exceptions import InvalidDocumentTypeError
+from src.services.application_service import ApplicationService
+from src.storage.minio_storage import UPLOAD_PART_SIZE_BYTES, MinioStorage
+
+CHUNK = 256 * 1024
+
+
+class _MultipartClient:
+    """Reads the stream the way minio's put_object(length=-1) does, one part at a time."""
+
+    def __init__(self) -> None:
+        self.parts: list[int] = []
+        self.largest_read = 0
+        self.aborted = False
+
+    def bucket_exists(self, bucket: str) -> bool:
+        return True
+
+    def put_object(self, bucket, object_name, data, length, part_size, **kwargs) -> None:
+        assert length == -1
+
+        class _Tracking:
+            def read(_, size: int) -> bytes:
+                chunk = data.read(size)
+                self.largest_read = max(self.largest_read, len(chunk))
+                return chunk
+
+        try:
+            while part := read_part_data(_Tracking(), part_size):
+                self.parts.append(len(part))
+        except Exception:
+            self.aborted = True
+            raise
+
+
+def _storage() -> tuple[MinioStorage, _MultipartClient]:
+    storage = MinioStorage()
+    client = _MultipartClient()
+    storage._client = client  # type: ignore[assignment]
+    return storage, client
+
+
+async def _chunks(total: int):
+    sent = 0
+    while sent < total:
+        size = min(CHUNK, total - sent)
+        sent += size
+        yield b"x" * size
+
+
+@pytest.mark.asyncio
+async def test_stream_is_sent_in_parts_without_buffering_the_file() -> None:
+    storage, client = _storage()
+    application_id, document_id = uuid4(), uuid4()
+    total = 2 * UPLOAD_PART_SIZE_BYTES + 123
+
+    name = await storage.upload_stream(application_id, document_id, _chunks(total), "application/pdf", "pdf")
+
+    assert name == f"{application_id}/{document_id}.pdf"
+    assert client.parts == [UPLOAD_PART_SIZE_BYTES, UPLOAD_PART_SIZE_BYTES, 123]
+    assert client.largest_read <= CHUNK
+
+
+@dataclass
+class _App:
+    id: UUID
+    user_id: UUID
+    leave_time: datetime
+
+
+class _AppRepo:
+    def __init__(self, app: _App) -> None:
+        self._app = app
+
+    async def get_by_id(self, application_id: UUID) -> _App:
+        return self._app
+
+
+class _DocRepo:
+    async def create(self, **kwargs: object) -> dict:
+        return kwargs
+
+
+@pytest.mark.asyncio
+async def test_oversize_stream_aborts_upload() -> None:
+    storage, client = _storage()
+    app = _App(id=uuid4(), user_id=uuid4(), leave_time=datetime.now(timezone.utc))
+    service = ApplicationService(
+        application_repository=_AppRepo(app),  # type: ignore[arg-type]
+        document_repository=_DocRepo(),  # type: ignore[arg-type]
+        storage=storage,
+        auth_client=None,  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(InvalidDocumentTypeError, match="too large"):
+        await service.upload_document_stream(
+            application_id=app.id,
+            document_type="voice_message",
+            chunks=_chunks(MAX_VOICE_SIZE_BYTES + 1),
+            content_type="audio/mpeg",
+            filename="voice.mp3",
+            uploaded_by=app.user_id,
+        )
+    assert client.aborted
+
+
+@pytest.mark.asyncio
+async def test_stream_creates_document_for_the_stored_object() -> None:
+    storage, _ = _storage()
+    app = _App(id=uuid4(), user_id=uuid4(), leave_time=datetime.now(timezone.utc))
+    service = ApplicationService(
+        application_repository=_AppRepo(app),  # type: ignore[arg-type]
+        document_repository=_DocRepo(),  # type: ignore[arg-type]
+        storage=storage,
+        auth_client=None,  # type: ignore[arg-type]
+    )
+
+    doc = await service.upload_document_stream(
+        application_id=app.id,
+        document_type="signed_application",
+        chunks=_chunks(3 * CHUNK),
+        content_type="application/pdf",
+        filename="scan.PDF",
+        uploaded_by=app.user_id,
+    )
+
+    assert doc["file_url"] == f"{app.id}/{doc['document_id']}.pdf"  # type: ignore[index]
+    assert doc["application_leave_time"] == app.leave_time  # type: ignore[index]
@@ -0,0 +1,108 @@
+"""Unit tests for CachingAuthClient (TTL, LRU bound, negative caching)."""
+import pytest
+
+from src.grpc_clients.auth_client import AuthClientStub, UserInfo
+from src.grpc_clients.user_info_cache import CachingAuthClient
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingAuth(AuthClientStub):
+    def __init__(self, known: set[str]) -> None:
+        self._known = known
+        self.single_calls: list[str] = []
+        self.batch_calls: list[list[str]] = []
+
+    async def get_user_info(self, user_id: str) -> UserInfo | None:
+        self.single_calls.append(user_id)
+        if user_id not in self._known:
+            return None
+        return await super().get_user_info(user_id)
+
+    async def get_users_info(self, user_ids: list[str]) -> dict[str, UserInfo]:
+        self.batch_calls.append(list(user_ids))
+        result: dict[str, UserInfo] = {}
+        for user_id in user_ids:
+            if user_id in self._known:
+                info = await AuthClientStub.get_user_info(self, user_id)
+                assert info is not None
+                result[user_id] = info
+        return result
+
+
+def _client(inner: _CountingAuth, clock: _Clock, max_size: int = 10) -> CachingAuthClient:
+    return CachingAuthClient(
+        inner,
+        max_size=max_size,
+        ttl_seconds=100,
+        negative_ttl_seconds=10,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_hit_within_ttl_and_refetch_after_expiry() -> None:
+    clock = _Clock()
+    inner = _CountingAuth({"a"})
+    cache = _client(inner, clock)
+
+    assert (await cache.get_user_info("a")) is not None
+    assert (await cache.get_user_info("a")) is not None
+    assert inner.single_calls == ["a"]
+
+    clock.now = 101
+    await cache.get_user_info("a")
+    assert inner.single_calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_is_negatively_cached() -> None:
+    clock = _Clock()
+    inner = _CountingAuth(set())
+    cache = _client(inner, clock)
+
+    assert (await cache.get_user_info("ghost")) is None
+    assert (await cache.get_user_info("ghost")) is None
+    assert inner.single_calls == ["ghost"]
+
+    clock.now = 11
+    await cache.get_user_info("ghost")
+    assert inner.single_calls == ["ghost", "ghost"]
+
+
+@pytest.mark.asyncio
+async def test_batch_fetches_only_missing_ids() -> None:
+    clock = _Clock()
+    inner = _CountingAuth({"a", "b"})
+    cache = _client(inner, clock)
+
+    await cache.get_user_info("a")
+    result = await cache.get_users_info(["a", "b", "ghost", "b"])
+
+    assert set(result) == {"a", "b"}
+    assert inner.batch_calls == [["b", "ghost"]]
+
+    await cache.get_users_info(["a", "b", "ghost"])
+    assert len(inner.batch_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_bound_evicts_least_recently_used() -> None:
+    clock = _Clock()
+    inner = _CountingAuth({"a", "b", "c"})
+    cache = _client(inner, clock, max_size=2)
+
+    await cache.get_user_info("a")
+    await cache.get_user_info("b")
+    await cache.get_user_info("a")
+    await cache.get_user_info("c")
+
+    await cache.get_user_info("a")
+    await cache.get_user_info("b")
+    assert inner.single_calls == ["a", "b", "c", "b"]
@@ -0,0 +1,23 @@
+"""uuid7: RFC 9562 layout, embedded timestamp and monotonic order within a process."""
+import time
+
+from src.models.ids import uuid7
+
+
+def test_version_variant_and_timestamp() -> None:
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert before <= value.int >> 80 <= after
+
+
+def test_ids_are_strictly_increasing() -> None:
+    ids = [uuid7() for _ in range(20_000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    # Byte order, which is what the PostgreSQL uuid btree compares.
+    assert [i.bytes for i in ids] == sorted(i.bytes for i in ids)
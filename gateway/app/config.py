@@ -1,4 +1,6 @@
 import os
 
 APPLICATION_GRPC_URL = os.environ.get("APPLICATION_GRPC_URL", "application-service:50055")
+# Size of the pieces an uploaded file is forwarded in (UploadDocumentStream).
+UPLOAD_CHUNK_SIZE_BYTES = int(os.environ.get("UPLOAD_CHUNK_SIZE_BYTES", str(256 * 1024)))
 LOKI_URL = os.environ.get("LOKI_URL", "").strip()
@@ -3,6 +3,7 @@ gRPC client for application-service. Generated code (application_pb2, applicatio
 is produced at build time into app/grpc_gen/.
 """
 import sys
+from collections.abc import AsyncIterator
 from pathlib import Path
 
 import grpc
@@ -39,6 +40,8 @@ async def list_applications(
     room: str | None = None,
     date_from: str | None = None,
     date_to: str | None = None,
+    cursor: str | None = None,
+    count_mode: str | None = None,
 ):
     if application_pb2 is None or application_pb2_grpc is None:
         raise RuntimeError("gRPC generated code not available")
@@ -51,6 +54,8 @@ async def list_applications(
         room=room or "",
         date_from=date_from or "",
         date_to=date_to or "",
+        cursor=cursor or "",
+        count_mode=count_mode or "",
     )
     return await stub.ListApplications(req, metadata=_metadata(user_id, roles))
 
@@ -108,27 +113,128 @@ async def decide_application(
     return await stub.DecideApplication(req, metadata=_metadata(user_id, roles))
 
 
-async def upload_document(
+async def decide_applications(
+    channel: grpc.aio.Channel,
+    user_id: str,
+    roles: list[str],
+    application_ids: list[str],
+    status: str,
+    reject_reason: str | None = None,
+):
+    if application_pb2 is None or application_pb2_grpc is None:
+        raise RuntimeError("gRPC generated code not available")
+    stub = application_pb2_grpc.ApplicationServiceStub(channel)
+    req = application_pb2.DecideApplicationsRequest(
+        application_ids=application_ids,
+        status=status,
+        reject_reason=reject_reason or "",
+    )
+    return await stub.DecideApplications(req, metadata=_metadata(user_id, roles))
+
+
+async def upload_document_stream(
     channel: grpc.aio.Channel,
     user_id: str,
     roles: list[str],
     application_id: str,
     document_type: str,
-    file_content: bytes,
     content_type: str,
     filename: str,
+    chunks: AsyncIterator[bytes],
 ):
+    """Client-streaming UploadDocumentStream: the header, then the file as it is read."""
     if application_pb2 is None or application_pb2_grpc is None:
         raise RuntimeError("gRPC generated code not available")
     stub = application_pb2_grpc.ApplicationServiceStub(channel)
-    req = application_pb2.UploadDocumentRequest(
+
+    async def _messages():
+        yield application_pb2.UploadDocumentChunk(
+            header=application_pb2.UploadDocumentHeader(
+                application_id=application_id,
+                document_type=document_type,
+                content_type=content_type,
+                filename=filename,
+            )
+        )
+        async for chunk in chunks:
+            yield application_pb2.UploadDocumentChunk(data=chunk)
+
+    return await stub.UploadDocumentStream(_messages(), metadata=_metadata(user_id, roles))
+
+
+async def create_upload_session(
+    channel: grpc.aio.Channel,
+    user_id: str,
+    roles: list[str],
+    application_id: str,
+    document_type: str,
+    content_type: str,
+    filename: str,
+    size: int = 0,
+):
+    if application_pb2 is None or application_pb2_grpc is None:
+        raise RuntimeError("gRPC generated code not available")
+    stub = application_pb2_grpc.ApplicationServiceStub(channel)
+    req = application_pb2.CreateUploadSessionRequest(
         application_id=application_id,
         document_type=document_type,
-        file_content=file_content,
         content_type=content_type,
         filename=filename,
+        size=size,
+    )
+    return await stub.CreateUploadSession(req, metadata=_metadata(user_id, roles))
+
+
+async def confirm_upload(
+    channel: grpc.aio.Channel,
+    user_id: str,
+    roles: list[str],
+    application_id: str,
+    document_id: str,
+    document_type: str,
+    filename: str,
+):
+    if application_pb2 is None or application_pb2_grpc is None:
+        raise RuntimeError("gRPC generated code not available")
+    stub = application_pb2_grpc.ApplicationServiceStub(channel)
+    req = application_pb2.ConfirmUploadRequest(
+        application_id=application_id,
+        document_id=document_id,
+        document_type=document_type,
+        filename=filename,
+    )
+    return await stub.ConfirmUpload(req, metadata=_metadata(user_id, roles))
+
+
+async def open_document_download(
+    channel: grpc.aio.Channel,
+    user_id: str,
+    roles: list[str],
+    application_id: str,
+    document_id: str,
+    range_header: str = "",
+    if_none_match: str = "",
+):
+    """
+    Start the server-streaming DownloadDocument call. Returns (info, call): the
+    DocumentFileInfo from the first message and the call to read the `data` chunks
+    from with call.read() until grpc.aio.EOF.
+    """
+    if application_pb2 is None or application_pb2_grpc is None:
+        raise RuntimeError("gRPC generated code not available")
+    stub = application_pb2_grpc.ApplicationServiceStub(channel)
+    req = application_pb2.DownloadDocumentRequest(
+        application_id=application_id,
+        document_id=document_id,
+        range=range_header,
+        if_none_match=if_none_match,
     )
-    return await stub.UploadDocument(req, metadata=_metadata(user_id, roles))
+    call = stub.DownloadDocument(req, metadata=_metadata(user_id, roles))
+    first = await call.read()
+    if first is grpc.aio.EOF or first.WhichOneof("payload") != "info":
+        call.cancel()
+        raise RuntimeError("DownloadDocument stream did not start with file info")
+    return first.info, call
 
 
 async def get_document_download_url(
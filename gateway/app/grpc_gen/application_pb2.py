@@ -24,53 +24,83 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x61pplication.proto\x12\x12\x63\x61mpus.application\"L\n\x18GetApprovedLeavesRequest\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x10\n\x08\x62uilding\x18\x02 \x01(\t\x12\x10\n\x08\x65ntrance\x18\x03 \x01(\x05\"M\n\x19GetApprovedLeavesResponse\x12\x30\n\x07records\x18\x01 \x03(\x0b\x32\x1f.campus.application.LeaveRecord\"x\n\x0bLeaveRecord\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tuser_name\x18\x02 \x01(\t\x12\x0c\n\x04room\x18\x03 \x01(\t\x12\x12\n\nleave_time\x18\x04 \x01(\t\x12\x13\n\x0breturn_time\x18\x05 \x01(\t\x12\x0e\n\x06reason\x18\x06 \x01(\t\"\x89\x01\n\x17ListApplicationsRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12\x0c\n\x04size\x18\x02 \x01(\x05\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x10\n\x08\x65ntrance\x18\x04 \x01(\x05\x12\x0c\n\x04room\x18\x05 \x01(\t\x12\x11\n\tdate_from\x18\x06 \x01(\t\x12\x0f\n\x07\x64\x61te_to\x18\x07 \x01(\t\"\x84\x01\n\x18ListApplicationsResponse\x12.\n\x05items\x18\x01 \x03(\x0b\x32\x1f.campus.application.Application\x12\r\n\x05total\x18\x02 \x01(\x05\x12\x0c\n\x04page\x18\x03 \x01(\x05\x12\x0c\n\x04size\x18\x04 \x01(\x05\x12\r\n\x05pages\x18\x05 \x01(\x05\"j\n\x18\x43reateApplicationRequest\x12\x12\n\nleave_time\x18\x01 \x01(\t\x12\x13\n\x0breturn_time\x18\x02 \x01(\t\x12\x0e\n\x06reason\x18\x03 \x01(\t\x12\x15\n\rcontact_phone\x18\x04 \x01(\t\"Q\n\x19\x43reateApplicationResponse\x12\x34\n\x0b\x61pplication\x18\x01 \x01(\x0b\x32\x1f.campus.application.Application\"/\n\x15GetApplicationRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\"T\n\x16GetApplicationResponse\x12:\n\x0b\x61pplication\x18\x01 \x01(\x0b\x32%.campus.application.ApplicationDetail\"Y\n\x18\x44\x65\x63ideApplicationRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x15\n\rreject_reason\x18\x03 \x01(\t\"Q\n\x19\x44\x65\x63ideApplicationResponse\x12\x34\n\x0b\x61pplication\x18\x01 \x01(\x0b\x32\x1f.campus.application.Application\"\x84\x01\n\x15UploadDocumentRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x15\n\rdocument_type\x18\x02 \x01(\t\x12\x14\n\x0c\x66ile_content\x18\x03 \x01(\x0c\x12\x14\n\x0c\x63ontent_type\x18\x04 \x01(\t\x12\x10\n\x08\x66ilename\x18\x05 \x01(\t\"H\n\x16UploadDocumentResponse\x12.\n\x08\x64ocument\x18\x01 \x01(\x0b\x32\x1c.campus.application.Document\"L\n\x1dGetDocumentDownloadUrlRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x02 \x01(\t\"-\n\x1eGetDocumentDownloadUrlResponse\x12\x0b\n\x03url\x18\x01 \x01(\t\"D\n\x15\x44\x65leteDocumentRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x02 \x01(\t\"\x18\n\x16\x44\x65leteDocumentResponse\"\xb6\x02\n\x0b\x41pplication\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x10\n\x08is_minor\x18\x03 \x01(\x08\x12\x12\n\nleave_time\x18\x04 \x01(\t\x12\x13\n\x0breturn_time\x18\x05 \x01(\t\x12\x0e\n\x06reason\x18\x06 \x01(\t\x12\x15\n\rcontact_phone\x18\x07 \x01(\t\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x12\n\ndecided_by\x18\t \x01(\t\x12\x12\n\ndecided_at\x18\n \x01(\t\x12\x15\n\rreject_reason\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\t\x12\x12\n\nupdated_at\x18\r \x01(\t\x12\x11\n\tuser_name\x18\x0e \x01(\t\x12\x0c\n\x04room\x18\x0f \x01(\t\x12\x10\n\x08\x65ntrance\x18\x10 \x01(\x05\"\x87\x01\n\x11\x41pplicationDetail\x12-\n\x04\x62\x61se\x18\x01 \x01(\x0b\x32\x1f.campus.application.Application\x12/\n\tdocuments\x18\x02 \x03(\x0b\x32\x1c.campus.application.Document\x12\x12\n\ncan_decide\x18\x03 \x01(\x08\"\x80\x01\n\x08\x44ocument\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\x0e\x61pplication_id\x18\x02 \x01(\t\x12\x15\n\rdocument_type\x18\x03 \x01(\t\x12\x10\n\x08\x66ile_url\x18\x04 \x01(\t\x12\x13\n\x0buploaded_by\x18\x05 \x01(\t\x12\x12\n\ncreated_at\x18\x06 \x01(\t2\x95\x07\n\x12\x41pplicationService\x12p\n\x11GetApprovedLeaves\x12,.campus.application.GetApprovedLeavesRequest\x1a-.campus.application.GetApprovedLeavesResponse\x12m\n\x10ListApplications\x12+.campus.application.ListApplicationsRequest\x1a,.campus.application.ListApplicationsResponse\x12p\n\x11\x43reateApplication\x12,.campus.application.CreateApplicationRequest\x1a-.campus.application.CreateApplicationResponse\x12g\n\x0eGetApplication\x12).campus.application.GetApplicationRequest\x1a*.campus.application.GetApplicationResponse\x12p\n\x11\x44\x65\x63ideApplication\x12,.campus.application.DecideApplicationRequest\x1a-.campus.application.DecideApplicationResponse\x12g\n\x0eUploadDocument\x12).campus.application.UploadDocumentRequest\x1a*.campus.application.UploadDocumentResponse\x12\x7f\n\x16GetDocumentDownloadUrl\x12\x31.campus.application.GetDocumentDownloadUrlRequest\x1a\x32.campus.application.GetDocumentDownloadUrlResponse\x12g\n\x0e\x44\x65leteDocument\x12).campus.application.DeleteDocumentRequest\x1a*.campus.application.DeleteDocumentResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x61pplication.proto\x12\x12\x63\x61mpus.application\"L\n\x18GetApprovedLeavesRequest\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x10\n\x08\x62uilding\x18\x02 \x01(\t\x12\x10\n\x08\x65ntrance\x18\x03 \x01(\x05\"M\n\x19GetApprovedLeavesResponse\x12\x30\n\x07records\x18\x01 \x03(\x0b\x32\x1f.campus.application.LeaveRecord\"K\n\x17GetStudentsOutAtRequest\x12\x0c\n\x04time\x18\x01 \x01(\t\x12\x10\n\x08\x62uilding\x18\x02 \x01(\t\x12\x10\n\x08\x65ntrance\x18\x03 \x01(\x05\"L\n\x18GetStudentsOutAtResponse\x12\x30\n\x07records\x18\x01 \x03(\x0b\x32\x1f.campus.application.LeaveRecord\"x\n\x0bLeaveRecord\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x11\n\tuser_name\x18\x02 \x01(\t\x12\x0c\n\x04room\x18\x03 \x01(\t\x12\x12\n\nleave_time\x18\x04 \x01(\t\x12\x13\n\x0breturn_time\x18\x05 \x01(\t\x12\x0e\n\x06reason\x18\x06 \x01(\t\"\xad\x01\n\x17ListApplicationsRequest\x12\x0c\n\x04page\x18\x01 \x01(\x05\x12\x0c\n\x04size\x18\x02 \x01(\x05\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x10\n\x08\x65ntrance\x18\x04 \x01(\x05\x12\x0c\n\x04room\x18\x05 \x01(\t\x12\x11\n\tdate_from\x18\x06 \x01(\t\x12\x0f\n\x07\x64\x61te_to\x18\x07 \x01(\t\x12\x0e\n\x06\x63ursor\x18\x08 \x01(\t\x12\x12\n\ncount_mode\x18\t \x01(\t\"\x99\x01\n\x18ListApplicationsResponse\x12.\n\x05items\x18\x01 \x03(\x0b\x32\x1f.campus.application.Application\x12\r\n\x05total\x18\x02 \x01(\x05\x12\x0c\n\x04page\x18\x03 \x01(\x05\x12\x0c\n\x04size\x18\x04 \x01(\x05\x12\r\n\x05pages\x18\x05 \x01(\x05\x12\x13\n\x0bnext_cursor\x18\x06 \x01(\t\"j\n\x18\x43reateApplicationRequest\x12\x12\n\nleave_time\x18\x01 \x01(\t\x12\x13\n\x0breturn_time\x18\x02 \x01(\t\x12\x0e\n\x06reason\x18\x03 \x01(\t\x12\x15\n\rcontact_phone\x18\x04 \x01(\t\"Q\n\x19\x43reateApplicationResponse\x12\x34\n\x0b\x61pplication\x18\x01 \x01(\x0b\x32\x1f.campus.application.Application\"/\n\x15GetApplicationRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\"T\n\x16GetApplicationResponse\x12:\n\x0b\x61pplication\x18\x01 \x01(\x0b\x32%.campus.application.ApplicationDetail\"Y\n\x18\x44\x65\x63ideApplicationRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x15\n\rreject_reason\x18\x03 \x01(\t\"Q\n\x19\x44\x65\x63ideApplicationResponse\x12\x34\n\x0b\x61pplication\x18\x01 \x01(\x0b\x32\x1f.campus.application.Application\"[\n\x19\x44\x65\x63ideApplicationsRequest\x12\x17\n\x0f\x61pplication_ids\x18\x01 \x03(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x15\n\rreject_reason\x18\x03 \x01(\t\"Q\n\x1a\x44\x65\x63ideApplicationsResponse\x12\x33\n\x07results\x18\x01 \x03(\x0b\x32\".campus.application.DecisionResult\"r\n\x0e\x44\x65\x63isionResult\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x34\n\x0b\x61pplication\x18\x02 \x01(\x0b\x32\x1f.campus.application.Application\x12\x12\n\nerror_code\x18\x03 \x01(\t\"\x84\x01\n\x15UploadDocumentRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x15\n\rdocument_type\x18\x02 \x01(\t\x12\x14\n\x0c\x66ile_content\x18\x03 \x01(\x0c\x12\x14\n\x0c\x63ontent_type\x18\x04 \x01(\t\x12\x10\n\x08\x66ilename\x18\x05 \x01(\t\"l\n\x13UploadDocumentChunk\x12:\n\x06header\x18\x01 \x01(\x0b\x32(.campus.application.UploadDocumentHeaderH\x00\x12\x0e\n\x04\x64\x61ta\x18\x02 \x01(\x0cH\x00\x42\t\n\x07payload\"m\n\x14UploadDocumentHeader\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x15\n\rdocument_type\x18\x02 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x03 \x01(\t\x12\x10\n\x08\x66ilename\x18\x04 \x01(\t\"H\n\x16UploadDocumentResponse\x12.\n\x08\x64ocument\x18\x01 \x01(\x0b\x32\x1c.campus.application.Document\"\x81\x01\n\x1a\x43reateUploadSessionRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x15\n\rdocument_type\x18\x02 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x03 \x01(\t\x12\x10\n\x08\x66ilename\x18\x04 \x01(\t\x12\x0c\n\x04size\x18\x05 \x01(\x03\"\xe1\x01\n\x1b\x43reateUploadSessionResponse\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\x12K\n\x06\x66ields\x18\x03 \x03(\x0b\x32;.campus.application.CreateUploadSessionResponse.FieldsEntry\x12\x10\n\x08max_size\x18\x04 \x01(\x03\x12\x12\n\nexpires_at\x18\x05 \x01(\t\x1a-\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"l\n\x14\x43onfirmUploadRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x02 \x01(\t\x12\x15\n\rdocument_type\x18\x03 \x01(\t\x12\x10\n\x08\x66ilename\x18\x04 \x01(\t\"L\n\x1dGetDocumentDownloadUrlRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x02 \x01(\t\"-\n\x1eGetDocumentDownloadUrlResponse\x12\x0b\n\x03url\x18\x01 \x01(\t\"l\n\x17\x44ownloadDocumentRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x02 \x01(\t\x12\r\n\x05range\x18\x03 \x01(\t\x12\x15\n\rif_none_match\x18\x04 \x01(\t\"h\n\x15\x44ownloadDocumentChunk\x12\x34\n\x04info\x18\x01 \x01(\x0b\x32$.campus.application.DocumentFileInfoH\x00\x12\x0e\n\x04\x64\x61ta\x18\x02 \x01(\x0cH\x00\x42\t\n\x07payload\"\xc4\x01\n\x10\x44ocumentFileInfo\x12\x10\n\x08\x66ilename\x18\x01 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x02 \x01(\t\x12\x0c\n\x04size\x18\x03 \x01(\x03\x12\x0c\n\x04\x65tag\x18\x04 \x01(\t\x12\x0f\n\x07partial\x18\x05 \x01(\x08\x12\x13\n\x0brange_start\x18\x06 \x01(\x03\x12\x11\n\trange_end\x18\x07 \x01(\x03\x12\x14\n\x0cnot_modified\x18\x08 \x01(\x08\x12\x1d\n\x15range_not_satisfiable\x18\t \x01(\x08\"D\n\x15\x44\x65leteDocumentRequest\x12\x16\n\x0e\x61pplication_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64ocument_id\x18\x02 \x01(\t\"\x18\n\x16\x44\x65leteDocumentResponse\"\xb6\x02\n\x0b\x41pplication\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x10\n\x08is_minor\x18\x03 \x01(\x08\x12\x12\n\nleave_time\x18\x04 \x01(\t\x12\x13\n\x0breturn_time\x18\x05 \x01(\t\x12\x0e\n\x06reason\x18\x06 \x01(\t\x12\x15\n\rcontact_phone\x18\x07 \x01(\t\x12\x0e\n\x06status\x18\x08 \x01(\t\x12\x12\n\ndecided_by\x18\t \x01(\t\x12\x12\n\ndecided_at\x18\n \x01(\t\x12\x15\n\rreject_reason\x18\x0b \x01(\t\x12\x12\n\ncreated_at\x18\x0c \x01(\t\x12\x12\n\nupdated_at\x18\r \x01(\t\x12\x11\n\tuser_name\x18\x0e \x01(\t\x12\x0c\n\x04room\x18\x0f \x01(\t\x12\x10\n\x08\x65ntrance\x18\x10 \x01(\x05\"\x87\x01\n\x11\x41pplicationDetail\x12-\n\x04\x62\x61se\x18\x01 \x01(\x0b\x32\x1f.campus.application.Application\x12/\n\tdocuments\x18\x02 \x03(\x0b\x32\x1c.campus.application.Document\x12\x12\n\ncan_decide\x18\x03 \x01(\x08\"\x80\x01\n\x08\x44ocument\x12\n\n\x02id\x18\x01 \x01(\t\x12\x16\n\x0e\x61pplication_id\x18\x02 \x01(\t\x12\x15\n\rdocument_type\x18\x03 \x01(\t\x12\x10\n\x08\x66ile_url\x18\x04 \x01(\t\x12\x13\n\x0buploaded_by\x18\x05 \x01(\t\x12\x12\n\ncreated_at\x18\x06 \x01(\t2\xb5\x0c\n\x12\x41pplicationService\x12p\n\x11GetApprovedLeaves\x12,.campus.application.GetApprovedLeavesRequest\x1a-.campus.application.GetApprovedLeavesResponse\x12m\n\x10GetStudentsOutAt\x12+.campus.application.GetStudentsOutAtRequest\x1a,.campus.application.GetStudentsOutAtResponse\x12m\n\x10ListApplications\x12+.campus.application.ListApplicationsRequest\x1a,.campus.application.ListApplicationsResponse\x12p\n\x11\x43reateApplication\x12,.campus.application.CreateApplicationRequest\x1a-.campus.application.CreateApplicationResponse\x12g\n\x0eGetApplication\x12).campus.application.GetApplicationRequest\x1a*.campus.application.GetApplicationResponse\x12p\n\x11\x44\x65\x63ideApplication\x12,.campus.application.DecideApplicationRequest\x1a-.campus.application.DecideApplicationResponse\x12s\n\x12\x44\x65\x63ideApplications\x12-.campus.application.DecideApplicationsRequest\x1a..campus.application.DecideApplicationsResponse\x12g\n\x0eUploadDocument\x12).campus.application.UploadDocumentRequest\x1a*.campus.application.UploadDocumentResponse\x12m\n\x14UploadDocumentStream\x12\'.campus.application.UploadDocumentChunk\x1a*.campus.application.UploadDocumentResponse(\x01\x12v\n\x13\x43reateUploadSession\x12..campus.application.CreateUploadSessionRequest\x1a/.campus.application.CreateUploadSessionResponse\x12\x65\n\rConfirmUpload\x12(.campus.application.ConfirmUploadRequest\x1a*.campus.application.UploadDocumentResponse\x12\x7f\n\x16GetDocumentDownloadUrl\x12\x31.campus.application.GetDocumentDownloadUrlRequest\x1a\x32.campus.application.GetDocumentDownloadUrlResponse\x12l\n\x10\x44ownloadDocument\x12+.campus.application.DownloadDocumentRequest\x1a).campus.application.DownloadDocumentChunk0\x01\x12g\n\x0e\x44\x65leteDocument\x12).campus.application.DeleteDocumentRequest\x1a*.campus.application.DeleteDocumentResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'application_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_CREATEUPLOADSESSIONRESPONSE_FIELDSENTRY']._loaded_options = None
+  _globals['_CREATEUPLOADSESSIONRESPONSE_FIELDSENTRY']._serialized_options = b'8\001'
   _globals['_GETAPPROVEDLEAVESREQUEST']._serialized_start=41
   _globals['_GETAPPROVEDLEAVESREQUEST']._serialized_end=117
   _globals['_GETAPPROVEDLEAVESRESPONSE']._serialized_start=119
   _globals['_GETAPPROVEDLEAVESRESPONSE']._serialized_end=196
-  _globals['_LEAVERECORD']._serialized_start=198
-  _globals['_LEAVERECORD']._serialized_end=318
-  _globals['_LISTAPPLICATIONSREQUEST']._serialized_start=321
-  _globals['_LISTAPPLICATIONSREQUEST']._serialized_end=458
-  _globals['_LISTAPPLICATIONSRESPONSE']._serialized_start=461
-  _globals['_LISTAPPLICATIONSRESPONSE']._serialized_end=593
-  _globals['_CREATEAPPLICATIONREQUEST']._serialized_start=595
-  _globals['_CREATEAPPLICATIONREQUEST']._serialized_end=701
-  _globals['_CREATEAPPLICATIONRESPONSE']._serialized_start=703
-  _globals['_CREATEAPPLICATIONRESPONSE']._serialized_end=784
-  _globals['_GETAPPLICATIONREQUEST']._serialized_start=786
-  _globals['_GETAPPLICATIONREQUEST']._serialized_end=833
-  _globals['_GETAPPLICATIONRESPONSE']._serialized_start=835
-  _globals['_GETAPPLICATIONRESPONSE']._serialized_end=919
-  _globals['_DECIDEAPPLICATIONREQUEST']._serialized_start=921
-  _globals['_DECIDEAPPLICATIONREQUEST']._serialized_end=1010
-  _globals['_DECIDEAPPLICATIONRESPONSE']._serialized_start=1012
-  _globals['_DECIDEAPPLICATIONRESPONSE']._serialized_end=1093
-  _globals['_UPLOADDOCUMENTREQUEST']._serialized_start=1096
-  _globals['_UPLOADDOCUMENTREQUEST']._serialized_end=1228
-  _globals['_UPLOADDOCUMENTRESPONSE']._serialized_start=1230
-  _globals['_UPLOADDOCUMENTRESPONSE']._serialized_end=1302
-  _globals['_GETDOCUMENTDOWNLOADURLREQUEST']._serialized_start=1304
-  _globals['_GETDOCUMENTDOWNLOADURLREQUEST']._serialized_end=1380
-  _globals['_GETDOCUMENTDOWNLOADURLRESPONSE']._serialized_start=1382
-  _globals['_GETDOCUMENTDOWNLOADURLRESPONSE']._serialized_end=1427
-  _globals['_DELETEDOCUMENTREQUEST']._serialized_start=1429
-  _globals['_DELETEDOCUMENTREQUEST']._serialized_end=1497
-  _globals['_DELETEDOCUMENTRESPONSE']._serialized_start=1499
-  _globals['_DELETEDOCUMENTRESPONSE']._serialized_end=1523
-  _globals['_APPLICATION']._serialized_start=1526
-  _globals['_APPLICATION']._serialized_end=1836
-  _globals['_APPLICATIONDETAIL']._serialized_start=1839
-  _globals['_APPLICATIONDETAIL']._serialized_end=1974
-  _globals['_DOCUMENT']._serialized_start=1977
-  _globals['_DOCUMENT']._serialized_end=2105
-  _globals['_APPLICATIONSERVICE']._serialized_start=2108
-  _globals['_APPLICATIONSERVICE']._serialized_end=3025
+  _globals['_GETSTUDENTSOUTATREQUEST']._serialized_start=198
+  _globals['_GETSTUDENTSOUTATREQUEST']._serialized_end=273
+  _globals['_GETSTUDENTSOUTATRESPONSE']._serialized_start=275
+  _globals['_GETSTUDENTSOUTATRESPONSE']._serialized_end=351
+  _globals['_LEAVERECORD']._serialized_start=353
+  _globals['_LEAVERECORD']._serialized_end=473
+  _globals['_LISTAPPLICATIONSREQUEST']._serialized_start=476
+  _globals['_LISTAPPLICATIONSREQUEST']._serialized_end=649
+  _globals['_LISTAPPLICATIONSRESPONSE']._serialized_start=652
+  _globals['_LISTAPPLICATIONSRESPONSE']._serialized_end=805
+  _globals['_CREATEAPPLICATIONREQUEST']._serialized_start=807
+  _globals['_CREATEAPPLICATIONREQUEST']._serialized_end=913
+  _globals['_CREATEAPPLICATIONRESPONSE']._serialized_start=915
+  _globals['_CREATEAPPLICATIONRESPONSE']._serialized_end=996
+  _globals['_GETAPPLICATIONREQUEST']._serialized_start=998
+  _globals['_GETAPPLICATIONREQUEST']._serialized_end=1045
+  _globals['_GETAPPLICATIONRESPONSE']._serialized_start=1047
+  _globals['_GETAPPLICATIONRESPONSE']._serialized_end=1131
+  _globals['_DECIDEAPPLICATIONREQUEST']._serialized_start=1133
+  _globals['_DECIDEAPPLICATIONREQUEST']._serialized_end=1222
+  _globals['_DECIDEAPPLICATIONRESPONSE']._serialized_start=1224
+  _globals['_DECIDEAPPLICATIONRESPONSE']._serialized_end=1305
+  _globals['_DECIDEAPPLICATIONSREQUEST']._serialized_start=1307
+  _globals['_DECIDEAPPLICATIONSREQUEST']._serialized_end=1398
+  _globals['_DECIDEAPPLICATIONSRESPONSE']._serialized_start=1400
+  _globals['_DECIDEAPPLICATIONSRESPONSE']._serialized_end=1481
+  _globals['_DECISIONRESULT']._serialized_start=1483
+  _globals['_DECISIONRESULT']._serialized_end=1597
+  _globals['_UPLOADDOCUMENTREQUEST']._serialized_start=1600
+  _globals['_UPLOADDOCUMENTREQUEST']._serialized_end=1732
+  _globals['_UPLOADDOCUMENTCHUNK']._serialized_start=1734
+  _globals['_UPLOADDOCUMENTCHUNK']._serialized_end=1842
+  _globals['_UPLOADDOCUMENTHEADER']._serialized_start=1844
+  _globals['_UPLOADDOCUMENTHEADER']._serialized_end=1953
+  _globals['_UPLOADDOCUMENTRESPONSE']._serialized_start=1955
+  _globals['_UPLOADDOCUMENTRESPONSE']._serialized_end=2027
+  _globals['_CREATEUPLOADSESSIONREQUEST']._serialized_start=2030
+  _globals['_CREATEUPLOADSESSIONREQUEST']._serialized_end=2159
+  _globals['_CREATEUPLOADSESSIONRESPONSE']._serialized_start=2162
+  _globals['_CREATEUPLOADSESSIONRESPONSE']._serialized_end=2387
+  _globals['_CREATEUPLOADSESSIONRESPONSE_FIELDSENTRY']._serialized_start=2342
+  _globals['_CREATEUPLOADSESSIONRESPONSE_FIELDSENTRY']._serialized_end=2387
+  _globals['_CONFIRMUPLOADREQUEST']._serialized_start=2389
+  _globals['_CONFIRMUPLOADREQUEST']._serialized_end=2497
+  _globals['_GETDOCUMENTDOWNLOADURLREQUEST']._serialized_start=2499
+  _globals['_GETDOCUMENTDOWNLOADURLREQUEST']._serialized_end=2575
+  _globals['_GETDOCUMENTDOWNLOADURLRESPONSE']._serialized_start=2577
+  _globals['_GETDOCUMENTDOWNLOADURLRESPONSE']._serialized_end=2622
+  _globals['_DOWNLOADDOCUMENTREQUEST']._serialized_start=2624
+  _globals['_DOWNLOADDOCUMENTREQUEST']._serialized_end=2732
+  _globals['_DOWNLOADDOCUMENTCHUNK']._serialized_start=2734
+  _globals['_DOWNLOADDOCUMENTCHUNK']._serialized_end=2838
+  _globals['_DOCUMENTFILEINFO']._serialized_start=2841
+  _globals['_DOCUMENTFILEINFO']._serialized_end=3037
+  _globals['_DELETEDOCUMENTREQUEST']._serialized_start=3039
+  _globals['_DELETEDOCUMENTREQUEST']._serialized_end=3107
+  _globals['_DELETEDOCUMENTRESPONSE']._serialized_start=3109
+  _globals['_DELETEDOCUMENTRESPONSE']._serialized_end=3133
+  _globals['_APPLICATION']._serialized_start=3136
+  _globals['_APPLICATION']._serialized_end=3446
+  _globals['_APPLICATIONDETAIL']._serialized_start=3449
+  _globals['_APPLICATIONDETAIL']._serialized_end=3584
+  _globals['_DOCUMENT']._serialized_start=3587
+  _globals['_DOCUMENT']._serialized_end=3715
+  _globals['_APPLICATIONSERVICE']._serialized_start=3718
+  _globals['_APPLICATIONSERVICE']._serialized_end=5307
 # @@protoc_insertion_point(module_scope)
@@ -39,6 +39,11 @@ class ApplicationServiceStub(object):
                 request_serializer=application__pb2.GetApprovedLeavesRequest.SerializeToString,
                 response_deserializer=application__pb2.GetApprovedLeavesResponse.FromString,
                 _registered_method=True)
+        self.GetStudentsOutAt = channel.unary_unary(
+                '/campus.application.ApplicationService/GetStudentsOutAt',
+                request_serializer=application__pb2.GetStudentsOutAtRequest.SerializeToString,
+                response_deserializer=application__pb2.GetStudentsOutAtResponse.FromString,
+                _registered_method=True)
         self.ListApplications = channel.unary_unary(
                 '/campus.application.ApplicationService/ListApplications',
                 request_serializer=application__pb2.ListApplicationsRequest.SerializeToString,
@@ -59,16 +64,41 @@ class ApplicationServiceStub(object):
                 request_serializer=application__pb2.DecideApplicationRequest.SerializeToString,
                 response_deserializer=application__pb2.DecideApplicationResponse.FromString,
                 _registered_method=True)
+        self.DecideApplications = channel.unary_unary(
+                '/campus.application.ApplicationService/DecideApplications',
+                request_serializer=application__pb2.DecideApplicationsRequest.SerializeToString,
+                response_deserializer=application__pb2.DecideApplicationsResponse.FromString,
+                _registered_method=True)
         self.UploadDocument = channel.unary_unary(
                 '/campus.application.ApplicationService/UploadDocument',
                 request_serializer=application__pb2.UploadDocumentRequest.SerializeToString,
                 response_deserializer=application__pb2.UploadDocumentResponse.FromString,
                 _registered_method=True)
+        self.UploadDocumentStream = channel.stream_unary(
+                '/campus.application.ApplicationService/UploadDocumentStream',
+                request_serializer=application__pb2.UploadDocumentChunk.SerializeToString,
+                response_deserializer=application__pb2.UploadDocumentResponse.FromString,
+                _registered_method=True)
+        self.CreateUploadSession = channel.unary_unary(
+                '/campus.application.ApplicationService/CreateUploadSession',
+                request_serializer=application__pb2.CreateUploadSessionRequest.SerializeToString,
+                response_deserializer=application__pb2.CreateUploadSessionResponse.FromString,
+                _registered_method=True)
+        self.ConfirmUpload = channel.unary_unary(
+                '/campus.application.ApplicationService/ConfirmUpload',
+                request_serializer=application__pb2.ConfirmUploadRequest.SerializeToString,
+                response_deserializer=application__pb2.UploadDocumentResponse.FromString,
+                _registered_method=True)
         self.GetDocumentDownloadUrl = channel.unary_unary(
                 '/campus.application.ApplicationService/GetDocumentDownloadUrl',
                 request_serializer=application__pb2.GetDocumentDownloadUrlRequest.SerializeToString,
                 response_deserializer=application__pb2.GetDocumentDownloadUrlResponse.FromString,
                 _registered_method=True)
+        self.DownloadDocument = channel.unary_stream(
+                '/campus.application.ApplicationService/DownloadDocument',
+                request_serializer=application__pb2.DownloadDocumentRequest.SerializeToString,
+                response_deserializer=application__pb2.DownloadDocumentChunk.FromString,
+                _registered_method=True)
         self.DeleteDocument = channel.unary_unary(
                 '/campus.application.ApplicationService/DeleteDocument',
                 request_serializer=application__pb2.DeleteDocumentRequest.SerializeToString,
@@ -85,6 +115,12 @@ class ApplicationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetStudentsOutAt(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ListApplications(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -109,18 +145,48 @@ class ApplicationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DecideApplications(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def UploadDocument(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UploadDocumentStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateUploadSession(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ConfirmUpload(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetDocumentDownloadUrl(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def DownloadDocument(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def DeleteDocument(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -135,6 +201,11 @@ def add_ApplicationServiceServicer_to_server(servicer, server):
                     request_deserializer=application__pb2.GetApprovedLeavesRequest.FromString,
                     response_serializer=application__pb2.GetApprovedLeavesResponse.SerializeToString,
             ),
+            'GetStudentsOutAt': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetStudentsOutAt,
+                    request_deserializer=application__pb2.GetStudentsOutAtRequest.FromString,
+                    response_serializer=application__pb2.GetStudentsOutAtResponse.SerializeToString,
+            ),
             'ListApplications': grpc.unary_unary_rpc_method_handler(
                     servicer.ListApplications,
                     request_deserializer=application__pb2.ListApplicationsRequest.FromString,
@@ -155,16 +226,41 @@ def add_ApplicationServiceServicer_to_server(servicer, server):
                     request_deserializer=application__pb2.DecideApplicationRequest.FromString,
                     response_serializer=application__pb2.DecideApplicationResponse.SerializeToString,
             ),
+            'DecideApplications': grpc.unary_unary_rpc_method_handler(
+                    servicer.DecideApplications,
+                    request_deserializer=application__pb2.DecideApplicationsRequest.FromString,
+                    response_serializer=application__pb2.DecideApplicationsResponse.SerializeToString,
+            ),
             'UploadDocument': grpc.unary_unary_rpc_method_handler(
                     servicer.UploadDocument,
                     request_deserializer=application__pb2.UploadDocumentRequest.FromString,
                     response_serializer=application__pb2.UploadDocumentResponse.SerializeToString,
             ),
+            'UploadDocumentStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.UploadDocumentStream,
+                    request_deserializer=application__pb2.UploadDocumentChunk.FromString,
+                    response_serializer=application__pb2.UploadDocumentResponse.SerializeToString,
+            ),
+            'CreateUploadSession': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateUploadSession,
+                    request_deserializer=application__pb2.CreateUploadSessionRequest.FromString,
+                    response_serializer=application__pb2.CreateUploadSessionResponse.SerializeToString,
+            ),
+            'ConfirmUpload': grpc.unary_unary_rpc_method_handler(
+                    servicer.ConfirmUpload,
+                    request_deserializer=application__pb2.ConfirmUploadRequest.FromString,
+                    response_serializer=application__pb2.UploadDocumentResponse.SerializeToString,
+            ),
             'GetDocumentDownloadUrl': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDocumentDownloadUrl,
                     request_deserializer=application__pb2.GetDocumentDownloadUrlRequest.FromString,
                     response_serializer=application__pb2.GetDocumentDownloadUrlResponse.SerializeToString,
             ),
+            'DownloadDocument': grpc.unary_stream_rpc_method_handler(
+                    servicer.DownloadDocument,
+                    request_deserializer=application__pb2.DownloadDocumentRequest.FromString,
+                    response_serializer=application__pb2.DownloadDocumentChunk.SerializeToString,
+            ),
             'DeleteDocument': grpc.unary_unary_rpc_method_handler(
                     servicer.DeleteDocument,
                     request_deserializer=application__pb2.DeleteDocumentRequest.FromString,
@@ -208,6 +304,33 @@ class ApplicationService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetStudentsOutAt(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/campus.application.ApplicationService/GetStudentsOutAt',
+            application__pb2.GetStudentsOutAtRequest.SerializeToString,
+            application__pb2.GetStudentsOutAtResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ListApplications(request,
             target,
@@ -316,6 +439,33 @@ class ApplicationService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def DecideApplications(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/campus.application.ApplicationService/DecideApplications',
+            application__pb2.DecideApplicationsRequest.SerializeToString,
+            application__pb2.DecideApplicationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def UploadDocument(request,
             target,
@@ -343,6 +493,87 @@ class ApplicationService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def UploadDocumentStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/campus.application.ApplicationService/UploadDocumentStream',
+            application__pb2.UploadDocumentChunk.SerializeToString,
+            application__pb2.UploadDocumentResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateUploadSession(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/campus.application.ApplicationService/CreateUploadSession',
+            application__pb2.CreateUploadSessionRequest.SerializeToString,
+            application__pb2.CreateUploadSessionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ConfirmUpload(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/campus.application.ApplicationService/ConfirmUpload',
+            application__pb2.ConfirmUploadRequest.SerializeToString,
+            application__pb2.UploadDocumentResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetDocumentDownloadUrl(request,
             target,
@@ -370,6 +601,33 @@ class ApplicationService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def DownloadDocument(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/campus.application.ApplicationService/DownloadDocument',
+            application__pb2.DownloadDocumentRequest.SerializeToString,
+            application__pb2.DownloadDocumentChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DeleteDocument(request,
             target,
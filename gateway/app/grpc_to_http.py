@@ -6,6 +6,7 @@ import grpc
 from fastapi import HTTPException
 
 from app.schemas import (
+    ApplicationDecisionResult,
     ApplicationDetailResponse,
     ApplicationListResponse,
     ApplicationResponse,
@@ -77,6 +78,14 @@ def proto_detail_to_response(detail_pb) -> ApplicationDetailResponse:
     )
 
 
+def proto_decision_result_to_response(result_pb) -> ApplicationDecisionResult:
+    return ApplicationDecisionResult(
+        application_id=result_pb.application_id,
+        application=proto_application_to_response(result_pb.application) if result_pb.HasField("application") else None,
+        error_code=result_pb.error_code or None,
+    )
+
+
 def grpc_error_to_http(e: grpc.RpcError) -> HTTPException:
     code = e.code()
     detail = e.details() or str(code)
@@ -2,25 +2,34 @@ from datetime import date
 
 import grpc
 from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
 
 from app.auth_stub import get_user_from_authorization
+from app.config import UPLOAD_CHUNK_SIZE_BYTES
 from app.grpc_client import (
+    confirm_upload as grpc_confirm_upload,
     create_application as grpc_create,
+    create_upload_session as grpc_create_upload_session,
     decide_application as grpc_decide,
+    decide_applications as grpc_decide_many,
     delete_document as grpc_delete_document,
     get_application as grpc_get,
     get_channel,
     get_document_download_url as grpc_get_download_url,
     list_applications as grpc_list,
-    upload_document as grpc_upload,
+    open_document_download as grpc_open_download,
+    upload_document_stream as grpc_upload_stream,
 )
 from app.grpc_to_http import (
     grpc_error_to_http,
     proto_application_to_response,
+    proto_decision_result_to_response,
     proto_detail_to_response,
     proto_document_to_response,
 )
 from app.schemas import (
+    ApplicationBatchDecideRequest,
+    ApplicationBatchDecideResponse,
     ApplicationCreateRequest,
     ApplicationDecideRequest,
     ApplicationDetailResponse,
@@ -28,6 +37,9 @@ from app.schemas import (
     ApplicationResponse,
     DocumentDownloadResponse,
     DocumentResponse,
+    UploadConfirmRequest,
+    UploadSessionRequest,
+    UploadSessionResponse,
 )
 
 router = APIRouter(prefix="/applications", tags=["applications"])
@@ -49,6 +61,8 @@ async def list_applications(
     room: str | None = Query(None, min_length=1, max_length=10),
     date_from: date | None = None,
     date_to: date | None = None,
+    cursor: str | None = Query(None, description="next_cursor from the previous page; page is ignored when set"),
+    count_mode: str = Query("exact", pattern="^(exact|window|estimated|has_more)$"),
     user: tuple[str, list[str]] = Depends(require_user),
 ):
     user_id, roles = user
@@ -65,16 +79,19 @@ async def list_applications(
             room=room,
             date_from=date_from.isoformat() if date_from else None,
             date_to=date_to.isoformat() if date_to else None,
+            cursor=cursor,
+            count_mode=count_mode,
         )
     except grpc.RpcError as e:
         raise grpc_error_to_http(e)
     items = [proto_application_to_response(item) for item in resp.items]
     return ApplicationListResponse(
         items=items,
-        total=resp.total,
+        total=resp.total if resp.total >= 0 else None,
         page=resp.page,
         size=resp.size,
         pages=resp.pages,
+        next_cursor=resp.next_cursor or None,
     )
 
 
@@ -100,6 +117,29 @@ async def create_application(
     return proto_application_to_response(resp.application)
 
 
+@router.patch(":batch", response_model=ApplicationBatchDecideResponse, summary="Approve or reject several applications")
+async def decide_applications(
+    body: ApplicationBatchDecideRequest,
+    user: tuple[str, list[str]] = Depends(require_user),
+):
+    user_id, roles = user
+    channel = get_channel()
+    try:
+        resp = await grpc_decide_many(
+            channel,
+            user_id=user_id,
+            roles=roles,
+            application_ids=[str(application_id) for application_id in body.application_ids],
+            status=body.status,
+            reject_reason=body.reject_reason,
+        )
+    except grpc.RpcError as e:
+        raise grpc_error_to_http(e)
+    return ApplicationBatchDecideResponse(
+        results=[proto_decision_result_to_response(result) for result in resp.results],
+    )
+
+
 @router.get("/{application_id}", response_model=ApplicationDetailResponse, summary="Get application by ID")
 async def get_application(
     application_id: str,
@@ -149,20 +189,88 @@ async def upload_document(
     user: tuple[str, list[str]] = Depends(require_user),
 ):
     user_id, roles = user
-    data = await file.read()
     content_type = file.content_type or "application/octet-stream"
     filename = file.filename or "file"
+
+    async def _chunks():
+        # The multipart body is already spooled to disk; forward it piece by piece.
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE_BYTES):
+            yield chunk
+
     channel = get_channel()
     try:
-        resp = await grpc_upload(
+        resp = await grpc_upload_stream(
             channel,
             user_id=user_id,
             roles=roles,
             application_id=application_id,
             document_type=document_type,
-            file_content=data,
             content_type=content_type,
             filename=filename,
+            chunks=_chunks(),
+        )
+    except grpc.RpcError as e:
+        raise grpc_error_to_http(e)
+    return proto_document_to_response(resp.document)
+
+
+@router.post(
+    "/{application_id}/documents/upload-session",
+    response_model=UploadSessionResponse,
+    summary="Get a presigned POST to upload a document straight to storage",
+)
+async def create_upload_session(
+    application_id: str,
+    body: UploadSessionRequest,
+    user: tuple[str, list[str]] = Depends(require_user),
+):
+    user_id, roles = user
+    channel = get_channel()
+    try:
+        resp = await grpc_create_upload_session(
+            channel,
+            user_id=user_id,
+            roles=roles,
+            application_id=application_id,
+            document_type=body.document_type,
+            content_type=body.content_type,
+            filename=body.filename,
+            size=body.size,
+        )
+    except grpc.RpcError as e:
+        raise grpc_error_to_http(e)
+    return UploadSessionResponse(
+        document_id=resp.document_id,
+        url=resp.url,
+        fields=dict(resp.fields),
+        max_size=resp.max_size,
+        expires_at=resp.expires_at,
+    )
+
+
+@router.post(
+    "/{application_id}/documents/{document_id}/confirm",
+    response_model=DocumentResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Record a document uploaded through an upload session",
+)
+async def confirm_upload(
+    application_id: str,
+    document_id: str,
+    body: UploadConfirmRequest,
+    user: tuple[str, list[str]] = Depends(require_user),
+):
+    user_id, roles = user
+    channel = get_channel()
+    try:
+        resp = await grpc_confirm_upload(
+            channel,
+            user_id=user_id,
+            roles=roles,
+            application_id=application_id,
+            document_id=document_id,
+            document_type=body.document_type,
+            filename=body.filename,
         )
     except grpc.RpcError as e:
         raise grpc_error_to_http(e)
@@ -216,3 +324,59 @@ async def delete_document(
         )
     except grpc.RpcError as e:
         raise grpc_error_to_http(e)
+
+
+@router.get(
+    "/{application_id}/documents/{document_id}/file",
+    summary="Stream a document file (supports Range and If-None-Match)",
+    response_class=StreamingResponse,
+)
+async def download_document_file(
+    application_id: str,
+    document_id: str,
+    range_header: str = Header("", alias="Range"),
+    if_none_match: str = Header("", alias="If-None-Match"),
+    user: tuple[str, list[str]] = Depends(require_user),
+):
+    user_id, roles = user
+    channel = get_channel()
+    try:
+        info, call = await grpc_open_download(
+            channel,
+            user_id=user_id,
+            roles=roles,
+            application_id=application_id,
+            document_id=document_id,
+            range_header=range_header,
+            if_none_match=if_none_match,
+        )
+    except grpc.RpcError as e:
+        raise grpc_error_to_http(e)
+
+    headers = {"ETag": info.etag, "Accept-Ranges": "bytes"}
+    if info.not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if info.range_not_satisfiable:
+        headers["Content-Range"] = f"bytes */{info.size}"
+        return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+    headers["Content-Disposition"] = f'attachment; filename="{info.filename}"'
+    if info.partial:
+        headers["Content-Range"] = f"bytes {info.range_start}-{info.range_end}/{info.size}"
+        headers["Content-Length"] = str(info.range_end - info.range_start + 1)
+    else:
+        headers["Content-Length"] = str(info.size)
+
+    async def _body():
+        # Chunks are passed on as they arrive, so playback can start before the end.
+        try:
+            while (message := await call.read()) is not grpc.aio.EOF:
+                yield message.data
+        finally:
+            call.cancel()
+
+    return StreamingResponse(
+        _body(),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if info.partial else status.HTTP_200_OK,
+        media_type=info.content_type,
+        headers=headers,
+    )
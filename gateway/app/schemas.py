@@ -39,6 +39,10 @@ class ApplicationDecideRequest(BaseModel):
     reject_reason: str | None = Field(None, max_length=2000)
 
 
+class ApplicationBatchDecideRequest(ApplicationDecideRequest):
+    application_ids: list[UUID] = Field(..., min_length=1, max_length=200)
+
+
 class DocumentResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -54,6 +58,26 @@ class DocumentDownloadResponse(BaseModel):
     url: str
 
 
+class UploadSessionRequest(BaseModel):
+    document_type: str
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str = "application/octet-stream"
+    size: int = Field(0, ge=0)
+
+
+class UploadSessionResponse(BaseModel):
+    document_id: UUID
+    url: str
+    fields: dict[str, str]
+    max_size: int
+    expires_at: datetime
+
+
+class UploadConfirmRequest(BaseModel):
+    document_type: str
+    filename: str = Field(..., min_length=1, max_length=255)
+
+
 class ApplicationResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -82,7 +106,18 @@ class ApplicationDetailResponse(ApplicationResponse):
 
 class ApplicationListResponse(BaseModel):
     items: list[ApplicationResponse]
-    total: int
+    total: int | None = Field(..., description="None for count_mode=has_more; approximate for count_mode=estimated")
     page: int
     size: int
     pages: int
+    next_cursor: str | None = None
+
+
+class ApplicationDecisionResult(BaseModel):
+    application_id: str
+    application: ApplicationResponse | None = None
+    error_code: str | None = Field(None, description="None when applied; APP_APPLICATION_NOT_FOUND | APP_ALREADY_DECIDED | APP_MINOR_VOICE_REQUIRED")
+
+
+class ApplicationBatchDecideResponse(BaseModel):
+    results: list[ApplicationDecisionResult]